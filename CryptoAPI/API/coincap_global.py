@@ -1,21 +1,19 @@
-import requests
+import os
+import sys
 import json
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cmc_client import CoinMarketCapClient
+from cmc_cache import ResponseCache
+
 local_currency = 'USD'
 local_symbol = '$'
 
-api_key = 'f786a962-2c29-44af-b6b6-515328a96cd9'
-headers = {'X-CMC_PRO_API_KEY': api_key}
-
-base_url = 'https://pro-api.coinmarketcap.com'
-global_url = base_url + '/v1/global-metrics/quotes/latest?convert='+local_currency
-
-request = requests.get(global_url, headers=headers)
-results = request.json()
+client = CoinMarketCapClient(convert=local_currency, cache=ResponseCache())
 
-#print(json.dumps(results, sort_keys=True, indent=4))
+data = client.global_metrics()
 
-data = results['data']
+#print(json.dumps(data, sort_keys=True, indent=4))
 
 btc_dominance = data['btc_dominance']
 eth_dominance = data['eth_dominance']
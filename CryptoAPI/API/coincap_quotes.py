@@ -1,24 +1,22 @@
-import requests
+import os
+import sys
 import json
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cmc_client import CoinMarketCapClient
+from cmc_cache import ResponseCache
+
 local_currency = 'USD'
 local_symbol = '$'
 
-api_key = 'f786a962-2c29-44af-b6b6-515328a96cd9'
-headers = {'X-CMC_PRO_API_KEY': api_key}
-
-base_url = 'https://pro-api.coinmarketcap.com'
+client = CoinMarketCapClient(convert=local_currency, cache=ResponseCache())
 
 symbol = input('Enter the ticker symbol of the cryptocurrency: ')
 
-global_url = base_url + '/v1/cryptocurrency/quotes/latest?convert='+local_currency + '&symbol=' + symbol
-
-request = requests.get(global_url, headers=headers)
-results = request.json()
+data = client.quotes(symbol)
 
-#print(json.dumps(results, sort_keys=True, indent=4))
+#print(json.dumps(data, sort_keys=True, indent=4))
 
-data = results['data']
 currency = data[symbol]
 name = currency['name']
 
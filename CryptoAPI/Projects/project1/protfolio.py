@@ -1,18 +1,16 @@
 import os
+import sys
 import csv
-import json
-import requests
+import asyncio
 from prettytable import PrettyTable
 from colorama import Fore, Back, Style
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from cmc_client import AsyncCoinMarketCapClient
+
 local_currency = 'USD'
 local_symbol = '$'
 
-api_key = 'f786a962-2c29-44af-b6b6-515328a96cd9'
-headers = {'X-CMC_PRO_API_KEY': api_key}
-
-base_url = 'https://pro-api.coinmarketcap.com'
-
 print()
 print('$$$$$$$$$$$$$$$$$   PORTFOLIO  $$$$$$$$$$$$$$$$$')
 print()
@@ -21,67 +19,76 @@ portfolio_value = 0.00
 
 table = PrettyTable(['Asset', 'Amount Owned', 'Value', 'Price', '1h', '24h', '7d'])
 
-with open('my_portfolio.csv', 'r') as csv_file:
+holdings = []
+with open('my_portfolio.csv', 'r', encoding='utf-8-sig') as csv_file:
     csv_reader = csv.reader(csv_file)
     for line in csv_reader:
-        if '\ufeff' in line[0]:
-            line[0] = line[0][1:].upper()
-        else:
-            line[0] = line[0].upper()
-        symbol = line[0]
-        amount = line[1]
+        if line:
+            holdings.append((line[0].strip().upper(), line[1]))
 
-        quote_url = base_url + '/v1/cryptocurrency/quotes/latest?convert=' + local_currency + '&symbol=' + symbol
 
-        request = requests.get(quote_url, headers=headers)
-        results = request.json()
+async def fetch_quotes(symbols):
+    # All symbols in as few batched requests as possible, the batches fetched concurrently.
+    async with AsyncCoinMarketCapClient(convert=local_currency) as client:
+        return await client.latest_quotes(symbols)
 
-        #print(json.dumps(results, sort_keys=True,indent=4))
 
-        currency = results['data'][symbol]
+batch = asyncio.run(fetch_quotes([symbol for symbol, amount in holdings]))
 
-        name = currency['name']
+for symbol, amount in holdings:
+    currency = batch.quotes.get(symbol)
+    if currency is None:
+        continue
 
-        quote = currency['quote'][local_currency]
+    name = currency['name']
 
-        hour_change = round(quote['percent_change_1h'],1)
-        day_change = round(quote['percent_change_24h'],1)
-        week_change = round(quote['percent_change_7d'],1)
+    quote = currency['quote'][local_currency]
 
-        price = quote['price']
+    hour_change = round(quote['percent_change_1h'],1)
+    day_change = round(quote['percent_change_24h'],1)
+    week_change = round(quote['percent_change_7d'],1)
 
-        value = float(price) * float(amount)
+    price = quote['price']
 
-        portfolio_value += value
+    value = float(price) * float(amount)
 
-        if hour_change > 0:
-            hour_change = Back.GREEN + str(hour_change) + '%' + Style.RESET_ALL
-        else:
-            hour_change = Back.RED + str(hour_change) + '%' + Style.RESET_ALL
+    portfolio_value += value
 
-        if day_change > 0:
-            day_change = Back.GREEN + str(day_change) + '%' + Style.RESET_ALL
-        else:
-            day_change = Back.RED + str(day_change) + '%' + Style.RESET_ALL
+    if hour_change > 0:
+        hour_change = Back.GREEN + str(hour_change) + '%' + Style.RESET_ALL
+    else:
+        hour_change = Back.RED + str(hour_change) + '%' + Style.RESET_ALL
 
-        if week_change > 0:
-            week_change = Back.GREEN + str(week_change) + '%' + Style.RESET_ALL
-        else:
-            week_change = Back.RED + str(week_change) + '%' + Style.RESET_ALL
+    if day_change > 0:
+        day_change = Back.GREEN + str(day_change) + '%' + Style.RESET_ALL
+    else:
+        day_change = Back.RED + str(day_change) + '%' + Style.RESET_ALL
 
-        price_string = '{:,}'.format(round(price,2))
-        value_string = '{:,}'.format(round(value,2))
+    if week_change > 0:
+        week_change = Back.GREEN + str(week_change) + '%' + Style.RESET_ALL
+    else:
+        week_change = Back.RED + str(week_change) + '%' + Style.RESET_ALL
 
-        table.add_row([name + '(' + symbol + ')',
-                        amount,
-                        local_symbol + value_string,
-                        local_symbol + price_string,
-                        str(hour_change),
-                        str(day_change),
-                        str(week_change)])
+    price_string = '{:,}'.format(round(price,2))
+    value_string = '{:,}'.format(round(value,2))
+
+    table.add_row([name + '(' + symbol + ')',
+                    amount,
+                    local_symbol + value_string,
+                    local_symbol + price_string,
+                    str(hour_change),
+                    str(day_change),
+                    str(week_change)])
 print(table)
 print()
 
+if batch.missing:
+    print(Back.RED + 'Not found on CoinMarketCap, left out of the total: ' + ', '.join(batch.missing) + Style.RESET_ALL)
+for symbol, candidates in batch.ambiguous.items():
+    print(Back.YELLOW + symbol + ' matches ' + ', '.join(candidates) + '; valued as ' + candidates[0] + Style.RESET_ALL)
+if batch.missing or batch.ambiguous:
+    print()
+
 portfolio_value_string = '{:,}'.format(round(portfolio_value,2))
 print('Total Portfolio Value:' + Back.GREEN + local_symbol + portfolio_value_string + Style.RESET_ALL)
 print()
\ No newline at end of file
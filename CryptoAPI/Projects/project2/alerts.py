@@ -1,57 +1,241 @@
+"""Price alerts for the coins in my_alerts.csv.
+
+Each row is ``SYMBOL,THRESHOLD[,DIRECTION[,HYSTERESIS]]``:
+
+    BTC,95000              alert when BTC rises to 95000 or above
+    ETH,3000,down          alert when ETH falls to 3000 or below
+    SOL,200,up,2.5         alert again only after SOL has dropped 2.5% below 200
+
+DIRECTION is ``up`` (default) or ``down``. HYSTERESIS is how far, in percent,
+the price has to move back past the threshold before the alert re-arms
+(default ``default_hysteresis``).
+
+Every tick fetches all watched symbols in one batched quote poll. The file is
+only re-read when it changes on disk, and alerts that survive a reload keep
+their armed/fired state.
+"""
 import os
-import csv
 import sys
-import json
-import time
-import requests
+import asyncio
+import argparse
 import datetime
-import pyttsx3
+import platform
+import subprocess
+from bisect import bisect_left, bisect_right, insort
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from cmc_client import AsyncCoinMarketCapClient, CoinMarketCapError
 
 local_currency = 'USD'
 local_symbol = '$'
+default_hysteresis = 1.0
 
-api_key = 'f786a962-2c29-44af-b6b6-515328a96cd9'
-headers = {'X-CMC_PRO_API_KEY': api_key}
 
-base_url = 'https://pro-api.coinmarketcap.com'
+class Alert:
+    def __init__(self, symbol, threshold, direction='up', hysteresis=default_hysteresis):
+        if direction not in ('up', 'down'):
+            raise ValueError(f'direction must be up or down, not {direction!r}')
+        self.symbol = symbol
+        self.threshold = threshold
+        self.direction = direction
+        self.hysteresis = hysteresis
 
-print()
-print('$$$$$$$$$$$$$$ ALERTS TRACKING $$$$$$$$$$$$$$')
-print()
+    @property
+    def key(self):
+        return self.symbol, self.threshold, self.direction, self.hysteresis
 
-already_hit_symbols = []
+    @property
+    def rearm_level(self):
+        # Price the market has to get back past before this alert can fire again.
+        if self.direction == 'up':
+            return self.threshold * (1 - self.hysteresis / 100)
+        return self.threshold * (1 + self.hysteresis / 100)
 
-while True:
-    with open('my_alerts.csv','r') as csv_file:
-        csv_reader = csv.reader(csv_file)
-        for line in csv_reader:
-            if '\ufeff' in line[0]:
-                line[0] = line[0][1:].upper()
-            else:
-                line[0] = line[0].upper()
-            symbol = line[0]
-            amount = line[1]
 
-            quote_url = base_url + '/v1/cryptocurrency/quotes/latest?convert=' + local_currency + '&symbol=' + symbol
+def read_alerts(path):
+    alerts = {}
+    with open(path, 'r', encoding='utf-8-sig') as csv_file:
+        for number, line in enumerate(csv_file, 1):
+            fields = [field.strip() for field in line.split(',')]
+            if not fields[0] or fields[0].startswith('#'):
+                continue
+            try:
+                alert = Alert(fields[0].upper(), float(fields[1]),
+                              (fields[2].lower() if len(fields) > 2 and fields[2] else 'up'),
+                              float(fields[3]) if len(fields) > 3 and fields[3] else default_hysteresis)
+            except IndexError:
+                print(f'{path}:{number}: skipping {line.strip()!r} (expected SYMBOL,THRESHOLD)')
+                continue
+            except ValueError as exc:
+                print(f'{path}:{number}: skipping {line.strip()!r} ({exc})')
+                continue
+            alerts[alert.key] = alert
+    return list(alerts.values())
+
+
+class ThresholdIndex:
+    """Alerts for one symbol, sorted so each price update touches only the alerts it fires or re-arms.
+
+    Armed alerts are sorted by threshold and fired ones by re-arm level, so a
+    tick costs two bisections per direction plus the alerts that change state.
+    """
+
+    def __init__(self):
+        self.armed = {'up': [], 'down': []}
+        self.fired = {'up': [], 'down': []}
+
+    def add(self, alert, fired=False):
+        if fired:
+            insort(self.fired[alert.direction], (alert.rearm_level, id(alert), alert))
+        else:
+            insort(self.armed[alert.direction], (alert.threshold, id(alert), alert))
+
+    def update(self, price):
+        """Fire the alerts ``price`` has reached, re-arm the ones it has moved back past; return the fired ones."""
+
+        up, down = self.armed['up'], self.armed['down']
+        split = bisect_right(up, (price, float('inf')))
+        hits = [entry[2] for entry in up[:split]]
+        del up[:split]
+        split = bisect_left(down, (price,))
+        hits += [entry[2] for entry in down[split:]]
+        del down[split:]
+
+        fired_up, fired_down = self.fired['up'], self.fired['down']
+        split = bisect_right(fired_up, (price, float('inf')))
+        rearmed = fired_up[split:]
+        del fired_up[split:]
+        split = bisect_left(fired_down, (price,))
+        rearmed += fired_down[:split]
+        del fired_down[:split]
+        for entry in rearmed:
+            self.add(entry[2])
+
+        for alert in hits:
+            self.add(alert, fired=True)
+        return hits
+
+
+class AlertBook:
+    """Alert file plus one ``ThresholdIndex`` per symbol, rebuilt only when the file changes."""
+
+    def __init__(self, path):
+        self.path = path
+        self.signature = None
+        self.indexes = {}
+        self.count = 0
 
-            request = requests.get(quote_url, headers=headers)
-            results = request.json()
+    def reload(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            # Mid-save or briefly removed: keep watching the alerts already loaded.
+            return False
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self.signature:
+            return False
+        fired = {alert.key for index in self.indexes.values()
+                 for entries in index.fired.values() for _, _, alert in entries}
+        alerts = read_alerts(self.path)
+        indexes = {}
+        for alert in alerts:
+            indexes.setdefault(alert.symbol, ThresholdIndex()).add(alert, fired=alert.key in fired)
+        self.indexes = indexes
+        self.count = len(alerts)
+        self.signature = signature
+        return True
+
+    @property
+    def symbols(self):
+        return list(self.indexes)
+
+    def update(self, quotes):
+        hits = []
+        for symbol, currency in quotes.items():
+            index = self.indexes.get(symbol)
+            if index is not None:
+                price = currency['quote'][local_currency]['price']
+                hits += [(alert, currency['name'], price) for alert in index.update(price)]
+        return hits
+
+
+class ConsoleNotifier:
+    def notify(self, alert, name, price, when):
+        verb = 'rose to' if alert.direction == 'up' else 'fell to'
+        print(f'{name} {verb} {local_symbol}{price:,.2f} (alert at {local_symbol}{alert.threshold:,.2f}) '
+              f'at {when:%I:%M %p}!')
+        sys.stdout.flush()
+
+
+class PowerShellSpeechNotifier:
+    """Windows System.Speech through PowerShell, as the original script did."""
+
+    def say(self, text):
+        text = text.replace("'", "''")
+        subprocess.run(['PowerShell', '-Command', 'Add-Type -AssemblyName System.Speech; '
+                        f"(New-Object System.Speech.Synthesis.SpeechSynthesizer).Speak('{text}')"], check=False)
+
+    def notify(self, alert, name, price, when):
+        self.say('ALERT ALERT ALERT')
+        self.say(f'{name} hit {alert.threshold:g}')
+
+
+class Pyttsx3Notifier:
+    """Offline text-to-speech on any platform with pyttsx3 installed."""
+
+    def __init__(self):
+        import pyttsx3
+        self.engine = pyttsx3.init()
+
+    def notify(self, alert, name, price, when):
+        self.engine.say(f'Alert. {name} hit {alert.threshold:g}')
+        self.engine.runAndWait()
+
+
+NOTIFIERS = {'console': ConsoleNotifier, 'speech': PowerShellSpeechNotifier, 'pyttsx3': Pyttsx3Notifier}
+
+
+async def run(book, notifiers, interval=10.0, once=False):
+    async with AsyncCoinMarketCapClient(convert=local_currency) as client:
+        reported = set()
+        while True:
+            if book.reload():
+                print(f'Watching {book.count} alerts on {len(book.indexes)} symbols')
+                reported = set()
+            try:
+                batch = await client.latest_quotes(book.symbols)
+            except CoinMarketCapError as exc:
+                print(f'Price poll failed: {exc}')
+            else:
+                unknown = set(batch.missing) - reported
+                if unknown:
+                    print('Not found on CoinMarketCap: ' + ', '.join(sorted(unknown)))
+                    reported |= unknown
+                when = datetime.datetime.now()
+                for alert, name, price in book.update(batch.quotes):
+                    for notifier in notifiers:
+                        notifier.notify(alert, name, price, when)
+            if once:
+                return
+            print('...')
+            await asyncio.sleep(interval)
 
-            currency = results['data'][symbol]
 
-            name = currency['name']
-            price = currency['quote'][local_currency]['price']
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Alert when coins in the alert file cross their thresholds')
+    parser.add_argument('--file', default='my_alerts.csv')
+    parser.add_argument('--interval', type=float, default=10.0, help='Seconds between price polls')
+    parser.add_argument('--notify', default='console,speech' if platform.system() == 'Windows' else 'console',
+                        help='Comma-separated notifiers: ' + ', '.join(NOTIFIERS))
+    parser.add_argument('--once', action='store_true', help='Poll a single time and exit')
+    args = parser.parse_args()
 
-            if float(price) >= float(amount) and symbol not in already_hit_symbols:
-                os.system('PowerShell -Command "Add-Type –AssemblyName System.Speech; (New-Object '
-                          'System.Speech.Synthesis.SpeechSynthesizer).Speak(\'ALERT ALERT ALERT\');"')
-                os.system(f'PowerShell -Command "Add-Type –AssemblyName System.Speech; (New-Object '
-                          f'System.Speech.Synthesis.SpeechSynthesizer).Speak(\'{name} hit {amount}\');"')
-                sys.stdout.flush()
+    print()
+    print('$$$$$$$$$$$$$$ ALERTS TRACKING $$$$$$$$$$$$$$')
+    print()
 
-                now = datetime.datetime.now()
-                current_time = now.strftime("%I:%M %p")
-                print(name + ' hit ' + amount + ' at ' + current_time + '!')
-                already_hit_symbols.append(symbol)
-    print('...')
-    time.sleep(10)
\ No newline at end of file
+    notifiers = [NOTIFIERS[name.strip()]() for name in args.notify.split(',') if name.strip()]
+    try:
+        asyncio.run(run(AlertBook(args.file), notifiers, args.interval, args.once))
+    except KeyboardInterrupt:
+        pass
@@ -1,16 +1,18 @@
+import os
+import sys
 import json
-import requests
 from datetime import datetime
 from prettytable import PrettyTable
 from colorama import Fore, Back, Style
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from cmc_client import CoinMarketCapClient
+from cmc_cache import ResponseCache
+
 local_currency = 'USD'
 local_symbol = '$'
 
-api_key = 'f786a962-2c29-44af-b6b6-515328a96cd9'
-headers = {'X-CMC_PRO_API_KEY': api_key}
-
-base_url = 'https://pro-api.coinmarketcap.com'
+client = CoinMarketCapClient(convert=local_currency, cache=ResponseCache())
 
 print()
 print('CoinMarketCap Menu')
@@ -32,14 +34,10 @@ if choice == '3':
 if choice == '0':
     exit(0)
 
-quote_url = base_url + '/v1/cryptocurrency/listings/latest?convert=' + local_currency + '&sort=' + sort
-
-request = requests.get(quote_url, headers=headers)
-results = request.json()
+data = client.listings(sort=sort)
 
-#print(json.dumps(results, sort_keys=True, indent=4))
+#print(json.dumps(data, sort_keys=True, indent=4))
 
-data = results['data']
 table = PrettyTable(['Asset', 'Price', 'Market Cap', 'Volume', '1h', '24h', '7d'])
 
 print()
@@ -1,24 +1,22 @@
+import os
+import sys
 import math
 import json
 import locale
-import requests
 from prettytable import PrettyTable
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from cmc_client import CoinMarketCapClient
+from cmc_cache import ResponseCache
+
 local_currency = 'USD'
 local_symbol = '$'
 
-api_key = 'f786a962-2c29-44af-b6b6-515328a96cd9'
-headers = {'X-CMC_PRO_API_KEY': api_key}
-
-base_url = 'https://pro-api.coinmarketcap.com'
-global_url = base_url + '/v1/global-metrics/quotes/latest?convert=' + local_currency
+client = CoinMarketCapClient(convert=local_currency, cache=ResponseCache())
 
-request = requests.get(global_url, headers=headers)
-results = request.json()
+data = client.global_metrics()
 
-#print(json.dumps(results, sort_keys=True, indent=4))
-
-data = results['data']
+#print(json.dumps(data, sort_keys=True, indent=4))
 
 total_market_cap = int(data['quote'][local_currency]['total_market_cap'])
 total_market_cap_string = '{:,}'.format(total_market_cap)
@@ -27,11 +25,7 @@ table = PrettyTable(
     ['Name', 'Ticker', '% of total global cap', 'Current', '12.5T (Gold)', '80T (Narrow Money)', '109T ('
                                                                                                  'Stock '
                                                                                                  'Market)'])
-listing_url = base_url + '/v1/cryptocurrency/listings/latest?convert=' + local_currency
-request = requests.get(listing_url, headers=headers)
-results = request.json()
-
-data = results['data']
+data = client.listings()
 
 for currency in data:
     name = currency['name']
@@ -1,14 +1,16 @@
-import requests
+import os
+import sys
 import json
 import xlsxwriter
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from cmc_client import CoinMarketCapClient
+from cmc_cache import ResponseCache
+
 local_currency = 'USD'
 local_symbol = '$'
 
-api_key = 'f786a962-2c29-44af-b6b6-515328a96cd9'
-headers = {'X-CMC_PRO_API_KEY': api_key}
-
-base_url = 'https://pro-api.coinmarketcap.com'
+client = CoinMarketCapClient(convert=local_currency, cache=ResponseCache())
 
 crypto_workbook = xlsxwriter.Workbook('Cryptocurrencies.xlsx')
 crypto_sheet = crypto_workbook.add_worksheet()
@@ -26,12 +28,7 @@ start = 1
 row = 1
 
 for i in range(10):
-    listings_url = base_url + '/v1/cryptocurrency/listings/latest?convert=' + local_currency + '&start=' + str(start)
-
-    request = requests.get(listings_url, headers=headers)
-    results = request.json()
-
-    data = results['data']
+    data = client.listings(start=start)
 
     for currency in data:
         name = currency['name']
@@ -0,0 +1,242 @@
+"""On-disk cache for CoinMarketCap responses, shared by every script and process.
+
+    client = CoinMarketCapClient(cache=ResponseCache())
+
+Responses are stored in SQLite, keyed by base URL, endpoint path and sorted
+query params. Each endpoint has a TTL during which the stored payload is
+served as-is, and a stale window after it during which the stored payload is
+still served while a background thread refreshes it. Concurrent callers that
+miss on the same key wait for a single request: threads in this process
+through an in-flight table, other processes through a lease row in the
+database. The file is kept under ``max_bytes`` by evicting the least recently
+used responses.
+
+    python cmc_cache.py             hit/miss counters across runs
+    python cmc_cache.py --clear     start over
+
+Set ``CMC_CACHE_PATH`` to move the database.
+"""
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from urllib.parse import urlencode
+
+DEFAULT_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'cryptoapi', 'cmc_responses.sqlite')
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# (ttl, stale window) in seconds. CMC refreshes listings and quotes every 60 s and global metrics every 5 min.
+DEFAULT_TTLS = {
+    '/v1/global-metrics/quotes/latest': (300, 3600),
+    '/v1/cryptocurrency/listings/latest': (60, 600),
+    '/v1/cryptocurrency/quotes/latest': (60, 300),
+    '/v2/cryptocurrency/quotes/latest': (60, 300),
+}
+
+COUNTERS = ('hits', 'stale_hits', 'misses', 'coalesced', 'revalidations', 'errors', 'evictions')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    body TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_by_access ON responses(accessed_at);
+CREATE TABLE IF NOT EXISTS leases (key TEXT PRIMARY KEY, expires_at REAL NOT NULL);
+CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+"""
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+    def wait(self):
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class ResponseCache:
+    def __init__(self, path=None, ttls=None, max_bytes=DEFAULT_MAX_BYTES, lease=30.0):
+        self.path = path or os.environ.get('CMC_CACHE_PATH') or DEFAULT_PATH
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.max_bytes = max_bytes
+        # How long another process may hold a key before we assume it died and fetch ourselves.
+        self.lease = lease
+        self.lock = threading.Lock()
+        self.inflight = {}
+        self.refreshes = []
+        self.stats = Counter({name: 0 for name in COUNTERS})
+        self.db = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.executescript(SCHEMA)
+
+    @staticmethod
+    def key(base_url, path, params):
+        query = urlencode(sorted((name, str(value)) for name, value in params.items() if value is not None))
+        return f'{base_url.rstrip("/")}{path}?{query}'
+
+    def _count(self, name):
+        with self.lock:
+            self.stats[name] += 1
+            self.db.execute('INSERT INTO counters (name, value) VALUES (?, 1) '
+                            'ON CONFLICT(name) DO UPDATE SET value = value + 1', (name,))
+
+    def _read(self, key):
+        with self.lock:
+            return self.db.execute('SELECT body, fetched_at FROM responses WHERE key = ?', (key,)).fetchone()
+
+    def _touch(self, key):
+        with self.lock:
+            self.db.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (time.time(), key))
+
+    def _store(self, key, path, payload):
+        body = json.dumps(payload)
+        now = time.time()
+        with self.lock:
+            self.db.execute('INSERT OR REPLACE INTO responses (key, path, body, size, fetched_at, accessed_at) '
+                            'VALUES (?, ?, ?, ?, ?, ?)', (key, path, body, len(body), now, now))
+            total = self.db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+            evicted = []
+            if total > self.max_bytes:
+                for old_key, size in self.db.execute('SELECT key, size FROM responses WHERE key != ? '
+                                                     'ORDER BY accessed_at', (key,)).fetchall():
+                    if total <= self.max_bytes:
+                        break
+                    evicted.append((old_key,))
+                    total -= size
+                self.db.executemany('DELETE FROM responses WHERE key = ?', evicted)
+        for _ in evicted:
+            self._count('evictions')
+
+    def _claim(self, key):
+        now = time.time()
+        with self.lock:
+            return self.db.execute('INSERT INTO leases (key, expires_at) VALUES (?, ?) ON CONFLICT(key) '
+                                   'DO UPDATE SET expires_at = excluded.expires_at WHERE leases.expires_at < ?',
+                                   (key, now + self.lease, now)).rowcount == 1
+
+    def _release(self, key):
+        with self.lock:
+            self.db.execute('DELETE FROM leases WHERE key = ?', (key,))
+
+    def _fetch(self, key, path, loader, newer_than):
+        # Only one process fetches a key at a time; the others wait for its write.
+        while True:
+            claimed = self._claim(key)
+            row = self._read(key)
+            if row is not None and row[1] > newer_than:
+                if claimed:
+                    self._release(key)
+                return json.loads(row[0]), True
+            if claimed:
+                break
+            time.sleep(0.05)
+        try:
+            payload = loader()
+            self._store(key, path, payload)
+            return payload, False
+        finally:
+            self._release(key)
+
+    def _load(self, key, path, loader, counter):
+        with self.lock:
+            call = self.inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self.inflight[key] = _Call()
+        if not leader:
+            self._count('coalesced')
+            return call.wait()
+        try:
+            call.result, coalesced = self._fetch(key, path, loader, time.time())
+            self._count('coalesced' if coalesced else counter)
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self.lock:
+                del self.inflight[key]
+            call.done.set()
+
+    def _revalidate(self, key, path, loader):
+        with self.lock:
+            if key in self.inflight:
+                return
+
+        def refresh():
+            try:
+                self._load(key, path, loader, 'revalidations')
+            except Exception:
+                self._count('errors')
+
+        # Not a daemon thread, so a short-lived script still waits for the refresh before exiting.
+        thread = threading.Thread(target=refresh, name=f'cmc-cache-refresh {path}')
+        thread.start()
+        self.refreshes = [item for item in self.refreshes if item.is_alive()] + [thread]
+
+    def fetch(self, base_url, path, params, loader):
+        """The cached payload for this request if it is fresh (or stale but usable), else ``loader()``."""
+
+        ttl, stale = self.ttls[path]
+        key = self.key(base_url, path, params)
+        row = self._read(key)
+        if row is not None:
+            age = time.time() - row[1]
+            if age < ttl + stale:
+                self._touch(key)
+                if age < ttl:
+                    self._count('hits')
+                else:
+                    self._count('stale_hits')
+                    self._revalidate(key, path, loader)
+                return json.loads(row[0])
+        return self._load(key, path, loader, 'misses')
+
+    def totals(self):
+        """Counters summed over every process that has used this cache file."""
+
+        with self.lock:
+            stored = dict(self.db.execute('SELECT name, value FROM counters').fetchall())
+            entries, size = self.db.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses').fetchone()
+        totals = {name: stored.get(name, 0) for name in COUNTERS}
+        return dict(totals, entries=entries, bytes=size)
+
+    def clear(self):
+        with self.lock:
+            self.db.executescript('DELETE FROM responses; DELETE FROM leases; DELETE FROM counters;')
+        self.stats = Counter({name: 0 for name in COUNTERS})
+
+    def close(self):
+        for thread in self.refreshes:
+            thread.join()
+        self.db.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Inspect the shared CoinMarketCap response cache')
+    parser.add_argument('--path', help='Cache database (default $CMC_CACHE_PATH or ' + DEFAULT_PATH + ')')
+    parser.add_argument('--clear', action='store_true', help='Drop every cached response and counter')
+    args = parser.parse_args()
+    cache = ResponseCache(args.path)
+    if args.clear:
+        cache.clear()
+    totals = cache.totals()
+    lookups = totals['hits'] + totals['stale_hits'] + totals['misses'] + totals['coalesced']
+    for name, value in totals.items():
+        print(f'{name:>14}: {value:,}')
+    if lookups:
+        print(f'{"hit ratio":>14}: {(lookups - totals["misses"]) / lookups:.1%}')
+    cache.close()
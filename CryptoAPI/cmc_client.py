@@ -0,0 +1,289 @@
+"""Shared CoinMarketCap client used by every script in this repo.
+
+One pooled keep-alive session per client, request timeouts, retries with
+exponential backoff (honouring ``Retry-After``) and a token-bucket limiter
+sized to the CMC plan's per-minute call limit. ``AsyncCoinMarketCapClient``
+runs the same client from asyncio for concurrent calls. Pass
+``cache=ResponseCache()`` (see ``cmc_cache.py``) to serve repeated calls from
+disk.
+
+Set ``CMC_PRO_API_KEY`` to your API key (or pass ``api_key``) and
+``CMC_BASE_URL`` to point the scripts at another server, e.g. the local
+stand-in in ``cmc_stub_server.py``.
+"""
+import asyncio
+import collections
+import os
+import random
+import re
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_BASE_URL = 'https://pro-api.coinmarketcap.com'
+
+# Basic, Hobbyist and Startup plans allow 30 calls per minute; Standard 60, Professional 90, Enterprise 120.
+DEFAULT_CALLS_PER_MINUTE = 30
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+INVALID_VALUE = re.compile(r'Invalid values? for "(?:symbol|id)": "([^"]*)"')
+
+# quotes/latest costs one credit per 100 coins; the symbol list also has to fit a sane URL.
+QUOTES_PER_REQUEST = 100
+MAX_SYMBOL_CHARS = 1000
+
+
+def symbol_chunks(symbols, per_request=QUOTES_PER_REQUEST, max_chars=MAX_SYMBOL_CHARS):
+    """Split symbols into comma-joined batches bounded by count and by query-string length."""
+
+    chunk, size = [], 0
+    for symbol in symbols:
+        if chunk and (len(chunk) == per_request or size + len(symbol) + 1 > max_chars):
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(symbol)
+        size += len(symbol) + 1
+    if chunk:
+        yield chunk
+
+
+class QuoteBatch:
+    """Quotes keyed by requested symbol, plus the symbols CMC did not know or matched more than once.
+
+    An ambiguous symbol resolves to its best-ranked coin; ``ambiguous`` lists
+    every candidate so callers can report it.
+    """
+
+    def __init__(self):
+        self.quotes = {}
+        self.missing = []
+        self.ambiguous = {}
+
+    def add(self, requested, data):
+        for symbol in requested:
+            matches = data.get(symbol) or []
+            if isinstance(matches, dict):
+                matches = [matches]
+            if not matches:
+                self.missing.append(symbol)
+                continue
+            matches = sorted(matches, key=lambda coin: coin.get('cmc_rank') or float('inf'))
+            if len(matches) > 1:
+                self.ambiguous[symbol] = [f"{coin['name']} (id {coin['id']})" for coin in matches]
+            self.quotes[symbol] = matches[0]
+
+
+def _unique_symbols(symbols):
+    return list(dict.fromkeys(symbol.strip().upper() for symbol in symbols if symbol.strip()))
+
+
+class CoinMarketCapError(Exception):
+    def __init__(self, message, status_code=None, error_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.error_code = error_code
+
+
+class RateLimiter:
+    """Thread-safe sliding-window limiter: at most ``calls`` requests in any ``period`` seconds.
+
+    A request counts from ``acquire`` until ``period`` seconds after its
+    ``release``, i.e. after its response arrived. The server saw the request
+    before that, so the limit also holds by the server's clock.
+    """
+
+    def __init__(self, calls, period=60.0):
+        self.calls = calls
+        self.period = period
+        self.pending = 0
+        self.finished = collections.deque()
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        with self.condition:
+            while True:
+                now = time.monotonic()
+                while self.finished and self.finished[0] <= now - self.period:
+                    self.finished.popleft()
+                if self.pending + len(self.finished) < self.calls:
+                    self.pending += 1
+                    return
+                self.condition.wait(self.finished[0] + self.period - now if self.finished else None)
+
+    def release(self):
+        with self.condition:
+            self.pending -= 1
+            self.finished.append(time.monotonic())
+            self.condition.notify_all()
+
+
+class CoinMarketCapClient:
+    def __init__(self, api_key=None, base_url=None, convert='USD', timeout=(3.05, 15), max_retries=4,
+                 backoff=0.5, calls_per_minute=DEFAULT_CALLS_PER_MINUTE, pool_size=10, cache=None):
+        self.base_url = (base_url or os.environ.get('CMC_BASE_URL') or DEFAULT_BASE_URL).rstrip('/')
+        self.convert = convert
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.limiter = RateLimiter(calls_per_minute, 60.0)
+        self.credits_used = 0
+        self.cache = cache
+        api_key = api_key or os.environ.get('CMC_PRO_API_KEY')
+        if not api_key:
+            raise CoinMarketCapError('No CoinMarketCap API key: set CMC_PRO_API_KEY or pass api_key')
+        self.session = requests.Session()
+        self.session.headers.update({
+            'X-CMC_PRO_API_KEY': api_key,
+            'Accept': 'application/json',
+            'Accept-Encoding': 'deflate, gzip',
+        })
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _delay(self, attempt, response=None):
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        return self.backoff * 2 ** attempt * (0.5 + random.random())
+
+    def get(self, path, **params):
+        """GET ``path`` and return the decoded JSON; ``None`` params are dropped.
+
+        With a cache, endpoints it has a TTL for are answered from it when possible.
+        """
+
+        params = {key: value for key, value in params.items() if value is not None}
+        if self.cache is not None and path in self.cache.ttls:
+            return self.cache.fetch(self.base_url, path, params, lambda: self._request(path, params))
+        return self._request(path, params)
+
+    def _request(self, path, params):
+        url = self.base_url + path
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                if attempt == self.max_retries:
+                    raise CoinMarketCapError(f'{path} failed: {exc}') from exc
+                error = exc
+            else:
+                error = None
+            finally:
+                self.limiter.release()
+            if error is not None:
+                time.sleep(self._delay(attempt))
+                continue
+            if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                time.sleep(self._delay(attempt, response))
+                continue
+            try:
+                payload = response.json()
+            except ValueError as exc:
+                raise CoinMarketCapError(f'{path} returned non-JSON (HTTP {response.status_code})',
+                                         response.status_code) from exc
+            status = payload.get('status') or {}
+            self.credits_used += status.get('credit_count') or 0
+            if response.status_code != 200 or status.get('error_code'):
+                raise CoinMarketCapError(status.get('error_message') or f'HTTP {response.status_code}',
+                                         response.status_code, status.get('error_code'))
+            return payload
+
+    def global_metrics(self, convert=None):
+        return self.get('/v1/global-metrics/quotes/latest', convert=convert or self.convert)['data']
+
+    def listings(self, start=1, limit=None, sort=None, convert=None):
+        return self.get('/v1/cryptocurrency/listings/latest', start=start, limit=limit, sort=sort,
+                        convert=convert or self.convert)['data']
+
+    def quotes(self, symbols=None, ids=None, convert=None):
+        """Latest quotes keyed by symbol (or id) for one or more comma-joined ``symbols``/``ids``."""
+
+        if isinstance(symbols, (list, tuple, set)):
+            symbols = ','.join(symbols)
+        if isinstance(ids, (list, tuple, set)):
+            ids = ','.join(str(item) for item in ids)
+        return self.get('/v1/cryptocurrency/quotes/latest', symbol=symbols, id=ids,
+                        convert=convert or self.convert)['data']
+
+    def quote_chunk(self, symbols, convert=None):
+        """v2 quotes for one batch: every coin sharing a symbol, unknown symbols left out."""
+
+        symbols = list(symbols)
+        while symbols:
+            try:
+                return self.get('/v2/cryptocurrency/quotes/latest', symbol=','.join(symbols), skip_invalid='true',
+                                convert=convert or self.convert)['data']
+            except CoinMarketCapError as exc:
+                # Without skip_invalid one bad symbol fails the whole batch; drop the ones named and retry.
+                match = INVALID_VALUE.search(str(exc)) if exc.status_code == 400 else None
+                invalid = set(match.group(1).upper().split(',')) if match else set()
+                if not invalid & set(symbols):
+                    raise
+                symbols = [symbol for symbol in symbols if symbol not in invalid]
+        return {}
+
+    def latest_quotes(self, symbols, convert=None):
+        """Quotes for any number of symbols in as few requests as the batch limits allow."""
+
+        batch = QuoteBatch()
+        for chunk in symbol_chunks(_unique_symbols(symbols)):
+            batch.add(chunk, self.quote_chunk(chunk, convert))
+        return batch
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class AsyncCoinMarketCapClient:
+    """asyncio front end over one pooled client; at most ``concurrency`` calls are in flight."""
+
+    def __init__(self, concurrency=8, **kwargs):
+        self.client = CoinMarketCapClient(pool_size=concurrency, **kwargs)
+        self.semaphore = asyncio.Semaphore(concurrency)
+
+    async def _call(self, method, *args, **kwargs):
+        async with self.semaphore:
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+    async def get(self, path, **params):
+        return await self._call(self.client.get, path, **params)
+
+    async def global_metrics(self, convert=None):
+        return await self._call(self.client.global_metrics, convert)
+
+    async def listings(self, start=1, limit=None, sort=None, convert=None):
+        return await self._call(self.client.listings, start, limit, sort, convert)
+
+    async def quotes(self, symbols=None, ids=None, convert=None):
+        return await self._call(self.client.quotes, symbols, ids, convert)
+
+    async def latest_quotes(self, symbols, convert=None):
+        """Like ``CoinMarketCapClient.latest_quotes`` with the chunks fetched concurrently."""
+
+        chunks = list(symbol_chunks(_unique_symbols(symbols)))
+        results = await asyncio.gather(*(self._call(self.client.quote_chunk, chunk, convert) for chunk in chunks))
+        batch = QuoteBatch()
+        for chunk, data in zip(chunks, results):
+            batch.add(chunk, data)
+        return batch
+
+    async def close(self):
+        self.client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
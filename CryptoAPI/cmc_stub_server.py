@@ -0,0 +1,195 @@
+"""Local stand-in for the CoinMarketCap endpoints the scripts use.
+
+    python cmc_stub_server.py --port 8800
+    CMC_PRO_API_KEY=local CMC_BASE_URL=http://127.0.0.1:8800 python API/coincap_global.py
+
+Serves deterministic data for a fixed universe of coins whose prices drift
+slowly with time, mirrors CMC's response envelope and credit counting, and
+can inject rate limiting (``--calls-per-minute``), latency (``--latency``) and
+server errors (``--fail-rate``) to exercise the client's retry logic.
+"""
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+KNOWN = [('Bitcoin', 'BTC', 95000.0), ('Ethereum', 'ETH', 3400.0), ('BNB', 'BNB', 680.0),
+         ('Solana', 'SOL', 190.0), ('XRP', 'XRP', 2.3), ('Dogecoin', 'DOGE', 0.35),
+         ('Cardano', 'ADA', 0.95), ('Tron', 'TRX', 0.25), ('Avalanche', 'AVAX', 38.0),
+         ('Chainlink', 'LINK', 22.0),
+         # Symbols are not unique on CMC; v2 quotes return every match.
+         ('Wrapped Solana', 'SOL', 189.0)]
+
+
+def build_universe(size):
+    coins = []
+    for index in range(size):
+        if index < len(KNOWN):
+            name, symbol, price = KNOWN[index]
+        else:
+            name, symbol, price = f'Coin {index + 1}', f'C{index + 1:04d}', 50.0 / (index + 1) ** 0.5
+        supply = 1e9 / (1 + index) ** 0.3
+        coins.append({'id': index + 1, 'name': name, 'symbol': symbol, 'slug': name.lower().replace(' ', '-'),
+                      'cmc_rank': index + 1, 'base_price': price, 'total_supply': supply,
+                      'circulating_supply': supply * 0.9})
+    return coins
+
+
+def quote_for(coin, convert, now):
+    # A slow, deterministic wave per coin, so thresholds are crossed in both directions.
+    drift = 1 + 0.02 * math.sin(now / 30.0 + coin['id'])
+    price = coin['base_price'] * drift
+    market_cap = price * coin['circulating_supply']
+    return {convert: {
+        'price': price,
+        'volume_24h': market_cap * 0.05,
+        'percent_change_1h': 0.5 * math.sin(now / 7.0 + coin['id']),
+        'percent_change_24h': 3 * math.sin(now / 11.0 + coin['id']),
+        'percent_change_7d': 8 * math.sin(now / 13.0 + coin['id']),
+        'market_cap': market_cap,
+        'last_updated': datetime.fromtimestamp(now, timezone.utc).isoformat(),
+    }}
+
+
+def coin_payload(coin, convert, now):
+    fields = {key: value for key, value in coin.items() if key != 'base_price'}
+    return dict(fields, quote=quote_for(coin, convert, now))
+
+
+def make_handler(coins, api_key=None, calls_per_minute=None, latency=0.0, fail_rate=0.0, window=60.0):
+    by_symbol, all_by_symbol = {}, {}
+    for coin in coins:
+        by_symbol.setdefault(coin['symbol'], coin)
+        all_by_symbol.setdefault(coin['symbol'], []).append(coin)
+    by_id = {coin['id']: coin for coin in coins}
+    calls = []
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # Status of every response, in order, for tests to assert on.
+        statuses = []
+
+        def reply(self, code, data=None, error_code=0, error_message=None, credits=1, headers=None):
+            self.statuses.append(code)
+            body = json.dumps({'status': {'timestamp': datetime.now(timezone.utc).isoformat(),
+                                          'error_code': error_code, 'error_message': error_message,
+                                          'elapsed': int(latency * 1000), 'credit_count': credits},
+                               'data': data}).encode('utf-8')
+            self.send_response(code)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            if api_key is not None and self.headers.get('X-CMC_PRO_API_KEY') != api_key:
+                return self.reply(401, error_code=1002, error_message='API key missing.', credits=0)
+            now = time.time()
+            if calls_per_minute is not None:
+                with lock:
+                    while calls and calls[0] < now - window:
+                        calls.pop(0)
+                    limited = len(calls) >= calls_per_minute
+                    if not limited:
+                        calls.append(now)
+                if limited:
+                    return self.reply(429, error_code=1008, credits=0, headers={'Retry-After': '1'},
+                                      error_message="You've exceeded your API Key's HTTP request rate limit.")
+            if latency:
+                time.sleep(latency)
+            if fail_rate and random.random() < fail_rate:
+                return self.reply(500, error_code=500, error_message='Internal error', credits=0)
+            convert = params.get('convert', 'USD')
+            if url.path == '/v1/global-metrics/quotes/latest':
+                total = sum(coin['base_price'] * coin['circulating_supply'] for coin in coins)
+                btc, eth = (coins[0]['base_price'] * coins[0]['circulating_supply'],
+                            coins[1]['base_price'] * coins[1]['circulating_supply'])
+                return self.reply(200, {'btc_dominance': 100 * btc / total, 'eth_dominance': 100 * eth / total,
+                                        'active_cryptocurrencies': len(coins),
+                                        'quote': {convert: {'total_market_cap': total,
+                                                            'total_volume_24h': total * 0.05}}})
+            if url.path == '/v1/cryptocurrency/listings/latest':
+                start, limit = int(params.get('start', 1)), int(params.get('limit', 100))
+                rows = [coin_payload(coin, convert, now) for coin in coins]
+                sort = params.get('sort', 'market_cap')
+                if sort != 'market_cap':
+                    rows.sort(key=lambda row: row['quote'][convert].get(sort) or 0, reverse=True)
+                rows = rows[start - 1:start - 1 + limit]
+                return self.reply(200, rows, credits=max(1, math.ceil(len(rows) / 200)))
+            if url.path == '/v1/cryptocurrency/quotes/latest':
+                if 'id' in params:
+                    keys = [int(item) for item in params['id'].split(',')]
+                    missing = [str(key) for key in keys if key not in by_id]
+                    found = {str(key): by_id[key] for key in keys if key in by_id}
+                    label = 'id'
+                else:
+                    keys = [item.upper() for item in params.get('symbol', '').split(',') if item]
+                    missing = [key for key in keys if key not in by_symbol]
+                    found = {key: by_symbol[key] for key in keys if key in by_symbol}
+                    label = 'symbol'
+                if not keys:
+                    return self.reply(400, error_code=400, credits=0,
+                                      error_message='"value" must contain at least one of [id, symbol]')
+                if missing:
+                    return self.reply(400, error_code=400, credits=0,
+                                      error_message=f'Invalid value for "{label}": "{",".join(missing)}"')
+                data = {key: coin_payload(coin, convert, now) for key, coin in found.items()}
+                return self.reply(200, data, credits=max(1, math.ceil(len(data) / 100)))
+            if url.path == '/v2/cryptocurrency/quotes/latest':
+                keys = [item.upper() for item in params.get('symbol', '').split(',') if item]
+                if not keys:
+                    return self.reply(400, error_code=400, credits=0,
+                                      error_message='"value" must contain at least one of [id, symbol]')
+                missing = [key for key in keys if key not in all_by_symbol]
+                if missing and params.get('skip_invalid', 'true') != 'true':
+                    return self.reply(400, error_code=400, credits=0,
+                                      error_message=f'Invalid value for "symbol": "{",".join(missing)}"')
+                data = {key: [coin_payload(coin, convert, now) for coin in all_by_symbol[key]]
+                        for key in keys if key in all_by_symbol}
+                return self.reply(200, data, credits=max(1, math.ceil(len(keys) / 100)))
+            return self.reply(404, error_code=404, error_message='Not found', credits=0)
+
+        def log_message(self, format, *args):
+            return
+
+    return Handler
+
+
+def serve(host='127.0.0.1', port=8800, size=2000, **options):
+    """Start the stand-in on a background thread and return the server (``port=0`` picks a free port)."""
+
+    handler = make_handler(build_universe(size), **options)
+    server = ThreadingHTTPServer((host, port), handler)
+    server.statuses = handler.statuses
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Local stand-in for the CoinMarketCap API')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8800)
+    parser.add_argument('--coins', type=int, default=2000, help='Size of the coin universe')
+    parser.add_argument('--api-key', help='Reject requests without this X-CMC_PRO_API_KEY')
+    parser.add_argument('--calls-per-minute', type=int, help='Answer 429 above this many calls per minute')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    parser.add_argument('--fail-rate', type=float, default=0.0, help='Share of requests answered with HTTP 500')
+    args = parser.parse_args()
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(
+        build_universe(args.coins), api_key=args.api_key, calls_per_minute=args.calls_per_minute,
+        latency=args.latency, fail_rate=args.fail_rate))
+    print(f'Serving CoinMarketCap stand-in on http://{args.host}:{args.port}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,111 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Projects', 'project2'))
+from alerts import Alert, AlertBook, ThresholdIndex, read_alerts
+
+
+def fire(index, *prices):
+    return [[alert.key for alert in index.update(price)] for price in prices]
+
+
+def index_of(*alerts):
+    index = ThresholdIndex()
+    for alert in alerts:
+        index.add(alert)
+    return index
+
+
+def test_up_alert_fires_on_reaching_the_threshold():
+    up = Alert('BTC', 100.0, 'up', hysteresis=1.0)
+    assert fire(index_of(up), 99.99, 100.0, 105.0) == [[], [up.key], []]
+
+
+def test_down_alert_fires_on_falling_to_the_threshold():
+    down = Alert('BTC', 100.0, 'down', hysteresis=1.0)
+    assert fire(index_of(down), 100.01, 100.0, 95.0) == [[], [down.key], []]
+
+
+def test_up_alert_rearms_only_below_the_band():
+    up = Alert('BTC', 100.0, 'up', hysteresis=1.0)
+    index = index_of(up)
+    # 1% of 100 is 1: prices down to 99 stay inside the band, so there is no second alert.
+    assert fire(index, 100.0, 99.5, 99.0, 100.0) == [[up.key], [], [], []]
+    assert fire(index, 98.99, 100.0) == [[], [up.key]]
+
+
+def test_down_alert_rearms_only_above_the_band():
+    down = Alert('BTC', 100.0, 'down', hysteresis=1.0)
+    index = index_of(down)
+    assert fire(index, 100.0, 100.5, 101.0, 100.0) == [[down.key], [], [], []]
+    assert fire(index, 101.01, 100.0) == [[], [down.key]]
+
+
+def test_zero_hysteresis_refires_after_any_dip():
+    up = Alert('BTC', 100.0, 'up', hysteresis=0.0)
+    assert fire(index_of(up), 100.0, 101.0, 99.999, 100.0) == [[up.key], [], [], [up.key]]
+
+
+def test_only_crossed_alerts_fire():
+    low, high = Alert('ETH', 3000.0, 'up'), Alert('ETH', 3500.0, 'up')
+    below = Alert('ETH', 2500.0, 'down')
+    index = index_of(low, high, below)
+    assert fire(index, 3200.0, 3600.0, 2400.0) == [[low.key], [high.key], [below.key]]
+
+
+def test_invalid_direction_is_rejected():
+    with pytest.raises(ValueError, match='up or down'):
+        Alert('BTC', 1.0, 'sideways')
+
+
+def test_read_alerts_skips_bad_rows(tmp_path, capsys):
+    path = tmp_path / 'alerts.csv'
+    path.write_text('# comment\nbtc,95000\nETH,3000,down\nSOL,200,up,2.5\nDOGE\nADA,cheap\nBTC,95000\n')
+    alerts = read_alerts(str(path))
+    assert [alert.key for alert in alerts] == [('BTC', 95000.0, 'up', 1.0), ('ETH', 3000.0, 'down', 1.0),
+                                               ('SOL', 200.0, 'up', 2.5)]
+    assert capsys.readouterr().out.count('skipping') == 2
+
+
+def quotes(**prices):
+    return {symbol: {'name': symbol.title(), 'quote': {'USD': {'price': price}}} for symbol, price in prices.items()}
+
+
+def rewrite(path, text):
+    # Bump the mtime explicitly: two writes within the filesystem's timestamp resolution look unchanged.
+    stat = os.stat(path)
+    path.write_text(text)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_reload_keeps_state_of_unchanged_alerts(tmp_path):
+    path = tmp_path / 'alerts.csv'
+    path.write_text('BTC,100\nETH,50,down\n')
+    book = AlertBook(str(path))
+    assert book.reload() and book.count == 2
+    assert [hit[0].key for hit in book.update(quotes(BTC=101.0, ETH=60.0))] == [('BTC', 100.0, 'up', 1.0)]
+    assert not book.reload()
+
+    rewrite(path, 'BTC,100\nETH,50,down\nBTC,105\n')
+    assert book.reload() and book.count == 3
+    # BTC,100 stays fired (no repeat at the same price); ETH,50 stays armed; BTC,105 is new and armed.
+    assert [hit[0].key for hit in book.update(quotes(BTC=101.0, ETH=60.0))] == []
+    assert [hit[0].key for hit in book.update(quotes(BTC=106.0, ETH=49.0))] == [('BTC', 105.0, 'up', 1.0),
+                                                                               ('ETH', 50.0, 'down', 1.0)]
+
+
+def test_reload_rearms_edited_alerts_and_survives_a_missing_file(tmp_path):
+    path = tmp_path / 'alerts.csv'
+    path.write_text('BTC,100\n')
+    book = AlertBook(str(path))
+    book.reload()
+    book.update(quotes(BTC=101.0))
+
+    rewrite(path, 'BTC,100,up,0.5\n')
+    assert book.reload()
+    assert [hit[0].key for hit in book.update(quotes(BTC=101.0))] == [('BTC', 100.0, 'up', 0.5)]
+
+    path.unlink()
+    assert not book.reload() and book.symbols == ['BTC']
@@ -0,0 +1,179 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import cmc_cache
+import cmc_stub_server
+from cmc_cache import ResponseCache
+from cmc_client import CoinMarketCapClient
+
+GLOBAL = '/v1/global-metrics/quotes/latest'
+LISTINGS = '/v1/cryptocurrency/listings/latest'
+
+
+@pytest.fixture
+def stub():
+    servers = []
+
+    def start(**options):
+        server = cmc_stub_server.serve(port=0, size=300, **options)
+        servers.append(server)
+        return server, f'http://127.0.0.1:{server.server_address[1]}'
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+class Clock:
+    """Stands in for the ``time`` module inside cmc_cache so TTLs can be crossed without waiting."""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cmc_cache, 'time', clock)
+    return clock
+
+
+def make_cache(tmp_path, **options):
+    options.setdefault('ttls', {GLOBAL: (60, 300)})
+    return ResponseCache(str(tmp_path / 'cache.sqlite'), **options)
+
+
+def make_client(url, cache):
+    return CoinMarketCapClient(api_key='test-key', base_url=url, backoff=0.01, cache=cache)
+
+
+def test_fresh_hit_skips_upstream(stub, tmp_path, clock):
+    server, url = stub()
+    cache = make_cache(tmp_path)
+    client = make_client(url, cache)
+    first = client.global_metrics()
+    clock.now += 59
+    assert client.global_metrics() == first
+    assert server.statuses == [200]
+    assert cache.stats['misses'] == 1 and cache.stats['hits'] == 1
+    cache.close()
+
+
+def test_stale_hit_is_served_and_revalidated_in_the_background(stub, tmp_path, clock):
+    server, url = stub()
+    cache = make_cache(tmp_path)
+    client = make_client(url, cache)
+    first = client.global_metrics()
+    clock.now += 120
+    assert client.global_metrics() == first
+    for thread in cache.refreshes:
+        thread.join()
+    assert server.statuses == [200, 200]
+    assert cache.stats['stale_hits'] == 1 and cache.stats['revalidations'] == 1
+
+    # The refreshed copy is fresh again.
+    clock.now += 30
+    client.global_metrics()
+    assert server.statuses == [200, 200] and cache.stats['hits'] == 1
+    cache.close()
+
+
+def test_expired_entry_misses(stub, tmp_path, clock):
+    server, url = stub()
+    cache = make_cache(tmp_path)
+    client = make_client(url, cache)
+    client.global_metrics()
+    clock.now += 60 + 300
+    client.global_metrics()
+    assert server.statuses == [200, 200]
+    assert cache.stats['misses'] == 2 and cache.stats['stale_hits'] == 0
+    cache.close()
+
+
+def test_concurrent_callers_share_one_upstream_call(stub, tmp_path):
+    server, url = stub(latency=0.3)
+    cache = make_cache(tmp_path)
+    client = make_client(url, cache)
+    barrier = threading.Barrier(8)
+    results = []
+
+    def call():
+        barrier.wait()
+        results.append(client.global_metrics())
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert server.statuses == [200]
+    assert len(results) == 8 and all(result == results[0] for result in results)
+    assert cache.stats['misses'] == 1 and cache.stats['coalesced'] == 7
+    cache.close()
+
+
+def test_separate_processes_share_one_upstream_call_through_the_lease(stub, tmp_path):
+    # Two caches on one file have separate in-flight tables, like two processes.
+    server, url = stub(latency=0.3)
+    caches = [make_cache(tmp_path), make_cache(tmp_path)]
+    results = []
+    threads = [threading.Thread(target=lambda c=cache: results.append(make_client(url, c).global_metrics()))
+               for cache in caches]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert server.statuses == [200]
+    assert results[0] == results[1]
+    assert sorted((cache.stats['misses'], cache.stats['coalesced']) for cache in caches) == [(0, 1), (1, 0)]
+    for cache in caches:
+        cache.close()
+
+
+def test_eviction_keeps_the_file_under_max_bytes(stub, tmp_path, clock):
+    server, url = stub()
+    cache = make_cache(tmp_path, ttls={LISTINGS: (60, 600)})
+    client = make_client(url, cache)
+    client.listings(start=1, limit=20)
+    entry = cache.totals()['bytes']
+    cache.max_bytes = int(entry * 2.5)
+    for start in range(2, 7):
+        clock.now += 1
+        client.listings(start=start, limit=20)
+    totals = cache.totals()
+    assert totals['bytes'] <= cache.max_bytes
+    assert totals['entries'] == 2 and totals['evictions'] == 4
+
+    # The most recently used responses survive.
+    clock.now += 1
+    client.listings(start=6, limit=20)
+    assert cache.stats['hits'] == 1
+    cache.close()
+
+
+def test_counters_persist_across_instances(stub, tmp_path, clock):
+    server, url = stub()
+    cache = make_cache(tmp_path)
+    client = make_client(url, cache)
+    client.global_metrics()
+    client.global_metrics()
+    cache.close()
+
+    reopened = make_cache(tmp_path)
+    totals = reopened.totals()
+    assert totals['misses'] == 1 and totals['hits'] == 1 and totals['entries'] == 1
+    reopened.clear()
+    assert reopened.totals()['entries'] == 0 and reopened.totals()['hits'] == 0
+    reopened.close()
@@ -0,0 +1,139 @@
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import cmc_stub_server
+from cmc_client import (AsyncCoinMarketCapClient, CoinMarketCapClient, CoinMarketCapError, RateLimiter,
+                        symbol_chunks)
+
+
+@pytest.fixture
+def stub():
+    servers = []
+
+    def start(**options):
+        server = cmc_stub_server.serve(port=0, size=300, **options)
+        servers.append(server)
+        return server, f'http://127.0.0.1:{server.server_address[1]}'
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def make_client(url, **options):
+    options.setdefault('backoff', 0.01)
+    return CoinMarketCapClient(api_key='test-key', base_url=url, **options)
+
+
+def test_requires_an_api_key(monkeypatch):
+    monkeypatch.delenv('CMC_PRO_API_KEY', raising=False)
+    with pytest.raises(CoinMarketCapError, match='CMC_PRO_API_KEY'):
+        CoinMarketCapClient(base_url='http://127.0.0.1:1')
+    monkeypatch.setenv('CMC_PRO_API_KEY', 'from-env')
+    assert CoinMarketCapClient(base_url='http://127.0.0.1:1').session.headers['X-CMC_PRO_API_KEY'] == 'from-env'
+
+
+def test_sends_key_and_counts_credits(stub):
+    server, url = stub(api_key='test-key')
+    client = make_client(url)
+    assert len(client.listings(limit=250)) == 250
+    assert client.credits_used == 2
+    with pytest.raises(CoinMarketCapError) as error:
+        CoinMarketCapClient(api_key='wrong', base_url=url, max_retries=0).global_metrics()
+    assert error.value.status_code == 401 and error.value.error_code == 1002
+
+
+def test_retries_server_errors_then_gives_up(stub):
+    server, url = stub(fail_rate=1.0)
+    client = make_client(url, max_retries=2)
+    with pytest.raises(CoinMarketCapError) as error:
+        client.global_metrics()
+    assert error.value.status_code == 500
+    assert server.statuses == [500, 500, 500]
+
+
+def test_client_errors_are_not_retried(stub):
+    server, url = stub()
+    with pytest.raises(CoinMarketCapError, match='Invalid value for "symbol": "NOPE"') as error:
+        make_client(url).quotes(['BTC', 'NOPE'])
+    assert error.value.status_code == 400
+    assert server.statuses == [400]
+
+
+def test_waits_for_retry_after(stub):
+    server, url = stub(calls_per_minute=1, window=1.0)
+    client = make_client(url, max_retries=1)
+    client.global_metrics()
+    start = time.monotonic()
+    client.global_metrics()
+    assert time.monotonic() - start >= 1.0  # the stub answers 429 with Retry-After: 1
+    assert server.statuses == [200, 429, 200]
+
+
+def test_connection_errors_are_retried():
+    client = make_client('http://127.0.0.1:9', max_retries=1, timeout=0.2)
+    with pytest.raises(CoinMarketCapError, match='failed'):
+        client.global_metrics()
+
+
+def test_limiter_holds_the_window():
+    limiter = RateLimiter(3, period=0.3)
+    start = time.monotonic()
+    for _ in range(7):
+        limiter.acquire()
+        limiter.release()
+    # Calls 0-2 go at once, 3-5 after one window and 6 after two.
+    assert 0.6 <= time.monotonic() - start < 1.2
+
+
+def test_limiter_keeps_the_server_under_its_limit(stub):
+    server, url = stub(calls_per_minute=4, window=0.5)
+    client = make_client(url, max_retries=0)
+    client.limiter = RateLimiter(4, period=0.5)
+    for _ in range(10):
+        client.global_metrics()
+    assert server.statuses == [200] * 10
+
+
+def test_batched_quotes_report_missing_and_ambiguous(stub):
+    server, url = stub()
+    symbols = ['btc', 'SOL', 'NOPE'] + [f'C{index:04d}' for index in range(12, 262)]
+    batch = make_client(url).latest_quotes(symbols)
+    assert len(server.statuses) == 3  # 253 symbols in chunks of 100
+    assert batch.missing == ['NOPE']
+    assert batch.ambiguous == {'SOL': ['Solana (id 4)', 'Wrapped Solana (id 11)']}
+    assert batch.quotes['SOL']['id'] == 4 and batch.quotes['BTC']['symbol'] == 'BTC'
+    assert len(batch.quotes) == 252
+
+
+def test_quote_chunk_drops_symbols_a_strict_server_rejects(stub):
+    server, url = stub()
+    client = make_client(url)
+    get = client.get
+    client.get = lambda path, **params: get(path, **dict(params, skip_invalid='false'))
+    assert sorted(client.quote_chunk(['BTC', 'NOPE', 'ETH'])) == ['BTC', 'ETH']
+    assert server.statuses == [400, 200]
+
+
+def test_symbol_chunks_respect_count_and_length():
+    assert list(symbol_chunks(['AAAA'] * 5, per_request=3, max_chars=12)) == [['AAAA'] * 2, ['AAAA'] * 2, ['AAAA']]
+    assert [len(chunk) for chunk in symbol_chunks(['A'] * 250)] == [100, 100, 50]
+
+
+def test_async_client_runs_chunks_concurrently(stub):
+    server, url = stub(latency=0.2)
+
+    async def fetch():
+        async with AsyncCoinMarketCapClient(api_key='test-key', base_url=url, concurrency=4) as client:
+            return await client.latest_quotes([f'C{index:04d}' for index in range(12, 300)])
+
+    start = time.monotonic()
+    batch = asyncio.run(fetch())
+    assert len(batch.quotes) == 288
+    assert time.monotonic() - start < 0.5
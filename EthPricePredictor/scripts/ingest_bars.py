@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+for path in (SRC_DIR, PROJECT_ROOT):
+    if str(path) not in sys.path:
+        sys.path.append(str(path))
+
+from eth_price_predictor.ingest import DEFAULT_FREQUENCIES, aggregate_bars  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Stream a tick/minute CSV into OHLCV bar files")
+    parser.add_argument("source", type=Path, help="Chronologically sorted tick or minute CSV")
+    parser.add_argument("--output-dir", type=Path, default=Path("bars"), help="Where the bar CSVs are written")
+    parser.add_argument(
+        "--frequencies",
+        nargs="+",
+        default=list(DEFAULT_FREQUENCIES),
+        help="Fixed-length bar sizes to build in the same pass",
+    )
+    parser.add_argument("--date-column", default="Date", help="Timestamp column in the source")
+    parser.add_argument("--price-column", default="Price", help="Trade price column when the source has no OHLC")
+    parser.add_argument("--unit", help="Epoch unit of numeric timestamps, e.g. s or ms")
+    parser.add_argument("--chunksize", type=int, default=1_000_000, help="Rows read per chunk")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    outputs = aggregate_bars(
+        args.source,
+        args.output_dir,
+        frequencies=args.frequencies,
+        date_column=args.date_column,
+        price_column=args.price_column,
+        unit=args.unit,
+        chunksize=args.chunksize,
+    )
+    for frequency, path in outputs.items():
+        print(f"{frequency}: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+for path in (SRC_DIR, PROJECT_ROOT):
+    if str(path) not in sys.path:
+        sys.path.append(str(path))
+
+from eth_price_predictor import RunConfig  # noqa: E402
+from eth_price_predictor.model_store import ModelStore, Predictor  # noqa: E402
+from eth_price_predictor.runner import load_panel_series  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Forecast from saved models without refitting")
+    parser.add_argument(
+        "--config",
+        type=Path,
+        default=Path("configs/baseline.yaml"),
+        help="Config whose data (and features) feed the models",
+    )
+    parser.add_argument("--models-dir", type=Path, default=None, help="Saved models; defaults to <output_dir>/models")
+    parser.add_argument("--model", action="append", help="Only forecast with this model name (repeatable)")
+    parser.add_argument(
+        "--watch",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Keep models warm, reloading the data and forecasting every SECONDS",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    cfg = RunConfig.from_file(args.config) if args.config.exists() else RunConfig()
+    store = ModelStore(args.models_dir or cfg.model_store.directory or Path(cfg.output_dir) / "models")
+    if not store.metadata:
+        raise SystemExit(f"No saved models in {store.directory}; run the pipeline with model_store.enabled")
+    predictor = Predictor(store, args.model)
+    while True:
+        for record in predictor.forecast(load_panel_series(cfg)):
+            print(json.dumps(record))
+        sys.stdout.flush()
+        if args.watch is None:
+            return
+        time.sleep(args.watch)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+for path in (SRC_DIR, PROJECT_ROOT):
+    if str(path) not in sys.path:
+        sys.path.append(str(path))
+
+from eth_price_predictor.ledger import ExperimentLedger  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Query results recorded in the experiment ledger")
+    parser.add_argument(
+        "--ledger",
+        type=Path,
+        default=Path("artifacts/ledger.sqlite"),
+        help="Path to the SQLite ledger",
+    )
+    parser.add_argument("--runs", action="store_true", help="List runs instead of results")
+    parser.add_argument("--run-id", help="Only results of this run")
+    parser.add_argument("--model", help="Only results of this model name")
+    parser.add_argument("--horizon", help="Only results of this horizon, e.g. 10d")
+    parser.add_argument("--asset", help="Only results of this panel asset")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if not args.ledger.exists():
+        raise SystemExit(f"No ledger at {args.ledger}")
+    with ExperimentLedger(args.ledger) as ledger:
+        if args.runs:
+            print(ledger.runs().to_string(index=False))
+            return
+        results = ledger.results(run_id=args.run_id, model=args.model, horizon=args.horizon, asset=args.asset)
+        print(results.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
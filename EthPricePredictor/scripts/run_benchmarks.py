@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for the EthPricePredictor hot paths.
+
+Writes machine-readable JSON and, with ``--compare``, flags timings that
+regressed beyond ``--threshold`` relative to a previous run.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import warnings
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+for path in (SRC_DIR, PROJECT_ROOT):
+    if str(path) not in sys.path:
+        sys.path.append(str(path))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from eth_price_predictor.cache import library_versions  # noqa: E402
+from eth_price_predictor.config import ModelConfig  # noqa: E402
+from eth_price_predictor.data import load_price_history, make_windowed_dataset  # noqa: E402
+from eth_price_predictor.metrics import batch_regression_metrics, compute_regression_metrics  # noqa: E402
+from eth_price_predictor.models import available_models, build_model, fit_windows  # noqa: E402
+from eth_price_predictor.models.smoothing import fit_exponential_smoothing  # noqa: E402
+
+DEFAULT_SIZES = (1_000, 100_000, 10_000_000)
+LOOKBACK = 30
+HORIZON = 1
+
+# Small, fixed settings so model timings measure library overhead rather than convergence.
+BENCH_MODEL_PARAMS: Dict[str, Dict[str, Any]] = {
+    "ses": {},
+    "holt": {},
+    "arima": {"order": (1, 1, 1)},
+    "mlp": {"hidden_layer_sizes": (32,), "max_iter": 20},
+    "lstm": {"units": 16, "epochs": 1, "batch_size": 256},
+}
+
+
+def synthetic_series(size: int, seed: int = 0) -> pd.Series:
+    """Geometric random walk on a minute grid, shaped like the real price history."""
+
+    rng = np.random.default_rng(seed)
+    values = 1_000.0 * np.exp(np.cumsum(rng.normal(0.0, 1e-3, size)))
+    index = pd.date_range("2020-01-01", periods=size, freq="min", name="Date")
+    return pd.Series(values, index=index, name="Close")
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    samples = []
+    for _ in range(repeat):
+        start = perf_counter()
+        fn()
+        samples.append(perf_counter() - start)
+    return {
+        "best_sec": min(samples),
+        "mean_sec": statistics.fmean(samples),
+        "median_sec": statistics.median(samples),
+        "repeat": repeat,
+    }
+
+
+def _bench_data(size: int, repeat: int, workdir: Path) -> List[Dict[str, Any]]:
+    series = synthetic_series(size)
+    csv_path = workdir / f"synthetic-{size}.csv"
+    frame = series.to_frame()
+    frame["Volume"] = 1.0
+    frame.to_csv(csv_path)
+    prepared_dir = workdir / "prepared"
+    results = [{"name": "load_price_history", **_time(lambda: load_price_history(csv_path, frequency=None), repeat)}]
+    # Populate the prepared copy first so the timed runs measure the memory-mapped path.
+    load_price_history(csv_path, frequency=None, cache_dir=prepared_dir)
+    results.append(
+        {
+            "name": "load_price_history[prepared]",
+            **_time(lambda: load_price_history(csv_path, frequency=None, cache_dir=prepared_dir), repeat),
+        }
+    )
+    dataset = make_windowed_dataset(series, LOOKBACK, HORIZON)
+    test_size = max(1, len(dataset.targets) // 5)
+    results.append({"name": "make_windowed_dataset", **_time(lambda: make_windowed_dataset(series, LOOKBACK, HORIZON), repeat)})
+    results.append({"name": "WindowedDataset.split", **_time(lambda: dataset.split(test_size), repeat)})
+    y_true = dataset.targets
+    y_pred = y_true * 1.001
+    results.append({"name": "compute_regression_metrics", **_time(lambda: compute_regression_metrics(y_true, y_pred), repeat)})
+    # Eight forecast variants scored in one call, as for a models x origins stack.
+    stack = y_true * np.linspace(0.99, 1.01, 8)[:, None]
+    results.append({"name": "batch_regression_metrics[8]", **_time(lambda: batch_regression_metrics(y_true, stack), repeat)})
+    return results
+
+
+def _bench_models(size: int, repeat: int, model_types: List[str]) -> List[Dict[str, Any]]:
+    series = synthetic_series(size)
+    dataset = make_windowed_dataset(series, LOOKBACK, HORIZON)
+    test_size = max(1, len(dataset.targets) // 5)
+    train_ds, test_ds = dataset.split(test_size)
+    history = series.loc[: train_ds.indices[-1]]
+    results = []
+    for model_type in model_types:
+        config = ModelConfig(name=model_type, type=model_type, params=dict(BENCH_MODEL_PARAMS.get(model_type, {})))
+        try:
+            build_model(config)
+        except ImportError as exc:
+            print(f"Skipping {model_type}: {exc}", file=sys.stderr)
+            continue
+        handle_holder: Dict[str, Any] = {}
+
+        def fit() -> None:
+            handle = build_model(config)
+            if handle.mode == "features":
+                fit_windows(handle.model, train_ds.features, train_ds.targets)
+            else:
+                handle.model.fit_series(history)
+            handle_holder["handle"] = handle
+
+        def predict() -> None:
+            handle = handle_holder["handle"]
+            if handle.mode == "features":
+                handle.model.predict(test_ds.features)
+            else:
+                handle.model.forecast(test_size)
+
+        results.append({"name": f"{model_type}.fit", **_time(fit, repeat)})
+        results.append({"name": f"{model_type}.predict", **_time(predict, repeat)})
+    return results
+
+
+def _bench_startup(repeat: int, model_types: List[str]) -> List[Dict[str, Any]]:
+    """Time fresh interpreters importing the package and building each model type once."""
+
+    prelude = f"import sys; sys.path[:0] = [{str(SRC_DIR)!r}]; "
+    snippets = {"import eth_price_predictor": "import eth_price_predictor"}
+    for model_type in model_types:
+        snippets[f"first_build[{model_type}]"] = (
+            "from eth_price_predictor.config import ModelConfig; "
+            "from eth_price_predictor.models import build_model; "
+            f"build_model(ModelConfig(name={model_type!r}, type={model_type!r}))"
+        )
+    results = []
+    for name, snippet in snippets.items():
+        command = [sys.executable, "-c", prelude + snippet]
+        if subprocess.run(command, capture_output=True).returncode != 0:
+            print(f"Skipping {name}: the snippet failed (missing optional dependency?)", file=sys.stderr)
+            continue
+        results.append(
+            {
+                "name": f"startup:{name}",
+                **_time(lambda: subprocess.run(command, check=True, capture_output=True), repeat),
+            }
+        )
+    return results
+
+
+def _bench_smoothing(n_series: int, length: int, repeat: int) -> List[Dict[str, Any]]:
+    """Fit SES/Holt to a panel of series: one statsmodels fit per series vs one batched NumPy fit."""
+
+    from statsmodels.tsa.holtwinters import Holt, SimpleExpSmoothing
+
+    rng = np.random.default_rng(0)
+    panel = 1_000.0 * np.exp(np.cumsum(rng.normal(0.0, 1e-2, (n_series, length)), axis=1))
+    label = f"{n_series}x{length}"
+    results = []
+    for name, model_cls, trend in (("ses", SimpleExpSmoothing, False), ("holt", Holt, True)):
+
+        def per_series() -> None:
+            for row in panel:
+                model_cls(row, initialization_method="estimated").fit()
+
+        results.append({"name": f"{name}.statsmodels[{label}]", **_time(per_series, repeat)})
+        results.append(
+            {"name": f"{name}.numpy[{label}]", **_time(lambda: fit_exponential_smoothing(panel, trend=trend), repeat)}
+        )
+    return results
+
+
+def run_suite(
+    sizes: List[int],
+    repeat: int,
+    model_max_size: int,
+    model_types: List[str],
+    smoothing_series: int = 200,
+) -> Dict[str, Any]:
+    print("Benchmarking startup", file=sys.stderr)
+    # Startup entries use size 0 so --compare can key them like the others.
+    results = [{"size": 0, **entry} for entry in _bench_startup(repeat, model_types)]
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        for size in sizes:
+            print(f"Benchmarking size={size:,}", file=sys.stderr)
+            for entry in _bench_data(size, repeat, workdir):
+                results.append({"size": size, **entry})
+            if size <= model_max_size:
+                for entry in _bench_models(size, repeat, model_types):
+                    results.append({"size": size, **entry})
+        if smoothing_series > 0:
+            print(f"Benchmarking batched smoothing over {smoothing_series} series", file=sys.stderr)
+            # Size is the total number of observations in the panel.
+            length = 500
+            for entry in _bench_smoothing(smoothing_series, length, repeat):
+                results.append({"size": smoothing_series * length, **entry})
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "versions": library_versions(),
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """Return entries whose best time grew by more than ``threshold`` (e.g. 0.1 = 10%)."""
+
+    previous = {(entry["name"], entry["size"]): entry for entry in baseline.get("results", [])}
+    regressions = []
+    for entry in current["results"]:
+        before = previous.get((entry["name"], entry["size"]))
+        if before is None or before["best_sec"] <= 0:
+            continue
+        ratio = entry["best_sec"] / before["best_sec"]
+        if ratio > 1.0 + threshold:
+            regressions.append(
+                {
+                    "name": entry["name"],
+                    "size": entry["size"],
+                    "baseline_sec": before["best_sec"],
+                    "current_sec": entry["best_sec"],
+                    "ratio": ratio,
+                }
+            )
+    return regressions
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the EthPricePredictor pipeline")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="Synthetic series lengths to benchmark",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed repetitions per benchmark")
+    parser.add_argument(
+        "--model-max-size",
+        type=int,
+        default=100_000,
+        help="Largest size at which model fit/predict is benchmarked",
+    )
+    parser.add_argument(
+        "--models",
+        nargs="+",
+        default=available_models(),
+        help="Model types to benchmark",
+    )
+    parser.add_argument(
+        "--smoothing-series",
+        type=int,
+        default=200,
+        help="Series in the batched SES/Holt benchmark (0 to skip)",
+    )
+    parser.add_argument("--output", type=Path, default=Path("artifacts/benchmarks.json"), help="Where to write results")
+    parser.add_argument("--compare", type=Path, help="Previous benchmarks.json to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative slowdown (0.10 = 10%%) above which a benchmark counts as a regression",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    warnings.simplefilter("ignore")
+    report = run_suite(args.sizes, args.repeat, args.model_max_size, args.models, args.smoothing_series)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    for entry in report["results"]:
+        print(f"{entry['name']:<36} size={entry['size']:>11,}  best={entry['best_sec'] * 1e3:10.3f} ms")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(report, baseline, args.threshold)
+        for item in regressions:
+            print(
+                f"REGRESSION {item['name']} size={item['size']:,}: "
+                f"{item['baseline_sec'] * 1e3:.3f} ms -> {item['current_sec'] * 1e3:.3f} ms (x{item['ratio']:.2f})"
+            )
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,9 @@ for path in (SRC_DIR, PROJECT_ROOT):
     if str(path) not in sys.path:
         sys.path.append(str(path))
 
-from eth_price_predictor import RunConfig, run_experiments  # noqa: E402
+from eth_price_predictor import RunConfig, run_experiments, run_search  # noqa: E402
+from eth_price_predictor.ledger import ResumeError  # noqa: E402
+from eth_price_predictor.profiling import load_trace, summarize_trace  # noqa: E402
 
 
 def parse_args() -> argparse.Namespace:
@@ -28,16 +30,113 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Print the resolved configuration before running",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of parallel (horizon, model) workers; overrides the config",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=("serial", "thread", "process"),
+        default=None,
+        help="Executor backend; defaults to 'process' when --workers > 1",
+    )
+    parser.add_argument(
+        "--search",
+        action="store_true",
+        help="Run the config's hyperparameter search instead of the experiment grid",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Neither read nor write the fitted-model cache",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached results, refit everything and overwrite the cache",
+    )
+    parser.add_argument(
+        "--resume",
+        nargs="?",
+        const="latest",
+        default=None,
+        metavar="RUN_ID",
+        help="Continue a ledger run (the latest unfinished one by default), skipping its completed cells",
+    )
+    parser.add_argument(
+        "--no-ledger",
+        action="store_true",
+        help="Do not record this run in the experiment ledger",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record per-stage wall/CPU time and peak memory to trace.json next to metrics.csv",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        choices=("rss", "tracemalloc", "none"),
+        default=None,
+        help="Peak-memory source for --profile (tracemalloc is precise but slower)",
+    )
+    parser.add_argument(
+        "--profile-tasks",
+        choices=("cprofile", "pyinstrument"),
+        default=None,
+        help="Also capture a cProfile/pyinstrument profile per task under profiles/",
+    )
+    parser.add_argument(
+        "--trace-summary",
+        type=Path,
+        nargs="?",
+        const=True,
+        default=None,
+        help="Profile the run and print a per-stage summary of its trace.json (or summarise the given trace file)",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
     cfg = RunConfig.from_file(args.config) if args.config.exists() else RunConfig()
+    if args.workers is not None:
+        cfg.execution.workers = max(1, args.workers)
+        if args.backend is None and cfg.execution.workers > 1 and cfg.execution.backend == "serial":
+            cfg.execution.backend = "process"
+    if args.backend is not None:
+        cfg.execution.backend = args.backend
+    if args.no_cache:
+        cfg.cache.enabled = False
+    if args.refresh:
+        cfg.cache.refresh = True
+    if args.resume is not None:
+        cfg.ledger.resume = args.resume
+    if args.no_ledger:
+        cfg.ledger.enabled = False
+    # A bare --trace-summary profiles this run so it never reports a trace left by an earlier one.
+    if args.profile or args.profile_memory or args.profile_tasks or args.trace_summary is True:
+        cfg.profiling.enabled = True
+    if args.profile_memory is not None:
+        cfg.profiling.memory = None if args.profile_memory == "none" else args.profile_memory
+    if args.profile_tasks is not None:
+        cfg.profiling.profiler = args.profile_tasks
+    if isinstance(args.trace_summary, Path):
+        print(summarize_trace(load_trace(args.trace_summary)).to_string())
+        return
     if args.print_config:
         print(json.dumps(cfg.to_dict(), indent=2))
-    results = run_experiments(cfg)
+    if args.search:
+        results = run_search(cfg)
+    else:
+        try:
+            results = run_experiments(cfg)
+        except ResumeError as exc:
+            raise SystemExit(f"Cannot resume: {exc}") from None
     print(results)
+    if args.trace_summary and not args.search:
+        print(summarize_trace(load_trace(Path(cfg.output_dir) / "trace.json")).to_string())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+for path in (SRC_DIR, PROJECT_ROOT):
+    if str(path) not in sys.path:
+        sys.path.append(str(path))
+
+from eth_price_predictor import RunConfig  # noqa: E402
+from eth_price_predictor.streaming import (  # noqa: E402
+    StreamingForecaster,
+    iter_file_tail,
+    run_stream,
+    serve_http,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve ETH forecasts for a live stream of bars")
+    parser.add_argument(
+        "--config",
+        type=Path,
+        default=Path("configs/baseline.yaml"),
+        help="Path to the YAML configuration file (history, horizons, models)",
+    )
+    parser.add_argument(
+        "--source",
+        choices=("stdin", "tail", "http"),
+        default="stdin",
+        help="Where new bars arrive from",
+    )
+    parser.add_argument("--path", type=Path, help="File to follow when --source tail")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address for --source http")
+    parser.add_argument("--port", type=int, default=8765, help="Port for --source http")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    cfg = RunConfig.from_file(args.config) if args.config.exists() else RunConfig()
+    try:
+        forecaster = StreamingForecaster(cfg)
+    except ValueError as exc:
+        raise SystemExit(f"Cannot stream: {exc}") from None
+    print("Forecaster ready", file=sys.stderr)
+    try:
+        if args.source == "http":
+            server = serve_http(forecaster, args.host, args.port)
+            print(f"Listening on http://{args.host}:{args.port} (POST /bar, GET /forecast, GET /stats)", file=sys.stderr)
+            server.serve_forever()
+        elif args.source == "tail":
+            if args.path is None:
+                raise SystemExit("--path is required with --source tail")
+            run_stream(forecaster, iter_file_tail(args.path))
+        else:
+            run_stream(forecaster, sys.stdin)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(forecaster.latency.summary(), indent=2), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,12 @@
 """Top-level package for the EthPricePredictor project."""
 from .config import HorizonConfig, ModelConfig, RunConfig
 from .runner import run_experiments
+from .search import run_search
 
 __all__ = [
     "HorizonConfig",
     "ModelConfig",
     "RunConfig",
     "run_experiments",
+    "run_search",
 ]
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from .models.classical import SeriesForecaster
+
+
+def walk_forward_forecast(
+    model: SeriesForecaster,
+    series: pd.Series,
+    target_index: pd.DatetimeIndex,
+    steps_ahead: int,
+    refit_every: int | None = None,
+) -> np.ndarray:
+    """Forecast each target from a rolling origin ``steps_ahead`` observations earlier.
+
+    The model is fit once on the data up to the first origin. Each later origin
+    feeds only the newly observed values through ``model.update``; parameters
+    are re-estimated (warm-started where supported) every ``refit_every`` origins.
+    """
+
+    if steps_ahead <= 0:
+        raise ValueError("steps_ahead must be positive")
+    if refit_every is not None and refit_every <= 0:
+        raise ValueError("refit_every must be positive")
+
+    positions = series.index.get_indexer(target_index)
+    if (positions < 0).any():
+        raise ValueError("target_index contains timestamps missing from the series")
+    origins = positions - steps_ahead
+    if origins[0] < 0:
+        raise ValueError("Not enough history before the first forecast origin")
+    if (np.diff(origins) <= 0).any():
+        raise ValueError("target_index must be strictly increasing")
+
+    predictions = np.empty(len(origins), dtype=float)
+    model.fit_series(series.iloc[: origins[0] + 1])
+    predictions[0] = model.forecast(steps_ahead)[-1]
+    for step in range(1, len(origins)):
+        origin = origins[step]
+        if refit_every is not None and step % refit_every == 0:
+            model.refit(series.iloc[: origin + 1])
+        else:
+            model.update(series.iloc[origins[step - 1] + 1 : origin + 1])
+        predictions[step] = model.forecast(steps_ahead)[-1]
+    return predictions
+
+
+__all__ = ["walk_forward_forecast"]
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import platform
+import tempfile
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, List, Mapping
+
+import numpy as np
+import pandas as pd
+
+# Bumped whenever the pickled CacheEntry layout changes.
+_CACHE_FORMAT = 3
+
+_VERSIONED_DISTRIBUTIONS = (
+    "eth-price-predictor",
+    "numpy",
+    "pandas",
+    "scikit-learn",
+    "statsmodels",
+    "tensorflow",
+)
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """Everything a cached (horizon, model) cell needs to skip its fit."""
+
+    records: List[Dict[str, Any]]
+    predictions: Dict[Any, np.ndarray]
+    model: Any = None
+
+
+@lru_cache(maxsize=1)
+def library_versions() -> Dict[str, str]:
+    """Installed versions of the libraries that influence fitted results (without importing them)."""
+
+    versions = {"python": platform.python_version()}
+    for name in _VERSIONED_DISTRIBUTIONS:
+        try:
+            versions[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            versions[name] = "missing"
+    return versions
+
+
+@lru_cache(maxsize=1)
+def source_digest() -> str:
+    """Digest of this package's ``.py`` sources.
+
+    A source checkout is not an installed distribution, so its version cannot
+    tell two revisions apart; hashing the code makes any behaviour change miss
+    the cache without anyone having to remember to bump a constant.
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+    package = Path(__file__).resolve().parent
+    for path in sorted(package.rglob("*.py")):
+        digest.update(path.relative_to(package).as_posix().encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def hash_series(series: pd.Series | pd.DataFrame) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    index = series.index
+    if isinstance(index, pd.DatetimeIndex):
+        digest.update(np.ascontiguousarray(index.asi8).tobytes())
+    else:
+        digest.update(np.asarray(index).astype(str).tobytes())
+    digest.update(np.ascontiguousarray(series.to_numpy(dtype=float)).tobytes())
+    return digest.hexdigest()
+
+
+def make_cache_key(data_hash: str, payload: Mapping[str, Any]) -> str:
+    """Content address of a task: data hash + JSON-normalised configuration + code and library versions."""
+
+    document = {
+        "format": _CACHE_FORMAT,
+        "data": data_hash,
+        "config": payload,
+        "code": source_digest(),
+        "versions": library_versions(),
+    }
+    encoded = json.dumps(document, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=20).hexdigest()
+
+
+class ResultCache:
+    """Directory of pickled :class:`CacheEntry` files with size-bounded LRU eviction.
+
+    Writes go through a temporary file and ``os.replace`` so concurrent workers
+    never observe partial entries. Reads bump the file mtime, which eviction
+    uses as the recency signal.
+    """
+
+    suffix = ".pkl"
+
+    def __init__(self, directory: Path, max_bytes: int | None = None, refresh: bool = False) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.refresh = refresh
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}{self.suffix}"
+
+    def get(self, key: str) -> CacheEntry | None:
+        path = self._path(key)
+        if self.refresh or not path.exists():
+            return None
+        try:
+            with path.open("rb") as handle:
+                entry = pickle.load(handle)
+        except Exception:
+            # Corrupt or incompatible entry: treat as a miss and let put() overwrite it.
+            return None
+        os.utime(path)
+        return entry
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            payload = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # Some fitted models (e.g. Keras graphs) are not picklable; keep the results.
+            payload = pickle.dumps(
+                CacheEntry(records=entry.records, predictions=entry.predictions),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def evict(self) -> int:
+        """Delete least-recently-used entries until the cache fits in ``max_bytes``."""
+
+        if self.max_bytes is None or not self.directory.exists():
+            return 0
+        entries = []
+        for path in self.directory.glob(f"*/*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+
+__all__ = [
+    "CacheEntry",
+    "ResultCache",
+    "hash_series",
+    "library_versions",
+    "make_cache_key",
+    "source_digest",
+]
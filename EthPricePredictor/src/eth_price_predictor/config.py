@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping
 
@@ -55,6 +55,282 @@ class ModelConfig:
         )
 
 
+# Default trailing window per feature kind.
+FEATURE_WINDOWS = {"returns": 1, "log_returns": 1, "volatility": 20, "volume_zscore": 20, "range": 1}
+
+
+@dataclass(slots=True)
+class FeatureConfig:
+    """An engineered input column fed to feature-mode models next to the lagged target.
+
+    ``kind`` is ``returns``/``log_returns`` (target change over ``window``
+    bars), ``volatility`` (std of one-bar log returns), ``volume_zscore``
+    (volume against its trailing mean/std) or ``range`` ((High - Low) / Close,
+    averaged over ``window``). ``column`` overrides the source column where one
+    applies (the target for returns/volatility, ``Volume`` for the z-score).
+    """
+
+    kind: str
+    window: int | None = None
+    column: str | None = None
+
+    @property
+    def span(self) -> int:
+        return self.window or FEATURE_WINDOWS[self.kind]
+
+    @property
+    def name(self) -> str:
+        return f"{self.kind}_{self.span}" + (f"_{self.column}" if self.column else "")
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any] | str) -> "FeatureConfig":
+        if isinstance(raw, str):
+            raw = {"kind": raw}
+        kind = str(raw["kind"]).lower()
+        if kind not in FEATURE_WINDOWS:
+            raise ValueError(f"Unsupported feature kind: {kind}")
+        window = int(raw.get("window", FEATURE_WINDOWS[kind]))
+        if window < 1:
+            raise ValueError("Feature window must be positive")
+        column = raw.get("column")
+        return cls(kind=kind, window=window, column=str(column) if column else None)
+
+
+@dataclass(slots=True)
+class ExecutionConfig:
+    """Controls how (horizon, model) tasks are scheduled across workers."""
+
+    backend: str = "serial"
+    workers: int = 1
+    threads_per_worker: int | None = None
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any]) -> "ExecutionConfig":
+        backend = str(raw.get("backend", "serial")).lower()
+        if backend not in {"serial", "thread", "process"}:
+            raise ValueError(f"Unsupported execution backend: {backend}")
+        threads = raw.get("threads_per_worker")
+        return cls(
+            backend=backend,
+            workers=max(1, int(raw.get("workers", 1))),
+            threads_per_worker=int(threads) if threads is not None else None,
+        )
+
+
+@dataclass(slots=True)
+class BacktestConfig:
+    """Chooses how series models are evaluated over the test window.
+
+    In ``single_origin`` mode, ``series_fits`` controls how one series model is
+    shared across horizons: ``independent`` fits each horizon from scratch,
+    ``warm_start`` re-estimates on each longer history (starting from the
+    previous parameters for ARIMA; SES and Holt refit from scratch), and
+    ``shared_prefix`` fits once on the shortest history and only extends the
+    filtered state with the extra observations.
+    """
+
+    mode: str = "single_origin"
+    refit_every: int | None = None
+    series_fits: str = "warm_start"
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any]) -> "BacktestConfig":
+        mode = str(raw.get("mode", "single_origin")).lower()
+        if mode not in {"single_origin", "walk_forward"}:
+            raise ValueError(f"Unsupported backtest mode: {mode}")
+        series_fits = str(raw.get("series_fits", "warm_start")).lower()
+        if series_fits not in {"independent", "warm_start", "shared_prefix"}:
+            raise ValueError(f"Unsupported series_fits strategy: {series_fits}")
+        refit_every = raw.get("refit_every")
+        return cls(
+            mode=mode,
+            refit_every=int(refit_every) if refit_every is not None else None,
+            series_fits=series_fits,
+        )
+
+
+@dataclass(slots=True)
+class CacheConfig:
+    """On-disk cache of fitted models, predictions and metrics per grid cell."""
+
+    enabled: bool = True
+    directory: Path | None = None
+    max_size_mb: float | None = 1024.0
+    refresh: bool = False
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any]) -> "CacheConfig":
+        directory = raw.get("directory")
+        max_size_mb = raw.get("max_size_mb", 1024.0)
+        return cls(
+            enabled=bool(raw.get("enabled", True)),
+            directory=Path(directory) if directory else None,
+            max_size_mb=float(max_size_mb) if max_size_mb is not None else None,
+            refresh=bool(raw.get("refresh", False)),
+        )
+
+
+@dataclass(slots=True)
+class LedgerConfig:
+    """Append-only SQLite store of every run's per-cell results.
+
+    ``path`` defaults to ``ledger.sqlite`` under the output directory.
+    ``resume`` names a run id (or ``latest`` unfinished run) whose completed
+    cells are reused instead of rerun.
+    """
+
+    enabled: bool = True
+    path: Path | None = None
+    resume: str | None = None
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any]) -> "LedgerConfig":
+        path = raw.get("path")
+        resume = raw.get("resume")
+        return cls(
+            enabled=bool(raw.get("enabled", True)),
+            path=Path(path) if path else None,
+            resume=str(resume) if resume else None,
+        )
+
+
+@dataclass(slots=True)
+class ModelStoreConfig:
+    """Save each per-asset fitted model with its metadata for ``scripts/predict.py``.
+
+    ``directory`` defaults to ``models`` under the output directory.
+    """
+
+    enabled: bool = False
+    directory: Path | None = None
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any]) -> "ModelStoreConfig":
+        directory = raw.get("directory")
+        return cls(enabled=bool(raw.get("enabled", False)), directory=Path(directory) if directory else None)
+
+
+@dataclass(slots=True)
+class ProfilingConfig:
+    """Per-stage timing/memory trace and optional per-task profiler capture."""
+
+    enabled: bool = False
+    memory: str | None = "rss"
+    profiler: str | None = None
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any]) -> "ProfilingConfig":
+        memory = raw.get("memory", "rss")
+        memory = str(memory).lower() if memory else None
+        if memory not in {None, "rss", "tracemalloc"}:
+            raise ValueError(f"Unsupported profiling memory mode: {memory}")
+        profiler = raw.get("profiler")
+        profiler = str(profiler).lower() if profiler else None
+        if profiler not in {None, "cprofile", "pyinstrument"}:
+            raise ValueError(f"Unsupported profiler: {profiler}")
+        return cls(enabled=bool(raw.get("enabled", False)), memory=memory, profiler=profiler)
+
+
+@dataclass(slots=True)
+class SearchConfig:
+    """Hyperparameter search over the ``params`` of one configured model.
+
+    ``space`` maps parameter names to a list of choices, or to a mapping with
+    ``low``/``high`` (and optional ``log: true``) for random sampling. Budgets
+    are passed to the model as ``budget_param`` (e.g. ``max_iter``/``epochs``);
+    without one, the budget scales how much of the training data is fit, taking
+    the most recent windows and keeping the validation slice whole.
+    """
+
+    model: str
+    space: Dict[str, Any] = field(default_factory=dict)
+    strategy: str = "grid"
+    horizon: int | None = None
+    metric: str = "rmse"
+    n_candidates: int = 10
+    budget_param: str | None = None
+    min_budget: int = 1
+    max_budget: int = 1
+    eta: int = 3
+    validation_size: int | None = None
+    seed: int = 0
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any]) -> "SearchConfig":
+        strategy = str(raw.get("strategy", "grid")).lower()
+        if strategy not in {"grid", "random", "halving", "hyperband"}:
+            raise ValueError(f"Unsupported search strategy: {strategy}")
+        horizon = raw.get("horizon")
+        validation_size = raw.get("validation_size")
+        budget_param = raw.get("budget_param")
+        return cls(
+            model=str(raw["model"]),
+            space=dict(raw.get("space", {})),
+            strategy=strategy,
+            horizon=int(horizon) if horizon is not None else None,
+            metric=str(raw.get("metric", "rmse")).lower(),
+            n_candidates=int(raw.get("n_candidates", 10)),
+            budget_param=str(budget_param) if budget_param else None,
+            min_budget=int(raw.get("min_budget", 1)),
+            max_budget=int(raw.get("max_budget", raw.get("min_budget", 1))),
+            eta=max(2, int(raw.get("eta", 3))),
+            validation_size=int(validation_size) if validation_size is not None else None,
+            seed=int(raw.get("seed", 0)),
+        )
+
+
+@dataclass(slots=True)
+class AssetConfig:
+    """One series of a panel run; ``target_column`` falls back to the run's target."""
+
+    name: str
+    data_path: Path | None = None
+    target_column: str | None = None
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any] | str) -> "AssetConfig":
+        if isinstance(raw, str):
+            return cls(name=raw)
+        data_path = raw.get("data_path")
+        target_column = raw.get("target_column")
+        return cls(
+            name=str(raw["name"]),
+            data_path=Path(data_path) if data_path else None,
+            target_column=str(target_column) if target_column else None,
+        )
+
+
+@dataclass(slots=True)
+class PanelConfig:
+    """Several series forecast in one run.
+
+    Either list ``assets`` with their own ``data_path`` (one CSV per asset), or
+    point ``path`` at a long-format CSV with an ``asset_column``; ``assets`` then
+    optionally restricts which assets are used. With ``pooled`` enabled, each
+    feature-mode model is trained once per horizon on the windows of all assets.
+    """
+
+    assets: List[AssetConfig] = field(default_factory=list)
+    path: Path | None = None
+    asset_column: str = "asset"
+    pooled: bool = True
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any]) -> "PanelConfig":
+        path = raw.get("path")
+        panel = cls(
+            assets=[AssetConfig.from_mapping(entry) for entry in raw.get("assets", [])],
+            path=Path(path) if path else None,
+            asset_column=str(raw.get("asset_column", "asset")),
+            pooled=bool(raw.get("pooled", True)),
+        )
+        if panel.path is None and any(asset.data_path is None for asset in panel.assets):
+            raise ValueError("Panel assets need a data_path unless a long-format panel path is given")
+        if panel.path is None and not panel.assets:
+            raise ValueError("Panel needs either assets or a long-format path")
+        return panel
+
+
 @dataclass(slots=True)
 class RunConfig:
     """Controls an experiment run."""
@@ -62,9 +338,20 @@ class RunConfig:
     data_path: Path = Path("ETH-USD.csv")
     target_column: str = "Close"
     frequency: str | None = "D"
+    feature_dtype: str = "float64"
+    multi_horizon: bool = False
+    features: List[FeatureConfig] = field(default_factory=list)
     horizons: List[HorizonConfig] = field(default_factory=_default_horizons)
     models: List[ModelConfig] = field(default_factory=_default_models)
     output_dir: Path = Path("artifacts")
+    execution: ExecutionConfig = field(default_factory=ExecutionConfig)
+    backtest: BacktestConfig = field(default_factory=BacktestConfig)
+    cache: CacheConfig = field(default_factory=CacheConfig)
+    ledger: LedgerConfig = field(default_factory=LedgerConfig)
+    model_store: ModelStoreConfig = field(default_factory=ModelStoreConfig)
+    profiling: ProfilingConfig = field(default_factory=ProfilingConfig)
+    search: SearchConfig | None = None
+    panel: PanelConfig | None = None
 
     @classmethod
     def from_mapping(cls, raw: Mapping[str, Any]) -> "RunConfig":
@@ -76,14 +363,34 @@ class RunConfig:
             ModelConfig.from_mapping(entry)
             for entry in raw.get("models", [])
         ]
-        return cls(
-            data_path=Path(raw.get("data_path", cls.data_path)),
-            target_column=str(raw.get("target_column", cls.target_column)),
-            frequency=raw.get("frequency", cls.frequency),
-            horizons=horizons or _default_horizons(),
-            models=models or _default_models(),
-            output_dir=Path(raw.get("output_dir", cls.output_dir)),
+        features = [FeatureConfig.from_mapping(entry) for entry in raw.get("features") or []]
+        # slots=True turns class attributes into descriptors, so read the
+        # defaults from an instance rather than from ``cls``.
+        defaults = cls()
+        config = cls(
+            data_path=Path(raw.get("data_path", defaults.data_path)),
+            target_column=str(raw.get("target_column", defaults.target_column)),
+            frequency=raw.get("frequency", defaults.frequency),
+            feature_dtype=str(raw.get("feature_dtype", defaults.feature_dtype)),
+            multi_horizon=bool(raw.get("multi_horizon", defaults.multi_horizon)),
+            features=features,
+            horizons=horizons or defaults.horizons,
+            models=models or defaults.models,
+            output_dir=Path(raw.get("output_dir", defaults.output_dir)),
+            execution=ExecutionConfig.from_mapping(raw.get("execution") or {}),
+            backtest=BacktestConfig.from_mapping(raw.get("backtest") or {}),
+            cache=CacheConfig.from_mapping(raw.get("cache") or {}),
+            ledger=LedgerConfig.from_mapping(raw.get("ledger") or {}),
+            model_store=ModelStoreConfig.from_mapping(raw.get("model_store") or {}),
+            profiling=ProfilingConfig.from_mapping(raw.get("profiling") or {}),
+            search=SearchConfig.from_mapping(raw["search"]) if raw.get("search") else None,
+            panel=PanelConfig.from_mapping(raw["panel"]) if raw.get("panel") else None,
         )
+        if config.features and config.multi_horizon:
+            raise ValueError("features are not supported together with multi_horizon")
+        if config.features and config.panel is not None and config.panel.pooled:
+            raise ValueError("features are not supported for pooled panel training; set panel.pooled: false")
+        return config
 
     @classmethod
     def from_file(cls, path: Path) -> "RunConfig":
@@ -98,7 +405,54 @@ class RunConfig:
             "data_path": str(self.data_path),
             "target_column": self.target_column,
             "frequency": self.frequency,
+            "feature_dtype": self.feature_dtype,
+            "multi_horizon": self.multi_horizon,
+            "features": [asdict(feature) for feature in self.features],
             "output_dir": str(self.output_dir),
+            "execution": {
+                "backend": self.execution.backend,
+                "workers": self.execution.workers,
+                "threads_per_worker": self.execution.threads_per_worker,
+            },
+            "backtest": {
+                "mode": self.backtest.mode,
+                "refit_every": self.backtest.refit_every,
+                "series_fits": self.backtest.series_fits,
+            },
+            "cache": {
+                "enabled": self.cache.enabled,
+                "directory": str(self.cache.directory) if self.cache.directory else None,
+                "max_size_mb": self.cache.max_size_mb,
+                "refresh": self.cache.refresh,
+            },
+            "ledger": {
+                "enabled": self.ledger.enabled,
+                "path": str(self.ledger.path) if self.ledger.path else None,
+                "resume": self.ledger.resume,
+            },
+            "model_store": {
+                "enabled": self.model_store.enabled,
+                "directory": str(self.model_store.directory) if self.model_store.directory else None,
+            },
+            "profiling": asdict(self.profiling),
+            "search": asdict(self.search) if self.search is not None else None,
+            "panel": (
+                {
+                    "assets": [
+                        {
+                            "name": asset.name,
+                            "data_path": str(asset.data_path) if asset.data_path else None,
+                            "target_column": asset.target_column,
+                        }
+                        for asset in self.panel.assets
+                    ],
+                    "path": str(self.panel.path) if self.panel.path else None,
+                    "asset_column": self.panel.asset_column,
+                    "pooled": self.panel.pooled,
+                }
+                if self.panel is not None
+                else None
+            ),
             "horizons": [
                 {
                     "steps_ahead": h.steps_ahead,
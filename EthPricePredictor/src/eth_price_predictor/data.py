@@ -1,16 +1,28 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import shutil
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Tuple
+from typing import Dict, Iterable, Tuple
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import as_strided, sliding_window_view
+
+from .profiling import stage
 
 
 @dataclass(slots=True)
 class WindowedDataset:
-    """Container for supervised samples built from a single time-series."""
+    """Container for supervised samples built from a single time-series.
+
+    ``split`` slices rather than copies, so both halves remain views over the
+    same buffer produced by :func:`make_windowed_dataset`.
+    """
 
     features: np.ndarray
     targets: np.ndarray
@@ -33,46 +45,191 @@ class WindowedDataset:
         return first, second
 
 
-def load_price_history(csv_path: Path, frequency: str | None = "D") -> pd.DataFrame:
-    """Load and optionally resample the ETH price history CSV."""
+_PREPARED_FORMAT_VERSION = 1
+
 
-    df = pd.read_csv(csv_path, parse_dates=["Date"])
+def _parse_price_history(csv_path: Path, frequency: str | None) -> pd.DataFrame:
+    with stage("load"):
+        df = pd.read_csv(csv_path, parse_dates=["Date"])
     if "Date" not in df.columns:
         raise ValueError("CSV must contain a Date column")
-    df = df.sort_values("Date").set_index("Date")
-    numeric_cols = df.select_dtypes(include=["number"]).columns
-    df[numeric_cols] = df[numeric_cols].astype(float)
-    if frequency:
-        df = df.resample(frequency).interpolate(method="time")
+    return _prepare_frame(df, frequency)
+
+
+def _prepare_frame(df: pd.DataFrame, frequency: str | None) -> pd.DataFrame:
+    with stage("resample"):
+        df = df.sort_values("Date").set_index("Date")
+        numeric_cols = df.select_dtypes(include=["number"]).columns
+        df[numeric_cols] = df[numeric_cols].astype(float)
+        if frequency:
+            # Text columns (an exchange name, a ticker) have no value between two bars.
+            df = df[numeric_cols].resample(frequency).interpolate(method="time")
     return df
 
 
+def _prepared_key(csv_path: Path, frequency: str | None) -> str:
+    stat = csv_path.stat()
+    fingerprint = json.dumps(
+        {
+            "path": str(csv_path.resolve()),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "frequency": frequency,
+            "version": _PREPARED_FORMAT_VERSION,
+        },
+        sort_keys=True,
+    )
+    return hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def _write_prepared(df: pd.DataFrame, target: Path) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=target.parent, prefix=f".{target.name}-"))
+    try:
+        np.save(staging / "index.npy", df.index.to_numpy())
+        columns = []
+        for position, name in enumerate(df.columns):
+            values = df[name].to_numpy()
+            if values.dtype == object:
+                values = values.astype(str)
+            np.save(staging / f"col{position}.npy", values)
+            columns.append(str(name))
+        manifest = {
+            "columns": columns,
+            "index_name": df.index.name,
+            "freq": df.index.freqstr if isinstance(df.index, pd.DatetimeIndex) else None,
+        }
+        (staging / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(staging, target)
+    except OSError:
+        # Another process published the same key first; its copy is equivalent.
+        shutil.rmtree(staging, ignore_errors=True)
+        if not (target / "manifest.json").exists():
+            raise
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+
+def _read_prepared(source: Path) -> pd.DataFrame:
+    manifest = json.loads((source / "manifest.json").read_text(encoding="utf-8"))
+    index = pd.DatetimeIndex(
+        np.load(source / "index.npy", mmap_mode="r"),
+        freq=manifest["freq"],
+        name=manifest["index_name"],
+    )
+    columns = {
+        name: np.load(source / f"col{position}.npy", mmap_mode="r")
+        for position, name in enumerate(manifest["columns"])
+    }
+    return pd.DataFrame(columns, index=index, copy=False)
+
+
+def load_price_history(
+    csv_path: Path,
+    frequency: str | None = "D",
+    cache_dir: Path | None = None,
+) -> pd.DataFrame:
+    """Load and optionally resample the ETH price history CSV.
+
+    With ``cache_dir`` set, the parsed and resampled frame is stored once as one
+    ``.npy`` file per column plus the datetime index, keyed on the source file's
+    size/mtime and ``frequency``. Later loads memory-map those files, so
+    concurrent workers share the same pages instead of re-parsing the CSV.
+    """
+
+    csv_path = Path(csv_path)
+    if cache_dir is None:
+        return _parse_price_history(csv_path, frequency)
+
+    prepared = Path(cache_dir) / f"{csv_path.stem}-{_prepared_key(csv_path, frequency)}"
+    if (prepared / "manifest.json").exists():
+        with stage("load"):
+            return _read_prepared(prepared)
+    df = _parse_price_history(csv_path, frequency)
+    _write_prepared(df, prepared)
+    return _read_prepared(prepared)
+
+
+def load_long_panel(
+    csv_path: Path,
+    asset_column: str = "asset",
+    frequency: str | None = "D",
+    assets: Iterable[str] | None = None,
+) -> Dict[str, pd.DataFrame]:
+    """Load a long-format CSV (``Date``, ``asset_column``, values...) into one frame per asset.
+
+    The file is parsed once; each asset is then sorted, cast and resampled
+    exactly like :func:`load_price_history`.
+    """
+
+    with stage("load"):
+        df = pd.read_csv(csv_path, parse_dates=["Date"])
+    for column in ("Date", asset_column):
+        if column not in df.columns:
+            raise ValueError(f"Panel CSV must contain a {column} column")
+    if assets is not None:
+        wanted = list(assets)
+        df = df[df[asset_column].isin(wanted)]
+        missing = sorted(set(wanted) - set(df[asset_column].unique()))
+        if missing:
+            raise ValueError(f"Assets not found in panel: {', '.join(missing)}")
+    return {
+        str(name): _prepare_frame(group.drop(columns=asset_column), frequency)
+        for name, group in df.groupby(asset_column, sort=True)
+    }
+
+
 def make_windowed_dataset(
-    series: pd.Series,
+    series: pd.Series | pd.DataFrame,
     lookback: int,
     horizon: int,
+    dtype: np.dtype | str = np.float64,
 ) -> WindowedDataset:
-    """Create lagged features for a univariate series."""
+    """Create lagged features for a univariate series.
+
+    ``features`` is a read-only strided view over the series values, so each
+    window shares memory with its neighbours instead of being copied. Pass
+    ``dtype="float32"`` to halve the footprint of the underlying buffer.
+
+    A DataFrame (see :func:`features.build_feature_frame`) has the target as
+    its last column. Each window row then holds ``lookback`` consecutive rows
+    of every column, flattened bar by bar, which is still a view because the
+    rows of a C-contiguous block sit next to each other. The window ends with
+    the target at the forecast origin. Leading rows with a missing value
+    (feature warm-up) are skipped.
+    """
 
     if lookback <= 0:
         raise ValueError("lookback must be positive")
     if horizon <= 0:
         raise ValueError("horizon must be positive")
 
-    values = series.to_numpy(dtype=float)
+    values = np.ascontiguousarray(series.to_numpy(), dtype=dtype)
+    start = 0
+    if values.ndim == 2:
+        complete = ~np.isnan(values).any(axis=1)
+        start = int(np.argmax(complete)) if complete.any() else len(values)
+        values = values[start:]
     total_steps = len(values)
     window_count = total_steps - lookback - horizon + 1
     if window_count <= 0:
         raise ValueError("Not enough observations for the requested window configuration")
 
-    features = np.zeros((window_count, lookback), dtype=float)
-    targets = np.zeros(window_count, dtype=float)
-    indices = []
-
-    for start in range(window_count):
-        end = start + lookback
-        features[start] = values[start:end]
-        targets[start] = values[end + horizon - 1]
-        indices.append(series.index[end + horizon - 1])
+    first_target = lookback + horizon - 1
+    if values.ndim == 1:
+        features = sliding_window_view(values, lookback)[:window_count]
+        targets = values[first_target:].view()
+    else:
+        width = values.shape[1]
+        features = as_strided(
+            values,
+            shape=(window_count, lookback * width),
+            strides=(values.strides[0], values.strides[1]),
+            writeable=False,
+        )
+        targets = values[first_target:, -1]
+    targets.flags.writeable = False
+    indices = pd.DatetimeIndex(series.index[start + first_target :])
 
-    return WindowedDataset(features=features, targets=targets, indices=pd.DatetimeIndex(indices))
+    return WindowedDataset(features=features, targets=targets, indices=indices)
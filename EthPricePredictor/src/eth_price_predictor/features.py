@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+from typing import Callable, Dict, Sequence
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .config import FeatureConfig
+
+# Bumped whenever a kernel's output changes, so cached columns are recomputed.
+_FEATURE_FORMAT = 2
+
+# Windows whose variance is within this factor of the running sums' rounding error are
+# recomputed directly; the cumulative-sum difference has too few correct digits left there.
+_UNSTABLE_FACTOR = 1e7
+
+
+def _lagged_ratio(values: np.ndarray, window: int) -> np.ndarray:
+    ratio = np.full(len(values), np.nan)
+    ratio[window:] = values[window:] / values[:-window]
+    return ratio
+
+
+def _rolling_mean_std(values: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """Trailing mean/std (ddof=0) over ``window`` points from cumulative sums, O(n) in the window."""
+
+    mean = np.full(len(values), np.nan)
+    std = np.full(len(values), np.nan)
+    valid = np.flatnonzero(~np.isnan(values))
+    if len(valid) < window:
+        return mean, std
+    start = valid[0]
+    # Centring first keeps the sum-of-squares difference from cancelling catastrophically.
+    shifted = values[start:] - np.nanmean(values[start:])
+    sums = np.concatenate([[0.0], np.cumsum(shifted)])
+    squares = np.concatenate([[0.0], np.cumsum(shifted * shifted)])
+    window_sum = sums[window:] - sums[:-window]
+    window_squares = squares[window:] - squares[:-window]
+    window_mean = window_sum / window
+    variance = window_squares / window - window_mean**2
+    unstable = np.flatnonzero(variance <= _UNSTABLE_FACTOR * np.finfo(float).eps * squares[window:] / window)
+    if unstable.size:
+        variance[unstable] = np.var(sliding_window_view(shifted, window)[unstable], axis=1)
+    mean[start + window - 1 :] = window_mean + np.nanmean(values[start:])
+    std[start + window - 1 :] = np.sqrt(np.maximum(variance, 0.0))
+    return mean, std
+
+
+def _returns(frame: pd.DataFrame, feature: FeatureConfig, target_column: str) -> np.ndarray:
+    return _lagged_ratio(_column(frame, feature.column or target_column), feature.span) - 1.0
+
+
+def _log_returns(frame: pd.DataFrame, feature: FeatureConfig, target_column: str) -> np.ndarray:
+    return np.log(_lagged_ratio(_column(frame, feature.column or target_column), feature.span))
+
+
+def _volatility(frame: pd.DataFrame, feature: FeatureConfig, target_column: str) -> np.ndarray:
+    returns = np.log(_lagged_ratio(_column(frame, feature.column or target_column), 1))
+    return _rolling_mean_std(returns, feature.span)[1]
+
+
+def _volume_zscore(frame: pd.DataFrame, feature: FeatureConfig, target_column: str) -> np.ndarray:
+    volume = _column(frame, feature.column or "Volume")
+    mean, std = _rolling_mean_std(volume, feature.span)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        zscore = (volume - mean) / std
+    # A flat window has no spread; NaN warm-up rows stay NaN.
+    zscore[std == 0] = 0.0
+    return zscore
+
+
+def _range(frame: pd.DataFrame, feature: FeatureConfig, target_column: str) -> np.ndarray:
+    spread = (_column(frame, "High") - _column(frame, "Low")) / _column(frame, feature.column or "Close")
+    return spread if feature.span == 1 else _rolling_mean_std(spread, feature.span)[0]
+
+
+FEATURE_KERNELS: Dict[str, Callable[[pd.DataFrame, FeatureConfig, str], np.ndarray]] = {
+    "returns": _returns,
+    "log_returns": _log_returns,
+    "volatility": _volatility,
+    "volume_zscore": _volume_zscore,
+    "range": _range,
+}
+
+
+def _column(frame: pd.DataFrame, name: str) -> np.ndarray:
+    if name not in frame.columns:
+        raise ValueError(f"Feature needs a {name!r} column, which the dataset does not have")
+    return frame[name].to_numpy(dtype=float)
+
+
+def _feature_key(data_hash: str, feature: FeatureConfig, target_column: str) -> str:
+    definition = {
+        "data": data_hash,
+        "feature": asdict(feature),
+        "target": target_column,
+        "format": _FEATURE_FORMAT,
+    }
+    encoded = json.dumps(definition, sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def _cached_column(path: Path, compute: Callable[[], np.ndarray]) -> np.ndarray:
+    if path.exists():
+        return np.load(path, mmap_mode="r")
+    values = compute()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle, staging = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}-", suffix=".npy")
+    try:
+        with os.fdopen(handle, "wb") as stream:
+            np.save(stream, values)
+        os.replace(staging, path)
+    except BaseException:
+        Path(staging).unlink(missing_ok=True)
+        raise
+    return values
+
+
+def build_feature_frame(
+    frame: pd.DataFrame,
+    target_column: str,
+    features: Sequence[FeatureConfig],
+    cache_dir: Path | None = None,
+    data_hash: str | None = None,
+) -> pd.DataFrame:
+    """Model inputs for one series: every configured feature followed by the target as the last column.
+
+    Each feature is computed once per series with vectorised trailing kernels
+    (so no value depends on later bars) and, with ``cache_dir`` and the
+    source's ``data_hash``, stored as ``.npy`` keyed on its definition. All
+    columns land in one contiguous float64 block, which
+    :func:`make_windowed_dataset` windows without copying. Leading rows stay
+    NaN until every feature's window is filled.
+    """
+
+    columns = []
+    for feature in features:
+        kernel = FEATURE_KERNELS[feature.kind]
+        if cache_dir is None or data_hash is None:
+            columns.append(kernel(frame, feature, target_column))
+            continue
+        path = Path(cache_dir) / f"{feature.name}-{_feature_key(data_hash, feature, target_column)}.npy"
+        columns.append(_cached_column(path, lambda kernel=kernel, feature=feature: kernel(frame, feature, target_column)))
+    columns.append(_column(frame, target_column))
+    block = np.empty((len(frame), len(columns)))
+    for position, values in enumerate(columns):
+        block[:, position] = values
+    names = [feature.name for feature in features] + [target_column]
+    return pd.DataFrame(block, index=frame.index, columns=names, copy=False)
+
+
+__all__ = ["FEATURE_KERNELS", "build_feature_frame"]
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Dict, Sequence
+
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+
+BAR_COLUMNS = ("Open", "High", "Low", "Close", "Volume")
+_AGGREGATIONS = {"Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "sum"}
+DEFAULT_FREQUENCIES = ("1min", "1h", "D")
+
+
+def _bar_offset(frequency: str) -> pd.Timedelta:
+    try:
+        return pd.Timedelta(to_offset(frequency).nanos, unit="ns")
+    except ValueError as exc:
+        # Calendar offsets (W, ME, ...) have no fixed length, so bars could not be floored.
+        raise ValueError(f"Bar frequency must have a fixed length, got {frequency!r}") from exc
+
+
+def _source_bars(chunk: pd.DataFrame, date_column: str, price_column: str, unit: str | None) -> pd.DataFrame:
+    """Normalise a chunk of ticks (one price) or finer bars (OHLC) to OHLCV rows."""
+
+    index = pd.to_datetime(chunk[date_column], unit=unit) if unit else pd.to_datetime(chunk[date_column])
+    if set(BAR_COLUMNS[:4]).issubset(chunk.columns):
+        bars = chunk[list(BAR_COLUMNS[:4])].astype(float)
+    else:
+        if price_column not in chunk.columns:
+            raise ValueError(f"Source must contain OHLC columns or a {price_column} column")
+        price = chunk[price_column].astype(float)
+        bars = pd.DataFrame({"Open": price, "High": price, "Low": price, "Close": price})
+    bars["Volume"] = chunk["Volume"].astype(float) if "Volume" in chunk.columns else 0.0
+    bars.index = pd.DatetimeIndex(index, name="Date")
+    return bars
+
+
+def _aggregate(bars: pd.DataFrame, offset: pd.Timedelta) -> pd.DataFrame:
+    return bars.groupby(bars.index.floor(offset), sort=False).agg(_AGGREGATIONS)
+
+
+def _merge_carry(carry: pd.DataFrame | None, bars: pd.DataFrame) -> pd.DataFrame:
+    # The previous chunk's last bar is still open; fold in rows of the same bucket.
+    if carry is None or bars.index[0] != carry.index[0]:
+        return bars if carry is None else pd.concat([carry, bars])
+    head = pd.concat([carry, bars.iloc[:1]]).groupby(level=0, sort=False).agg(_AGGREGATIONS)
+    return pd.concat([head, bars.iloc[1:]])
+
+
+def aggregate_bars(
+    source: Path,
+    output_dir: Path,
+    frequencies: Sequence[str] = DEFAULT_FREQUENCIES,
+    date_column: str = "Date",
+    price_column: str = "Price",
+    unit: str | None = None,
+    chunksize: int = 1_000_000,
+) -> Dict[str, Path]:
+    """Stream a tick or minute CSV into OHLCV bar files at several frequencies in one pass.
+
+    The source is read ``chunksize`` rows at a time and must be in
+    chronological order. Rows carry either ``Open/High/Low/Close`` or a single
+    ``price_column``, plus an optional ``Volume``; ``unit`` parses epoch
+    timestamps (e.g. ``"ms"``). Each chunk is aggregated to the finest
+    frequency, coarser bars are built from those, and only the last, possibly
+    incomplete bar per frequency is held back for the next chunk, so memory
+    stays bounded by the chunk size. Bars are written as
+    ``<stem>_<frequency>.csv`` with ``Date`` plus ``BAR_COLUMNS``, ready to use
+    as a ``data_path``. Buckets without trades produce no row.
+    """
+
+    source = Path(source)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    offsets = sorted(((_bar_offset(frequency), frequency) for frequency in frequencies), key=lambda item: item[0])
+    finest = offsets[0][0]
+    targets = {frequency: output_dir / f"{source.stem}_{frequency}.csv" for _, frequency in offsets}
+    partials = {frequency: target.with_name(f".{target.name}.partial") for frequency, target in targets.items()}
+    carries: Dict[str, pd.DataFrame | None] = {frequency: None for frequency in targets}
+    last_seen: pd.Timestamp | None = None
+
+    handles = {frequency: open(partial, "w", newline="", encoding="utf-8") for frequency, partial in partials.items()}
+    try:
+        for handle in handles.values():
+            handle.write(",".join(("Date",) + BAR_COLUMNS) + "\n")
+        for chunk in pd.read_csv(source, chunksize=chunksize):
+            if chunk.empty:
+                continue
+            rows = _source_bars(chunk, date_column, price_column, unit)
+            if not rows.index.is_monotonic_increasing or (last_seen is not None and rows.index[0] < last_seen):
+                raise ValueError(f"{source} must be sorted by {date_column} for streaming ingest")
+            last_seen = rows.index[-1]
+            base = _aggregate(rows, finest)
+            for offset, frequency in offsets:
+                # Aggregation is associative, so coarser bars can be built from the finest ones
+                # whenever the frequencies nest; otherwise go back to the raw rows.
+                if offset == finest:
+                    bars = base
+                elif offset % finest == pd.Timedelta(0):
+                    bars = _aggregate(base, offset)
+                else:
+                    bars = _aggregate(rows, offset)
+                bars = _merge_carry(carries[frequency], bars)
+                bars.iloc[:-1].to_csv(handles[frequency], header=False, date_format="%Y-%m-%d %H:%M:%S")
+                carries[frequency] = bars.iloc[-1:]
+        for frequency, carry in carries.items():
+            if carry is not None:
+                carry.to_csv(handles[frequency], header=False, date_format="%Y-%m-%d %H:%M:%S")
+    except BaseException:
+        for frequency, handle in handles.items():
+            handle.close()
+            partials[frequency].unlink(missing_ok=True)
+        raise
+    for frequency, handle in handles.items():
+        handle.close()
+        os.replace(partials[frequency], targets[frequency])
+    return targets
+
+
+__all__ = ["BAR_COLUMNS", "DEFAULT_FREQUENCIES", "aggregate_bars"]
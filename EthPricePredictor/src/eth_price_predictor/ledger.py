@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import json
+import secrets
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from time import time
+from typing import Any, Dict, Iterable, List, Mapping, Set
+
+import pandas as pd
+
+from .metrics import METRIC_NAMES
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    status TEXT NOT NULL,
+    config TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cells (
+    run_id TEXT NOT NULL REFERENCES runs(run_id),
+    cell_key TEXT NOT NULL,
+    label TEXT NOT NULL,
+    completed_at REAL NOT NULL,
+    PRIMARY KEY (run_id, cell_key)
+);
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    cell_key TEXT NOT NULL,
+    model TEXT,
+    horizon TEXT,
+    asset TEXT,
+    {metric_columns},
+    runtime_sec REAL,
+    record TEXT NOT NULL,
+    FOREIGN KEY (run_id, cell_key) REFERENCES cells(run_id, cell_key)
+);
+CREATE INDEX IF NOT EXISTS results_by_run ON results(run_id);
+CREATE INDEX IF NOT EXISTS results_by_model ON results(model, horizon);
+""".format(metric_columns=",\n    ".join(f"{name} REAL" for name in METRIC_NAMES))
+
+_FILTER_COLUMNS = ("run_id", "model", "horizon", "asset")
+
+
+class ResumeError(ValueError):
+    """Raised when ``--resume`` names no run (or no unfinished run) to continue."""
+
+
+def new_run_id() -> str:
+    return f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S}-{secrets.token_hex(3)}"
+
+
+class ExperimentLedger:
+    """Append-only SQLite store of experiment runs and their per-cell results.
+
+    Every finished grid cell is committed in its own transaction, so a crash
+    loses at most the cells still running. Metric columns are indexed by run
+    and by (model, horizon) for cross-run queries; the full record is kept as
+    JSON. Only the parent process writes; WAL mode lets readers query a run
+    while it is still going.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+
+    def start_run(self, config: Mapping[str, Any], run_id: str | None = None) -> str:
+        """Register a new run, or reopen ``run_id`` (``"latest"`` picks the most recent unfinished run).
+
+        Raises ``ResumeError`` if ``run_id`` is not in the ledger.
+        """
+
+        if run_id == "latest":
+            row = self._connection.execute(
+                "SELECT run_id FROM runs WHERE status != 'finished' ORDER BY started_at DESC LIMIT 1"
+            ).fetchone()
+            if row is None:
+                raise ResumeError(f"No unfinished run to resume in {self.path}")
+            run_id = row[0]
+        with self._connection:
+            if run_id is not None:
+                updated = self._connection.execute(
+                    "UPDATE runs SET status = 'running', finished_at = NULL WHERE run_id = ?", (run_id,)
+                )
+                if not updated.rowcount:
+                    raise ResumeError(f"No run {run_id!r} to resume in {self.path}")
+                return run_id
+            run_id = new_run_id()
+            self._connection.execute(
+                "INSERT INTO runs (run_id, started_at, status, config) VALUES (?, ?, 'running', ?)",
+                (run_id, time(), json.dumps(config, sort_keys=True, default=str)),
+            )
+        return run_id
+
+    def finish_run(self, run_id: str, status: str = "finished") -> None:
+        with self._connection:
+            self._connection.execute(
+                "UPDATE runs SET status = ?, finished_at = ? WHERE run_id = ?", (status, time(), run_id)
+            )
+
+    def completed_cells(self, run_id: str) -> Set[str]:
+        rows = self._connection.execute("SELECT cell_key FROM cells WHERE run_id = ?", (run_id,))
+        return {row[0] for row in rows}
+
+    def record_cell(self, run_id: str, cell_key: str, label: str, records: Iterable[Mapping[str, Any]]) -> None:
+        """Commit one cell's records atomically; re-recording a cell replaces its rows."""
+
+        rows = []
+        for record in records:
+            asset = record.get("asset")
+            rows.append(
+                (
+                    run_id,
+                    cell_key,
+                    record.get("model"),
+                    record.get("horizon"),
+                    None if asset is None else str(asset),
+                    *(record.get(name) for name in METRIC_NAMES),
+                    record.get("runtime_sec"),
+                    json.dumps(dict(record), sort_keys=True, default=str),
+                )
+            )
+        placeholders = ", ".join("?" * (len(METRIC_NAMES) + 7))
+        with self._connection:
+            self._connection.execute("DELETE FROM results WHERE run_id = ? AND cell_key = ?", (run_id, cell_key))
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cells (run_id, cell_key, label, completed_at) VALUES (?, ?, ?, ?)",
+                (run_id, cell_key, label, time()),
+            )
+            self._connection.executemany(
+                f"INSERT INTO results (run_id, cell_key, model, horizon, asset, {', '.join(METRIC_NAMES)}, "
+                f"runtime_sec, record) VALUES ({placeholders})",
+                rows,
+            )
+
+    def cell_records(self, run_id: str, cell_key: str) -> List[Dict[str, Any]]:
+        rows = self._connection.execute(
+            "SELECT record FROM results WHERE run_id = ? AND cell_key = ? ORDER BY id", (run_id, cell_key)
+        )
+        return [json.loads(row[0]) for row in rows]
+
+    def runs(self) -> pd.DataFrame:
+        return pd.read_sql_query(
+            "SELECT run_id, started_at, finished_at, status, "
+            "(SELECT COUNT(*) FROM cells WHERE cells.run_id = runs.run_id) AS cells "
+            "FROM runs ORDER BY started_at",
+            self._connection,
+        )
+
+    def results(self, **filters: Any) -> pd.DataFrame:
+        """Indexed result columns across runs, filtered by ``run_id``/``model``/``horizon``/``asset``."""
+
+        unknown = set(filters) - set(_FILTER_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unsupported ledger filter(s): {', '.join(sorted(unknown))}")
+        clauses = [f"{name} = ?" for name, value in filters.items() if value is not None]
+        values = [value for value in filters.values() if value is not None]
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return pd.read_sql_query(
+            f"SELECT run_id, model, horizon, asset, {', '.join(METRIC_NAMES)}, runtime_sec "
+            f"FROM results{where} ORDER BY id",
+            self._connection,
+            params=values,
+        )
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "ExperimentLedger":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+__all__ = ["ExperimentLedger", "ResumeError", "new_run_id"]
@@ -1,23 +1,89 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Tuple
 
 import numpy as np
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+_EPSILON = 1e-8
+
+METRIC_NAMES = ("mae", "rmse", "mape", "r2", "directional_accuracy")
 
 
 def mean_absolute_percentage_error(y_true: np.ndarray, y_pred: np.ndarray) -> float:
     y_true = np.asarray(y_true)
     y_pred = np.asarray(y_pred)
-    epsilon = 1e-8
-    return float(np.mean(np.abs((y_true - y_pred) / (y_true + epsilon))))
+    return float(np.mean(np.abs((y_true - y_pred) / (y_true + _EPSILON))))
+
+
+def batch_regression_metrics(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    reference: np.ndarray | None = None,
+    axis: int | Tuple[int, ...] = -1,
+) -> Dict[str, np.ndarray]:
+    """Score stacks of forecasts against the truth in one vectorised pass.
+
+    ``y_pred`` may carry leading batch axes (e.g. models x origins x steps); it
+    is broadcast against ``y_true`` and every metric is reduced over ``axis``,
+    so the result holds one value per remaining batch entry. ``reference`` is
+    the last observed value at each forecast origin and drives directional
+    accuracy (share of forecasts moving the same way as the truth); without it
+    the previous true value along ``axis`` is used, which drops the first
+    point and needs ``axis`` to be a single axis.
+    """
+
+    y_true = np.asarray(y_true, dtype=float)
+    y_pred = np.asarray(y_pred, dtype=float)
+    y_true, y_pred = np.broadcast_arrays(y_true, y_pred)
 
+    error = y_pred - y_true
+    abs_error = np.abs(error)
+    mae = abs_error.mean(axis=axis)
+    sse = np.square(error).sum(axis=axis)
+    count = error.size // max(1, np.size(mae))
+    mape = (abs_error / np.abs(y_true + _EPSILON)).mean(axis=axis) * 100
+    centred = y_true - y_true.mean(axis=axis, keepdims=True)
+    sst = np.square(centred).sum(axis=axis)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Same convention as sklearn's r2_score for a constant target.
+        r2 = np.where(sst > 0, 1.0 - sse / np.where(sst > 0, sst, 1.0), np.where(sse > 0, 0.0, 1.0))
+
+    if reference is None:
+        if not isinstance(axis, (int, np.integer)):
+            raise ValueError("Directional accuracy without a reference needs a single reduction axis")
+        later = [slice(None)] * y_true.ndim
+        earlier = list(later)
+        later[axis], earlier[axis] = slice(1, None), slice(None, -1)
+        true_move = np.diff(y_true, axis=axis)
+        pred_move = y_pred[tuple(later)] - y_true[tuple(earlier)]
+    else:
+        reference = np.asarray(reference, dtype=float)
+        true_move = y_true - reference
+        pred_move = y_pred - reference
+    hits = np.sign(true_move) == np.sign(pred_move)
+    directional = hits.mean(axis=axis) if hits.size else np.full(np.shape(mae), np.nan)
 
-def compute_regression_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, float]:
-    rmse = np.sqrt(mean_squared_error(y_true, y_pred))
     return {
-        "mae": mean_absolute_error(y_true, y_pred),
-        "rmse": rmse,
-        "mape": mean_absolute_percentage_error(y_true, y_pred) * 100,
-        "r2": r2_score(y_true, y_pred),
+        "mae": mae,
+        "rmse": np.sqrt(sse / count),
+        "mape": mape,
+        "r2": r2,
+        "directional_accuracy": directional,
     }
+
+
+def compute_regression_metrics(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    reference: np.ndarray | None = None,
+) -> Dict[str, float]:
+    metrics = batch_regression_metrics(np.ravel(y_true), np.ravel(y_pred), reference, axis=-1)
+    return {name: float(value) for name, value in metrics.items()}
+
+
+__all__ = [
+    "METRIC_NAMES",
+    "batch_regression_metrics",
+    "compute_regression_metrics",
+    "mean_absolute_percentage_error",
+]
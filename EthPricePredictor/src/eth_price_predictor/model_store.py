@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import re
+import tempfile
+import warnings
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Mapping
+
+import numpy as np
+import pandas as pd
+
+from .cache import hash_series, library_versions
+from .config import FeatureConfig, HorizonConfig, ModelConfig
+from .models import ModelMode
+from .models.classical import SeriesForecaster
+
+_METADATA = "metadata.json"
+_PAYLOAD = "model.pkl"
+
+
+@dataclass(slots=True)
+class ModelMetadata:
+    """What a saved model was trained on, enough to rebuild its input window without the run config.
+
+    ``horizons`` holds one entry for a per-horizon model, or every horizon a
+    direct multi-output or shared series model covers (in output order).
+    ``data_hash`` covers the model's input data up to ``training_end``.
+    """
+
+    model: ModelConfig
+    mode: ModelMode
+    horizons: List[HorizonConfig]
+    training_end: str
+    data_hash: str
+    asset: str | None = None
+    features: List[FeatureConfig] = field(default_factory=list)
+    feature_dtype: str = "float64"
+    created_at: str = ""
+    versions: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        steps = "+".join(f"{horizon.steps_ahead}d" for horizon in self.horizons)
+        parts = [self.model.name, steps] + ([str(self.asset)] if self.asset is not None else [])
+        return re.sub(r"[^A-Za-z0-9_.+-]", "_", "-".join(parts))
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any]) -> "ModelMetadata":
+        return cls(
+            model=ModelConfig.from_mapping(raw["model"]),
+            mode=raw["mode"],
+            horizons=[HorizonConfig.from_mapping(entry) for entry in raw["horizons"]],
+            training_end=str(raw["training_end"]),
+            data_hash=str(raw["data_hash"]),
+            asset=raw.get("asset"),
+            features=[FeatureConfig.from_mapping(entry) for entry in raw.get("features", [])],
+            feature_dtype=str(raw.get("feature_dtype", "float64")),
+            created_at=str(raw.get("created_at", "")),
+            versions=dict(raw.get("versions", {})),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def save_model(directory: Path, model: Any, metadata: ModelMetadata) -> Path:
+    """Write ``model`` and its metadata under ``directory/<metadata.key>``, replacing an older save.
+
+    Everything is pickled: statsmodels results and scikit-learn estimators
+    directly, and the LSTM as its exported NumPy weights. The metadata file is
+    written last, so a directory without it is an interrupted save.
+    """
+
+    target = Path(directory) / metadata.key
+    target.mkdir(parents=True, exist_ok=True)
+    metadata.created_at = metadata.created_at or datetime.now(timezone.utc).isoformat()
+    metadata.versions = metadata.versions or library_versions()
+    (target / _METADATA).unlink(missing_ok=True)
+    for name, payload in (
+        (_PAYLOAD, pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)),
+        (_METADATA, json.dumps(metadata.to_dict(), indent=2, default=str).encode("utf-8")),
+    ):
+        fd, tmp_name = tempfile.mkstemp(dir=target, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+            os.replace(tmp_name, target / name)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    return target
+
+
+class ModelStore:
+    """Directory of saved models; metadata is read eagerly, model payloads on first use and then kept."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+        self.metadata: Dict[str, ModelMetadata] = {}
+        for path in sorted(self.directory.glob(f"*/{_METADATA}")):
+            entry = ModelMetadata.from_mapping(json.loads(path.read_text(encoding="utf-8")))
+            self.metadata[entry.key] = entry
+        self._models: Dict[str, Any] = {}
+
+    def load(self, key: str) -> Any:
+        model = self._models.get(key)
+        if model is None:
+            with (self.directory / key / _PAYLOAD).open("rb") as handle:
+                model = self._models[key] = pickle.load(handle)
+        return model
+
+
+class Predictor:
+    """Forecasts from saved models for the latest window of each asset's data, without refitting.
+
+    Feature models read their last ``lookback`` rows; series models absorb the
+    observations after their ``training_end`` through ``update`` once, then
+    only the bars that arrive between calls.
+    """
+
+    def __init__(self, store: ModelStore, names: Iterable[str] | None = None) -> None:
+        self.store = store
+        wanted = None if names is None else set(names)
+        self.metadata = [entry for entry in store.metadata.values() if wanted is None or entry.model.name in wanted]
+        self._absorbed: Dict[str, pd.Timestamp] = {}
+
+    def _check_data(self, entry: ModelMetadata, data: pd.Series | pd.DataFrame) -> None:
+        if hash_series(data.loc[: pd.Timestamp(entry.training_end)]) != entry.data_hash:
+            warnings.warn(
+                f"Data up to {entry.training_end} differs from what {entry.key} was trained on",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+
+    def _series_forecast(self, entry: ModelMetadata, model: SeriesForecaster, series: pd.Series) -> np.ndarray:
+        last = self._absorbed.get(entry.key, pd.Timestamp(entry.training_end))
+        fresh = series.loc[last:]
+        fresh = fresh.iloc[1:] if len(fresh) and fresh.index[0] == last else fresh
+        if len(fresh):
+            model.update(fresh)
+            self._absorbed[entry.key] = fresh.index[-1]
+        return np.asarray(model.forecast(max(horizon.steps_ahead for horizon in entry.horizons)))
+
+    def forecast(self, inputs: Mapping[str | None, pd.Series | pd.DataFrame]) -> List[Dict[str, Any]]:
+        """One record per (model, horizon, asset) from the end of ``inputs`` (as built by ``load_panel_series``)."""
+
+        records = []
+        for entry in self.metadata:
+            if entry.asset not in inputs:
+                continue
+            data = inputs[entry.asset]
+            start = perf_counter()
+            first_use = entry.key not in self._absorbed
+            if first_use:
+                self._check_data(entry, data)
+            model = self.store.load(entry.key)
+            if entry.mode == "series":
+                series = data if isinstance(data, pd.Series) else data.iloc[:, -1]
+                path = self._series_forecast(entry, model, series)
+                values = [float(path[horizon.steps_ahead - 1]) for horizon in entry.horizons]
+            else:
+                self._absorbed.setdefault(entry.key, data.index[-1])
+                lookback = max(horizon.lookback for horizon in entry.horizons)
+                window = np.asarray(data.to_numpy()[-lookback:], dtype=entry.feature_dtype).reshape(1, -1)
+                values = [float(value) for value in np.ravel(model.predict(window))]
+            latency = perf_counter() - start
+            origin = data.index[-1]
+            for horizon, value in zip(entry.horizons, values):
+                record = {
+                    "origin": str(origin),
+                    "model": entry.model.name,
+                    "horizon": f"{horizon.steps_ahead}d",
+                    "forecast": value,
+                    "latency_sec": latency,
+                }
+                if entry.asset is not None:
+                    record["asset"] = entry.asset
+                records.append(record)
+        return records
+
+
+__all__ = ["ModelMetadata", "ModelStore", "Predictor", "save_model"]
@@ -1,32 +1,118 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Literal
+from functools import lru_cache
+from importlib import import_module, metadata
+from typing import Any, Callable, Dict, List, Literal
 
 from ..config import ModelConfig
-from .base import ForecastModel
-from .classical import ARIMAForecaster, SESForecaster, SeriesForecaster
-from .neural import LSTMForecaster, MLPForecaster
+from .base import ForecastModel, fit_windows
+from .classical import SeriesForecaster
+
+ModelMode = Literal["series", "features"]
+
+# Third-party packages register models under this group, e.g. in pyproject.toml:
+#   [project.entry-points."eth_price_predictor.models"]
+#   prophet = "my_pkg.models:PROPHET_SPEC"
+# The target is a ModelSpec, or a class/factory taking ``params`` (its ``mode``
+# attribute, defaulting to "features", says what input it consumes).
+ENTRY_POINT_GROUP = "eth_price_predictor.models"
 
 
 @dataclass(slots=True)
 class ModelHandle:
     name: str
-    mode: Literal["series", "features"]
+    mode: ModelMode
     model: ForecastModel | SeriesForecaster
 
 
+@dataclass(slots=True)
+class ModelSpec:
+    """Registry entry: how a model type consumes data and where its implementation lives.
+
+    ``factory`` is either a ``"module:attribute"`` path, imported on first
+    use, or a callable taking the model ``params`` dict.
+    """
+
+    mode: ModelMode
+    factory: str | Callable[[Dict[str, Any]], Any]
+
+    def load(self) -> Callable[[Dict[str, Any]], Any]:
+        if callable(self.factory):
+            return self.factory
+        module_name, _, attribute = self.factory.partition(":")
+        self.factory = getattr(import_module(module_name, package=__name__), attribute)
+        return self.factory
+
+
+_REGISTRY: Dict[str, ModelSpec] = {
+    "ses": ModelSpec("series", ".classical:SESForecaster"),
+    "holt": ModelSpec("series", ".classical:HoltForecaster"),
+    "arima": ModelSpec("series", ".classical:ARIMAForecaster"),
+    "mlp": ModelSpec("features", ".neural:MLPForecaster"),
+    "lstm": ModelSpec("features", ".neural:LSTMForecaster"),
+}
+
+# Built-in model types and the input they consume.
+MODEL_MODES: Dict[str, ModelMode] = {name: spec.mode for name, spec in _REGISTRY.items()}
+
+
+def register_model(model_type: str, mode: ModelMode, factory: str | Callable[[Dict[str, Any]], Any]) -> None:
+    """Make ``model_type`` available to configs; later registrations replace earlier ones."""
+
+    if mode not in {"series", "features"}:
+        raise ValueError(f"Unsupported model mode: {mode}")
+    _REGISTRY[model_type.lower()] = ModelSpec(mode, factory)
+
+
+def _spec_from_entry_point(entry_point: metadata.EntryPoint) -> ModelSpec:
+    target = entry_point.load()
+    if isinstance(target, ModelSpec):
+        return target
+    return ModelSpec(getattr(target, "mode", "features"), target)
+
+
+@lru_cache(maxsize=None)
+def _plugin_entry_points() -> Dict[str, metadata.EntryPoint]:
+    return {entry_point.name.lower(): entry_point for entry_point in metadata.entry_points(group=ENTRY_POINT_GROUP)}
+
+
+def _spec(model_type: str) -> ModelSpec:
+    key = model_type.lower()
+    spec = _REGISTRY.get(key)
+    if spec is None and key in _plugin_entry_points():
+        # Only the requested plugin is imported; built-in names always win.
+        spec = _REGISTRY[key] = _spec_from_entry_point(_plugin_entry_points()[key])
+    if spec is None:
+        raise ValueError(f"Unsupported model type: {model_type}")
+    return spec
+
+
+def available_models() -> List[str]:
+    """Built-in and plugin model types, without importing any model backend."""
+
+    return sorted(set(_REGISTRY) | set(_plugin_entry_points()))
+
+
+def model_mode(config: ModelConfig) -> ModelMode:
+    """Whether a model type consumes the raw series or windowed features, without building it."""
+
+    return _spec(config.type).mode
+
+
 def build_model(config: ModelConfig) -> ModelHandle:
-    model_type = config.type.lower()
-    if model_type == "ses":
-        return ModelHandle(name=config.name, mode="series", model=SESForecaster(params=config.params))
-    if model_type == "arima":
-        return ModelHandle(name=config.name, mode="series", model=ARIMAForecaster(params=config.params))
-    if model_type == "mlp":
-        return ModelHandle(name=config.name, mode="features", model=MLPForecaster(params=config.params))
-    if model_type == "lstm":
-        return ModelHandle(name=config.name, mode="features", model=LSTMForecaster(params=config.params))
-    raise ValueError(f"Unsupported model type: {config.type}")
-
-
-__all__ = ["build_model", "ModelHandle"]
+    spec = _spec(config.type)
+    return ModelHandle(name=config.name, mode=spec.mode, model=spec.load()(params=config.params))
+
+
+__all__ = [
+    "ENTRY_POINT_GROUP",
+    "MODEL_MODES",
+    "ModelHandle",
+    "ModelSpec",
+    "available_models",
+    "build_model",
+    "fit_windows",
+    "model_mode",
+    "register_model",
+]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Any, Protocol
 
 import numpy as np
 
@@ -28,3 +28,26 @@ class SklearnRegressorWrapper:
 
     def predict(self, X: np.ndarray) -> np.ndarray:
         return self.estimator.predict(X)
+
+
+def fit_windows(
+    model: Any,
+    features: np.ndarray,
+    targets: np.ndarray,
+    *,
+    channels: int = 1,
+    overlapping: bool = True,
+) -> Any:
+    """Fit ``model`` on rows from :func:`data.make_windowed_dataset`.
+
+    Tabular models see each row as a flat vector. Models that read it as a
+    sequence (``sequence_input = True``) are also told ``channels``, the
+    number of values per bar, which is the column count of a feature block.
+    They are also told whether consecutive rows are windows of one series
+    shifted by one bar (``overlapping``). That holds for a single dataset,
+    but not for windows pooled across assets.
+    """
+
+    if getattr(model, "sequence_input", False):
+        return model.fit(features, targets, channels=channels, overlapping=overlapping)
+    return model.fit(features, targets)
@@ -4,8 +4,11 @@ from typing import Any, Dict
 
 import numpy as np
 import pandas as pd
-from statsmodels.tsa.arima.model import ARIMA
-from statsmodels.tsa.holtwinters import SimpleExpSmoothing
+
+from .smoothing import fit_exponential_smoothing
+
+# statsmodels is imported inside ``fit_series`` so that importing this module
+# (e.g. for ``SeriesForecaster``) does not pay its start-up cost.
 
 
 class SeriesForecaster:
@@ -22,21 +25,111 @@ class SeriesForecaster:
             raise RuntimeError("Model has not been fit yet")
         raise NotImplementedError
 
+    def update(self, observations: pd.Series) -> "SeriesForecaster":  # pragma: no cover - abstract
+        """Absorb new observations into the fitted state without re-estimating parameters."""
+        raise NotImplementedError
+
+    def refit(self, series: pd.Series) -> "SeriesForecaster":
+        """Re-estimate parameters on ``series`` from scratch; ARIMA overrides this to warm-start."""
+        return self.fit_series(series)
+
 
 class SESForecaster(SeriesForecaster):
     def __init__(self, params: Dict[str, Any] | None = None) -> None:
         super().__init__()
         self.params = params or {}
+        self._alpha = 0.0
+        self._level = 0.0
 
     def fit_series(self, series: pd.Series) -> "SESForecaster":
+        params = dict(self.params)
+        backend = params.pop("backend", "statsmodels")
+        if backend == "numpy":
+            self.fitted_ = fit_exponential_smoothing(
+                np.asarray(series, dtype=float),
+                smoothing_level=params.get("smoothing_level"),
+            )
+            self._alpha = float(self.fitted_.alpha[0])
+            self._level = float(self.fitted_.level[0])
+            return self
+        if backend != "statsmodels":
+            raise ValueError(f"Unsupported SES backend: {backend}")
+
+        from statsmodels.tsa.holtwinters import SimpleExpSmoothing
+
         model = SimpleExpSmoothing(series, initialization_method="estimated")
-        self.fitted_ = model.fit(**self.params)
+        self.fitted_ = model.fit(**params)
+        self._alpha = float(self.fitted_.params["smoothing_level"])
+        self._level = float(np.asarray(self.fitted_.level)[-1])
+        return self
+
+    def update(self, observations: pd.Series) -> "SESForecaster":
+        if self.fitted_ is None:
+            raise RuntimeError("Call fit_series before update")
+        alpha, level = self._alpha, self._level
+        for value in np.asarray(observations, dtype=float):
+            level = alpha * value + (1.0 - alpha) * level
+        self._level = level
         return self
 
     def forecast(self, steps: int) -> np.ndarray:
         if self.fitted_ is None:
             raise RuntimeError("Call fit_series before forecast")
-        return np.asarray(self.fitted_.forecast(steps))
+        # SES forecasts are flat at the last smoothed level.
+        return np.full(steps, self._level)
+
+
+class HoltForecaster(SeriesForecaster):
+    """Holt's linear (additive) trend exponential smoothing."""
+
+    def __init__(self, params: Dict[str, Any] | None = None) -> None:
+        super().__init__()
+        self.params = params or {}
+        self._alpha = 0.0
+        self._beta = 0.0
+        self._level = 0.0
+        self._trend = 0.0
+
+    def fit_series(self, series: pd.Series) -> "HoltForecaster":
+        params = dict(self.params)
+        backend = params.pop("backend", "statsmodels")
+        if backend == "numpy":
+            self.fitted_ = fit_exponential_smoothing(
+                np.asarray(series, dtype=float),
+                trend=True,
+                smoothing_level=params.get("smoothing_level"),
+                smoothing_trend=params.get("smoothing_trend"),
+            )
+            self._alpha, self._beta = float(self.fitted_.alpha[0]), float(self.fitted_.beta[0])
+            self._level, self._trend = float(self.fitted_.level[0]), float(self.fitted_.trend[0])
+            return self
+        if backend != "statsmodels":
+            raise ValueError(f"Unsupported Holt backend: {backend}")
+
+        from statsmodels.tsa.holtwinters import Holt
+
+        self.fitted_ = Holt(series, initialization_method="estimated").fit(**params)
+        self._alpha = float(self.fitted_.params["smoothing_level"])
+        self._beta = float(self.fitted_.params["smoothing_trend"])
+        self._level = float(np.asarray(self.fitted_.level)[-1])
+        self._trend = float(np.asarray(self.fitted_.trend)[-1])
+        return self
+
+    def update(self, observations: pd.Series) -> "HoltForecaster":
+        if self.fitted_ is None:
+            raise RuntimeError("Call fit_series before update")
+        alpha, beta, level, trend = self._alpha, self._beta, self._level, self._trend
+        for value in np.asarray(observations, dtype=float):
+            previous = level
+            level = alpha * value + (1.0 - alpha) * (level + trend)
+            trend = beta * (level - previous) + (1.0 - beta) * trend
+        self._level, self._trend = level, trend
+        return self
+
+    def forecast(self, steps: int) -> np.ndarray:
+        if self.fitted_ is None:
+            raise RuntimeError("Call fit_series before forecast")
+        return self._level + self._trend * np.arange(1, steps + 1)
 
 
 class ARIMAForecaster(SeriesForecaster):
@@ -44,14 +137,33 @@ class ARIMAForecaster(SeriesForecaster):
         super().__init__()
         self.params = params or {}
 
-    def fit_series(self, series: pd.Series) -> "ARIMAForecaster":
+    def fit_series(self, series: pd.Series, start_params: np.ndarray | None = None) -> "ARIMAForecaster":
+        from statsmodels.tsa.arima.model import ARIMA
+
         order = self.params.get("order", (2, 1, 2))
-        seasonal_order = self.params.get("seasonal_order")
+        seasonal_order = self.params.get("seasonal_order") or (0, 0, 0, 0)
         trend = self.params.get("trend")
         model = ARIMA(series, order=order, seasonal_order=seasonal_order, trend=trend)
-        self.fitted_ = model.fit()
+        self.fitted_ = model.fit(start_params=start_params)
         return self
 
+    def update(self, observations: pd.Series) -> "ARIMAForecaster":
+        if self.fitted_ is None:
+            raise RuntimeError("Call fit_series before update")
+        observations = np.asarray(observations, dtype=float)
+        if self.fitted_.model.k_trend:
+            # ``extend`` restarts the trend's time index at the first new observation,
+            # so trend models re-filter the whole series with the fitted parameters.
+            self.fitted_ = self.fitted_.append(observations)
+        else:
+            # ``extend`` filters only the new observations, starting from the current state.
+            self.fitted_ = self.fitted_.extend(observations)
+        return self
+
+    def refit(self, series: pd.Series) -> "ARIMAForecaster":
+        start_params = None if self.fitted_ is None else self.fitted_.params
+        return self.fit_series(series, start_params=start_params)
+
     def forecast(self, steps: int) -> np.ndarray:
         if self.fitted_ is None:
             raise RuntimeError("Call fit_series before forecast")
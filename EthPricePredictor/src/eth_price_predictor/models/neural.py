@@ -1,76 +1,239 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
-from sklearn.neural_network import MLPRegressor
 
 from .base import SklearnRegressorWrapper
 
-try:
-    from tensorflow import keras
-except Exception:  # pragma: no cover - tensorflow optional
-    keras = None
+
+def _load_keras() -> Any:
+    # TensorFlow takes seconds to import, so only LSTM construction pays for it.
+    try:
+        from tensorflow import keras
+    except Exception as exc:  # pragma: no cover - tensorflow optional
+        raise ImportError(
+            "TensorFlow/Keras is required for the LSTM model. Install tensorflow>=2.12 to continue."
+        ) from exc
+    return keras
 
 
 class MLPForecaster(SklearnRegressorWrapper):
     """Wrapper around sklearn's MLPRegressor."""
 
     def __init__(self, params: Dict[str, Any] | None = None) -> None:
-        params = params or {}
+        from sklearn.neural_network import MLPRegressor
+
+        params = dict(params or {})
         estimator = MLPRegressor(random_state=42, max_iter=params.pop("max_iter", 500), **params)
         super().__init__(estimator=estimator)
 
 
+def _sigmoid(values: np.ndarray) -> np.ndarray:
+    return 0.5 * (np.tanh(0.5 * values) + 1.0)
+
+
+def _lstm_forward(
+    inputs: np.ndarray,
+    kernel: np.ndarray,
+    recurrent_kernel: np.ndarray,
+    bias: np.ndarray,
+    return_sequences: bool,
+) -> np.ndarray:
+    # Keras gate order is input, forget, cell, output; inputs are projected for every step at once.
+    projected = inputs @ kernel + bias
+    units = recurrent_kernel.shape[0]
+    hidden = np.zeros((inputs.shape[0], units), dtype=projected.dtype)
+    cell = np.zeros_like(hidden)
+    sequence = []
+    for step in range(inputs.shape[1]):
+        gates = projected[:, step] + hidden @ recurrent_kernel
+        cell = _sigmoid(gates[:, units : 2 * units]) * cell + _sigmoid(gates[:, :units]) * np.tanh(
+            gates[:, 2 * units : 3 * units]
+        )
+        hidden = _sigmoid(gates[:, 3 * units :]) * np.tanh(cell)
+        if return_sequences:
+            sequence.append(hidden)
+    return np.stack(sequence, axis=1) if return_sequences else hidden
+
+
+@dataclass(slots=True)
+class LSTMInference:
+    """Trained LSTM weights evaluated with NumPy, detached from TensorFlow.
+
+    Dropout is a no-op at inference, so the exported forward pass is the two
+    recurrent layers followed by the dense head.
+    """
+
+    recurrent: List[Tuple[np.ndarray, np.ndarray, np.ndarray, bool]]
+    dense_kernel: np.ndarray
+    dense_bias: np.ndarray
+    channels: int = 1
+
+    @classmethod
+    def from_keras(cls, model: Any) -> "LSTMInference":
+        keras = _load_keras()
+        recurrent, dense = [], None
+        for layer in model.layers:
+            if isinstance(layer, keras.layers.LSTM):
+                kernel, recurrent_kernel, bias = layer.get_weights()
+                recurrent.append((kernel, recurrent_kernel, bias, bool(layer.return_sequences)))
+            elif isinstance(layer, keras.layers.Dense):
+                dense = layer.get_weights()
+        channels = int(model.inputs[0].shape[-1])
+        return cls(recurrent=recurrent, dense_kernel=dense[0], dense_bias=dense[1], channels=channels)
+
+    def __call__(self, X: np.ndarray) -> np.ndarray:
+        hidden = _sequences(np.asarray(X, dtype=self.dense_kernel.dtype), self.channels)
+        for kernel, recurrent_kernel, bias, return_sequences in self.recurrent:
+            hidden = _lstm_forward(hidden, kernel, recurrent_kernel, bias, return_sequences)
+        return hidden @ self.dense_kernel + self.dense_bias
+
+
+def _sequences(X: np.ndarray, channels: int) -> np.ndarray:
+    # Window rows hold ``lookback`` bars of ``channels`` values each, flattened bar by bar.
+    return X.reshape(len(X), X.shape[1] // channels, channels)
+
+
+# Compiled training graphs per thread, keyed by architecture and input shape. Reusing one
+# skips Keras' model construction and tf.function retracing; weights and optimizer slots are
+# reset to the snapshot taken right after compilation before every fit. Only the most recently
+# used ``_GRAPH_CACHE_SIZE`` stay alive, since a search samples a new learning rate per trial.
+_GRAPHS = threading.local()
+_GRAPH_CACHE_SIZE = 4
+
+
+def _variable_values(variables: Any) -> List[np.ndarray]:
+    # Keras 2 optimizers expose ``variables`` as a method, Keras 3 as a property.
+    variables = variables() if callable(variables) else variables
+    return [np.asarray(variable.numpy()) for variable in variables]
+
+
 class LSTMForecaster:
-    """Keras based LSTM regressor for sequence data."""
+    """Keras based LSTM regressor for sequence data.
+
+    Each window row is read as ``lookback`` steps of ``channels`` values, so
+    feature blocks feed every column at every step instead of one long
+    univariate sequence.
+
+    Training streams windows through ``tf.data``, holds out the last
+    ``validation_fraction`` of them for early stopping (``patience`` epochs,
+    best weights restored) and reuses compiled graphs for identical shapes.
+    Prediction runs on the exported weights in NumPy.
+    """
+
+    # Told the window layout by :func:`base.fit_windows`.
+    sequence_input = True
 
     def __init__(self, params: Dict[str, Any] | None = None) -> None:
-        if keras is None:
-            raise ImportError(
-                "TensorFlow/Keras is required for the LSTM model. Install tensorflow>=2.12 to continue."
-            )
+        _load_keras()
         params = params or {}
         self.units = params.get("units", 64)
         self.dropout = params.get("dropout", 0.1)
         self.epochs = params.get("epochs", 40)
         self.batch_size = params.get("batch_size", 32)
         self.learning_rate = params.get("learning_rate", 1e-3)
+        self.patience = params.get("patience", 5)
+        self.validation_fraction = params.get("validation_fraction", 0.1)
         self.verbose = params.get("verbose", 0)
-        self._model: keras.Model | None = None
+        self._inference: LSTMInference | None = None
+        self._outputs = 1
+        self.channels = 1
 
-    def _build_model(self, timesteps: int) -> keras.Model:
+    def _build_model(self, timesteps: int, outputs: int = 1, channels: int = 1) -> Any:
+        keras = _load_keras()
         model = keras.Sequential(
             [
-                keras.layers.Input(shape=(timesteps, 1)),
+                keras.layers.Input(shape=(timesteps, channels)),
                 keras.layers.LSTM(self.units, return_sequences=True),
                 keras.layers.Dropout(self.dropout),
                 keras.layers.LSTM(self.units // 2 or 1),
-                keras.layers.Dense(1),
+                keras.layers.Dense(outputs),
             ]
         )
         optimizer = keras.optimizers.Adam(learning_rate=self.learning_rate)
         model.compile(optimizer=optimizer, loss="mse")
         return model
 
-    def fit(self, X: np.ndarray, y: np.ndarray) -> "LSTMForecaster":
-        X_seq = np.expand_dims(X, axis=-1)
-        timesteps = X_seq.shape[1]
-        self._model = self._build_model(timesteps)
-        self._model.fit(
-            X_seq,
-            y,
+    def _compiled_model(self, timesteps: int, outputs: int, channels: int) -> Any:
+        graphs = getattr(_GRAPHS, "models", None)
+        if graphs is None:
+            graphs = _GRAPHS.models = OrderedDict()
+        key = (timesteps, outputs, channels, self.units, self.dropout, self.learning_rate)
+        entry = graphs.get(key)
+        if entry is None:
+            model = self._build_model(timesteps, outputs, channels)
+            model.optimizer.build(model.trainable_variables)
+            entry = graphs[key] = (model, model.get_weights(), _variable_values(model.optimizer.variables))
+            while len(graphs) > _GRAPH_CACHE_SIZE:
+                graphs.popitem(last=False)
+        graphs.move_to_end(key)
+        model, weights, optimizer_state = entry
+        model.set_weights(weights)
+        variables = model.optimizer.variables
+        for variable, value in zip(variables() if callable(variables) else variables, optimizer_state):
+            variable.assign(value)
+        return model
+
+    def _dataset(self, X: np.ndarray, y: np.ndarray, overlapping: bool) -> Any:
+        import tensorflow as tf
+
+        keras = _load_keras()
+        sequences = _sequences(X, self.channels)
+        timesteps = sequences.shape[1]
+        if overlapping and len(X) > 1:
+            # Overlapping windows of one series: ship the series once and window it in the pipeline.
+            values = np.concatenate([sequences[0], sequences[1:, -1]])
+            dataset = keras.utils.timeseries_dataset_from_array(
+                values, y, sequence_length=timesteps, batch_size=self.batch_size, shuffle=False
+            )
+        else:
+            dataset = tf.data.Dataset.from_tensor_slices((sequences, y)).batch(self.batch_size)
+        return dataset.prefetch(tf.data.AUTOTUNE)
+
+    def fit(self, X: np.ndarray, y: np.ndarray, *, channels: int = 1, overlapping: bool = False) -> "LSTMForecaster":
+        """Train on window rows of ``channels`` values per bar (see :func:`base.fit_windows`).
+
+        ``overlapping`` promises that each row is the previous one shifted by a
+        bar, so the series is shipped to ``tf.data`` once instead of per window.
+        """
+
+        keras = _load_keras()
+        X = np.asarray(X, dtype=np.float32)
+        y = np.asarray(y, dtype=np.float32)
+        if X.shape[1] % channels:
+            raise ValueError(f"Window width {X.shape[1]} is not a multiple of {channels} channels")
+        self.channels = channels
+        # A 2-D ``y`` (one column per horizon) trains a single multi-output head.
+        self._outputs = 1 if y.ndim == 1 else y.shape[1]
+        model = self._compiled_model(X.shape[1] // channels, self._outputs, channels)
+
+        held_out = int(len(X) * self.validation_fraction)
+        validation = None
+        if held_out and len(X) - held_out > 0:
+            validation = self._dataset(X[-held_out:], y[-held_out:], overlapping)
+            X, y = X[:-held_out], y[:-held_out]
+        stopping = keras.callbacks.EarlyStopping(
+            monitor="val_loss" if validation is not None else "loss",
+            patience=self.patience,
+            restore_best_weights=True,
+        )
+        model.fit(
+            self._dataset(X, y, overlapping),
+            validation_data=validation,
             epochs=self.epochs,
-            batch_size=self.batch_size,
-            verbose=self.verbose,
             shuffle=False,
-            validation_split=0.1,
+            verbose=self.verbose,
+            callbacks=[stopping],
         )
+        self._inference = LSTMInference.from_keras(model)
         return self
 
     def predict(self, X: np.ndarray) -> np.ndarray:
-        if self._model is None:
+        if self._inference is None:
             raise RuntimeError("Model must be fit before calling predict")
-        X_seq = np.expand_dims(X, axis=-1)
-        preds = self._model.predict(X_seq, verbose=0)
-        return preds.ravel()
+        preds = self._inference(X)
+        return preds.ravel() if self._outputs == 1 else preds
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence, Tuple
+
+import numpy as np
+
+_GOLDEN = (np.sqrt(5.0) - 1.0) / 2.0
+# Coarse grid points per free parameter, used to bracket the optimum before refining.
+_COARSE_POINTS = 11
+
+
+@dataclass(slots=True)
+class SmoothingFit:
+    """Fitted simple (``trend is None``) or Holt linear exponential smoothing for a batch of series."""
+
+    alpha: np.ndarray
+    beta: np.ndarray | None
+    initial_level: np.ndarray
+    initial_trend: np.ndarray | None
+    level: np.ndarray
+    trend: np.ndarray | None
+    sse: np.ndarray
+
+    def forecast(self, steps: int) -> np.ndarray:
+        """Forecasts of shape ``(n_series, steps)`` from the end of each series."""
+
+        horizon = np.arange(1, steps + 1)
+        if self.trend is None:
+            return np.repeat(self.level[:, None], steps, axis=1)
+        return self.level[:, None] + self.trend[:, None] * horizon
+
+
+def _as_batch(values: np.ndarray | Sequence[np.ndarray]) -> np.ndarray:
+    if isinstance(values, np.ndarray) and values.ndim <= 2:
+        return np.atleast_2d(np.asarray(values, dtype=float))
+    series = [np.asarray(row, dtype=float).ravel() for row in values]
+    length = max(len(row) for row in series)
+    # Ragged input is left-padded with NaN; state is frozen across missing values.
+    batch = np.full((len(series), length), np.nan)
+    for position, row in enumerate(series):
+        batch[position, length - len(row) :] = row
+    return batch
+
+
+def _ses_sums(y: np.ndarray, alpha: np.ndarray, gaps: bool) -> Tuple[np.ndarray, ...]:
+    # Level driven by the data from l0 = 0, plus the weight (1 - alpha)^t that l0 carries; the
+    # weight is data-independent, so candidates shared across series (shape (1, k)) compute it once.
+    shape = np.broadcast_shapes(y[:, :1].shape, alpha.shape)
+    weight_shape = shape if gaps else alpha.shape
+    level = np.zeros(shape)
+    weight = np.ones(weight_shape)
+    decay = 1.0 - alpha
+    rr = np.zeros(shape)
+    rw = np.zeros(shape)
+    ww = np.zeros(weight_shape)
+    for t in range(y.shape[1]):
+        column = y[:, t : t + 1]
+        residual = column - level
+        if gaps:
+            observed = ~np.isnan(column)
+            residual = np.where(observed, residual, 0.0)
+            step_weight = np.where(observed, weight, 0.0)
+            step_decay = np.where(observed, decay, 1.0)
+        else:
+            step_weight, step_decay = weight, decay
+        rr += residual * residual
+        rw += residual * step_weight
+        ww += step_weight * step_weight
+        level += alpha * residual
+        weight *= step_decay
+    return rr, rw, ww, level, weight
+
+
+def _holt_sums(y: np.ndarray, alpha: np.ndarray, beta: np.ndarray, gaps: bool) -> Tuple[np.ndarray, ...]:
+    # The data-driven system starts from a zero state; the unit initial level/trend responses do not
+    # depend on the data, so with candidates shared across series (shape (1, k)) they are run once.
+    shape = np.broadcast_shapes(y[:, :1].shape, alpha.shape)
+    unit_shape = (2,) + alpha.shape if not gaps else (2,) + shape
+    level, slope = np.zeros(shape), np.zeros(shape)
+    unit_level, unit_slope = np.zeros(unit_shape), np.zeros(unit_shape)
+    unit_level[0] = 1.0
+    unit_slope[1] = 1.0
+    rr, rc, rd = np.zeros(shape), np.zeros(shape), np.zeros(shape)
+    cc, cd, dd = np.zeros(unit_shape[1:]), np.zeros(unit_shape[1:]), np.zeros(unit_shape[1:])
+    keep = 1.0 - alpha
+    for t in range(y.shape[1]):
+        column = y[:, t : t + 1]
+        predicted = level + slope
+        unit_predicted = unit_level + unit_slope
+        residual = column - predicted
+        c, d = unit_predicted
+        if gaps:
+            observed = ~np.isnan(column)
+            residual = np.where(observed, residual, 0.0)
+            c, d = np.where(observed, c, 0.0), np.where(observed, d, 0.0)
+        rr += residual * residual
+        rc += residual * c
+        rd += residual * d
+        cc += c * c
+        cd += c * d
+        dd += d * d
+        # l_t = l_{t-1} + b_{t-1} + alpha * e_t; the unit systems see no data, so e_t = -prediction.
+        new_level = predicted + alpha * residual
+        new_unit_level = unit_predicted * keep
+        new_slope = slope + beta * (new_level - level - slope)
+        new_unit_slope = unit_slope + beta * (new_unit_level - unit_level - unit_slope)
+        if gaps:
+            new_level, new_slope = np.where(observed, new_level, level), np.where(observed, new_slope, slope)
+            new_unit_level = np.where(observed, new_unit_level, unit_level)
+            new_unit_slope = np.where(observed, new_unit_slope, unit_slope)
+        level, slope, unit_level, unit_slope = new_level, new_slope, new_unit_level, new_unit_slope
+    return rr, rc, rd, cc, cd, dd, (level, *unit_level), (slope, *unit_slope)
+
+
+def _evaluate(y: np.ndarray, alpha: np.ndarray, beta: np.ndarray | None, gaps: bool) -> Tuple[np.ndarray, ...]:
+    """SSE for each (series, candidate) with the least-squares initial state solved in closed form.
+
+    The recursions are linear in the initial state, so one-step errors are
+    ``r - c * l0 - d * b0`` where ``r`` comes from a zero start and ``c``/``d``
+    are the responses to a unit initial level/trend. Returns
+    ``(sse, l0, b0, final_level, final_trend)``.
+    """
+
+    if beta is None:
+        rr, rw, ww, level, weight = _ses_sums(y, alpha, gaps)
+        l0 = rw / np.maximum(ww, 1e-300)
+        sse = rr - l0 * rw
+        return np.maximum(sse, 0.0), l0, np.zeros_like(l0), level + weight * l0, None
+    rr, rc, rd, cc, cd, dd, level, slope = _holt_sums(y, alpha, beta, gaps)
+    det = cc * dd - cd * cd
+    usable = det > 1e-12 * np.maximum(cc * dd, 1e-300)
+    safe = np.where(usable, det, 1.0)
+    l0 = np.where(usable, (rc * dd - rd * cd) / safe, rc / np.maximum(cc, 1e-300))
+    b0 = np.where(usable, (rd * cc - rc * cd) / safe, 0.0)
+    sse = rr - 2 * (l0 * rc + b0 * rd) + l0 * l0 * cc + 2 * l0 * b0 * cd + b0 * b0 * dd
+    final_level = level[0] + level[1] * l0 + level[2] * b0
+    final_trend = slope[0] + slope[1] * l0 + slope[2] * b0
+    return np.maximum(sse, 0.0), l0, b0, final_level, final_trend
+
+
+def _golden_section(objective, lower: np.ndarray, upper: np.ndarray, tol: float) -> np.ndarray:
+    """Minimise ``objective`` (vectorised over series) independently on each ``[lower, upper]``."""
+
+    inner_low = upper - _GOLDEN * (upper - lower)
+    inner_high = lower + _GOLDEN * (upper - lower)
+    f_low, f_high = objective(inner_low), objective(inner_high)
+    while np.max(upper - lower) > tol:
+        # Keep the better half; the surviving inner point is reused and one new probe is evaluated.
+        go_left = f_low < f_high
+        upper = np.where(go_left, inner_high, upper)
+        lower = np.where(go_left, lower, inner_low)
+        probe = np.where(go_left, upper - _GOLDEN * (upper - lower), lower + _GOLDEN * (upper - lower))
+        f_probe = objective(probe)
+        inner_low, inner_high, f_low, f_high = (
+            np.where(go_left, probe, inner_high),
+            np.where(go_left, inner_low, probe),
+            np.where(go_left, f_probe, f_high),
+            np.where(go_left, f_low, f_probe),
+        )
+    return np.where(f_low < f_high, inner_low, inner_high)
+
+
+def fit_exponential_smoothing(
+    values: np.ndarray | Sequence[np.ndarray],
+    trend: bool = False,
+    smoothing_level: float | None = None,
+    smoothing_trend: float | None = None,
+    tol: float = 1e-5,
+) -> SmoothingFit:
+    """Fit SES (or Holt's additive trend with ``trend=True``) to many series at once.
+
+    ``values`` is an ``(n_series, n_obs)`` array or a list of 1-D arrays of any
+    length. Parameters minimise the one-step squared error like statsmodels'
+    ``initialization_method="estimated"``: for any smoothing values the initial
+    level/trend are solved exactly, a coarse grid brackets the optimum and
+    golden-section search (SES) or a compass search (Holt) refines it, with
+    every series advanced in the same pass over time. Fixed
+    ``smoothing_level``/``smoothing_trend`` are used as given.
+    """
+
+    y = _as_batch(values)
+    gaps = bool(np.isnan(y).any())
+    rows = np.arange(y.shape[0])
+    alpha = np.full(y.shape[0], 0.5 if smoothing_level is None else float(smoothing_level))
+    beta = np.full(y.shape[0], 0.5 if smoothing_trend is None else float(smoothing_trend)) if trend else None
+    grid = np.linspace(0.0, 1.0, _COARSE_POINTS)
+    spacing = grid[1] - grid[0]
+
+    def sse(alphas: np.ndarray, betas: np.ndarray | None, subset: np.ndarray | slice = slice(None)) -> np.ndarray:
+        return _evaluate(y[subset], alphas, betas, gaps)[0]
+
+    if not trend and smoothing_level is None:
+        coarse = sse(grid[None, :], None)
+        centre = grid[np.argmin(coarse, axis=1)]
+        alpha = _golden_section(
+            lambda a: sse(a[:, None], None)[:, 0],
+            np.clip(centre - spacing, 0.0, 1.0),
+            np.clip(centre + spacing, 0.0, 1.0),
+            tol,
+        )
+    elif trend and (smoothing_level is None or smoothing_trend is None):
+        alpha_axis = grid if smoothing_level is None else np.array([alpha[0]])
+        beta_axis = grid if smoothing_trend is None else np.array([beta[0]])
+        pairs = np.array([(a, b) for a in alpha_axis for b in beta_axis])
+        coarse = np.broadcast_to(sse(pairs[None, :, 0], pairs[None, :, 1]), (y.shape[0], len(pairs)))
+        best = pairs[np.argmin(coarse, axis=1)]
+        alpha, beta = best[:, 0].copy(), best[:, 1].copy()
+        current = coarse[rows, np.argmin(coarse, axis=1)].copy()
+        moves = [
+            (da, db)
+            for da, db in ((1, 0), (-1, 0), (0, 1), (0, -1))
+            if (da == 0 or smoothing_level is None) and (db == 0 or smoothing_trend is None)
+        ]
+        step = np.full(y.shape[0], spacing / 2)
+        while True:
+            # Compass search: try each axis neighbour, move on improvement, otherwise halve the step.
+            active = np.flatnonzero(step > tol)
+            if not active.size:
+                break
+            offsets = step[active, None]
+            trial_alpha = np.clip(alpha[active, None] + offsets * [m[0] for m in moves], 0.0, 1.0)
+            trial_beta = np.clip(beta[active, None] + offsets * [m[1] for m in moves], 0.0, 1.0)
+            trial = sse(trial_alpha, trial_beta, active)
+            pick = np.argmin(trial, axis=1)
+            within = np.arange(active.size)
+            better = trial[within, pick] < current[active]
+            alpha[active] = np.where(better, trial_alpha[within, pick], alpha[active])
+            beta[active] = np.where(better, trial_beta[within, pick], beta[active])
+            current[active] = np.where(better, trial[within, pick], current[active])
+            step[active] = np.where(better, step[active], step[active] / 2)
+
+    final_sse, l0, b0, level, slope = _evaluate(
+        y, alpha[:, None], None if beta is None else beta[:, None], gaps
+    )
+    return SmoothingFit(
+        alpha=alpha,
+        beta=beta,
+        initial_level=l0[:, 0],
+        initial_trend=b0[:, 0] if trend else None,
+        level=level[:, 0],
+        trend=slope[:, 0] if trend else None,
+        sse=final_sse[:, 0],
+    )
+
+
+__all__ = ["SmoothingFit", "fit_exponential_smoothing"]
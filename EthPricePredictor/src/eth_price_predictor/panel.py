@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Any, Dict, List, Mapping, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import HorizonConfig, ModelConfig
+from .data import WindowedDataset, make_windowed_dataset
+from .metrics import compute_regression_metrics
+from .models import build_model, fit_windows
+from .models.smoothing import fit_exponential_smoothing
+from .profiling import stage
+
+
+def _standardise(dataset: WindowedDataset, mean: float, scale: float) -> Tuple[np.ndarray, np.ndarray]:
+    return (dataset.features - mean) / scale, (dataset.targets - mean) / scale
+
+
+def run_pooled(
+    model_cfg: ModelConfig,
+    horizon: HorizonConfig,
+    panel: Mapping[str, pd.Series],
+    feature_dtype: str = "float64",
+) -> Tuple[List[Dict[str, Any]], Dict[str, np.ndarray], Any]:
+    """Train one feature-mode model on the windows of every asset and score it per asset.
+
+    Each asset is standardised with the mean/std of its own training targets so
+    assets priced in different ranges share one model; predictions are mapped
+    back to price space before the per-asset metrics are computed.
+    """
+
+    splits = {}
+    for asset, series in panel.items():
+        with stage("window"):
+            dataset = make_windowed_dataset(
+                series,
+                lookback=horizon.lookback,
+                horizon=horizon.steps_ahead,
+                dtype=feature_dtype,
+            )
+        with stage("split"):
+            train_ds, test_ds = dataset.split(horizon.test_size)
+        mean = float(np.mean(train_ds.targets))
+        scale = float(np.std(train_ds.targets)) or 1.0
+        splits[asset] = (train_ds, test_ds, mean, scale)
+
+    start = perf_counter()
+    train_parts = [_standardise(train_ds, mean, scale) for train_ds, _, mean, scale in splits.values()]
+    features = np.concatenate([part[0] for part in train_parts])
+    targets = np.concatenate([part[1] for part in train_parts])
+    handle = build_model(model_cfg)
+    with stage("fit"):
+        # Windows of different assets are stacked, so a row does not continue the one before it.
+        fit_windows(handle.model, features, targets, overlapping=False)
+
+    predictions = {}
+    with stage("predict"):
+        for asset, (_, test_ds, mean, scale) in splits.items():
+            test_features, _ = _standardise(test_ds, mean, scale)
+            predictions[asset] = np.asarray(handle.model.predict(test_features)) * scale + mean
+    # One fit serves every asset, so report its cost amortised across them.
+    duration = (perf_counter() - start) / len(splits)
+
+    records = []
+    for asset, (_, test_ds, _, _) in splits.items():
+        with stage("metrics"):
+            record = compute_regression_metrics(
+                test_ds.targets,
+                predictions[asset],
+                reference=test_ds.features[:, -1],
+            )
+        record.update(
+            {
+                "model": handle.name,
+                "horizon": f"{horizon.steps_ahead}d",
+                "runtime_sec": duration,
+                "asset": asset,
+                "pooled": True,
+            }
+        )
+        records.append(record)
+    return records, predictions, handle.model
+
+
+BATCHED_SMOOTHING = {"ses": False, "holt": True}
+
+
+def supports_batched_fit(model_cfg: ModelConfig) -> bool:
+    """Whether every asset's series can be fit in one call of the NumPy smoothing engine."""
+
+    return model_cfg.type.lower() in BATCHED_SMOOTHING and model_cfg.params.get("backend") == "numpy"
+
+
+def run_batched_smoothing(
+    model_cfg: ModelConfig,
+    horizon: HorizonConfig,
+    panel: Mapping[str, pd.Series],
+    feature_dtype: str = "float64",
+) -> Tuple[List[Dict[str, Any]], Dict[str, np.ndarray], Any]:
+    """Fit SES/Holt to every asset's training history in one vectorised pass and score it per asset.
+
+    Each series keeps its own smoothing parameters; batching only shares the
+    pass over time, so results match fitting the assets one by one.
+    """
+
+    splits = {}
+    for asset, series in panel.items():
+        with stage("window"):
+            dataset = make_windowed_dataset(
+                series,
+                lookback=horizon.lookback,
+                horizon=horizon.steps_ahead,
+                dtype=feature_dtype,
+            )
+        with stage("split"):
+            train_ds, test_ds = dataset.split(horizon.test_size)
+            history = series.loc[: train_ds.indices[-1]].to_numpy(dtype=float)
+        splits[asset] = (history, test_ds)
+
+    params = model_cfg.params
+    start = perf_counter()
+    with stage("fit"):
+        fit = fit_exponential_smoothing(
+            [history for history, _ in splits.values()],
+            trend=BATCHED_SMOOTHING[model_cfg.type.lower()],
+            smoothing_level=params.get("smoothing_level"),
+            smoothing_trend=params.get("smoothing_trend"),
+        )
+    with stage("predict"):
+        forecasts = fit.forecast(max(len(test_ds.targets) for _, test_ds in splits.values()))
+    duration = (perf_counter() - start) / len(splits)
+
+    predictions = {}
+    records = []
+    for row, (asset, (_, test_ds)) in enumerate(splits.items()):
+        predictions[asset] = forecasts[row, : len(test_ds.targets)]
+        with stage("metrics"):
+            record = compute_regression_metrics(
+                test_ds.targets,
+                predictions[asset],
+                reference=test_ds.features[:, -1],
+            )
+        record.update(
+            {
+                "model": model_cfg.name,
+                "horizon": f"{horizon.steps_ahead}d",
+                "runtime_sec": duration,
+                "asset": asset,
+                "batched": True,
+            }
+        )
+        records.append(record)
+    return records, predictions, fit
+
+
+__all__ = ["run_batched_smoothing", "run_pooled", "supports_batched_fit"]
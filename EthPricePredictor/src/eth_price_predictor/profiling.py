@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import warnings
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import ContextManager, Iterator, List, Sequence
+
+import pandas as pd
+
+_CURRENT: ContextVar["StageRecorder | None"] = ContextVar("eth_price_predictor_stage_recorder", default=None)
+
+# Pipeline stages in execution order; used to order the summary table.
+STAGES = ("load", "resample", "window", "split", "fit", "predict", "backtest", "metrics")
+
+
+@dataclass(slots=True)
+class StageEvent:
+    """Wall/CPU time and peak memory of one stage execution."""
+
+    stage: str
+    label: str
+    start: float
+    wall_sec: float
+    cpu_sec: float
+    peak_mem_bytes: int | None
+    pid: int
+    thread: int
+
+
+def _read_rss_bytes() -> int | None:
+    try:
+        with open("/proc/self/statm", "rb") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+
+        # ru_maxrss is the lifetime peak (KiB on Linux, bytes on macOS); best effort elsewhere.
+        peak = int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+        return peak if sys.platform == "darwin" else peak * 1024
+    except ImportError:  # pragma: no cover - Windows
+        return None
+
+
+class _RssSampler:
+    """Background thread recording the maximum RSS seen while a stage runs."""
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self.peak = _read_rss_bytes()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def _sample(self) -> None:
+        current = _read_rss_bytes()
+        if current is not None and (self.peak is None or current > self.peak):
+            self.peak = current
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+
+@dataclass(slots=True)
+class StageRecorder:
+    """Collects :class:`StageEvent` records for code running under :meth:`activate`.
+
+    ``memory`` selects peak-memory tracking: ``"tracemalloc"`` (Python heap,
+    precise but slows allocation) or ``"rss"`` (sampled resident set size),
+    or ``None`` to skip it. Both measure the whole process, so peaks are only
+    attributable to a stage when nothing else runs alongside it.
+    """
+
+    memory: str | None = "rss"
+    label: str = ""
+    events: List[StageEvent] = field(default_factory=list)
+    _peaks: List[int] = field(default_factory=list)
+
+    @contextmanager
+    def activate(self, label: str | None = None) -> Iterator["StageRecorder"]:
+        previous_label = self.label
+        if label is not None:
+            self.label = label
+        token = _CURRENT.set(self)
+        started_tracing = self.memory == "tracemalloc" and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        try:
+            yield self
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+            _CURRENT.reset(token)
+            self.label = previous_label
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start_wall = time.time()
+        start_perf = time.perf_counter()
+        start_cpu = time.process_time()
+        sampler = _RssSampler() if self.memory == "rss" else None
+        tracing = self.memory == "tracemalloc" and tracemalloc.is_tracing()
+        if tracing:
+            # reset_peak() would hide the enclosing stage's peak, so fold it in first.
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            self._peaks.append(0)
+        if sampler is not None:
+            sampler.start()
+        try:
+            yield
+        finally:
+            peak: int | None = None
+            if sampler is not None:
+                sampler.stop()
+                peak = sampler.peak
+            if tracing:
+                peak = max(self._peaks.pop(), tracemalloc.get_traced_memory()[1])
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+            self._record(name, start_wall, start_perf, start_cpu, peak)
+
+    def _record(self, name: str, start_wall: float, start_perf: float, start_cpu: float, peak: int | None) -> None:
+        self.events.append(
+            StageEvent(
+                stage=name,
+                label=self.label,
+                start=start_wall,
+                wall_sec=time.perf_counter() - start_perf,
+                cpu_sec=time.process_time() - start_cpu,
+                peak_mem_bytes=peak,
+                pid=os.getpid(),
+                thread=threading.get_ident(),
+            )
+        )
+
+
+def stage(name: str) -> ContextManager[None]:
+    """Time ``name`` on the active recorder, or do nothing when profiling is off."""
+
+    recorder = _CURRENT.get()
+    if recorder is None:
+        return nullcontext()
+    return recorder.stage(name)
+
+
+@contextmanager
+def task_profiler(kind: str | None, destination: Path | None) -> Iterator[None]:
+    """Optionally wrap a task in cProfile (``.prof``) or pyinstrument (``.html``) capture."""
+
+    if kind is None or destination is None:
+        yield
+        return
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    if kind == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            warnings.warn("pyinstrument is not installed; falling back to cProfile", RuntimeWarning, stacklevel=3)
+            kind = "cprofile"
+        else:
+            profiler = Profiler()
+            profiler.start()
+            try:
+                yield
+            finally:
+                profiler.stop()
+                destination.with_suffix(".html").write_text(profiler.output_html(), encoding="utf-8")
+            return
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(str(destination.with_suffix(".prof")))
+
+
+def write_trace(events: Sequence[StageEvent], path: Path) -> Path:
+    """Write events in Chrome trace-event format (open in chrome://tracing or Perfetto)."""
+
+    trace = {
+        "traceEvents": [
+            {
+                "name": event.stage,
+                "cat": event.label or "pipeline",
+                "ph": "X",
+                "ts": event.start * 1e6,
+                "dur": event.wall_sec * 1e6,
+                "pid": event.pid,
+                "tid": event.thread,
+                "args": asdict(event),
+            }
+            for event in events
+        ],
+        "displayTimeUnit": "ms",
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(trace), encoding="utf-8")
+    return path
+
+
+def load_trace(path: Path) -> List[StageEvent]:
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    return [StageEvent(**entry["args"]) for entry in payload.get("traceEvents", [])]
+
+
+def summarize_trace(events: Sequence[StageEvent]) -> pd.DataFrame:
+    """Aggregate events per stage: count, total/mean wall and CPU seconds, max peak memory (MiB)."""
+
+    frame = pd.DataFrame.from_records([asdict(event) for event in events])
+    if frame.empty:
+        return frame
+    summary = frame.groupby("stage").agg(
+        calls=("wall_sec", "size"),
+        wall_total_sec=("wall_sec", "sum"),
+        wall_mean_sec=("wall_sec", "mean"),
+        cpu_total_sec=("cpu_sec", "sum"),
+        peak_mem_mib=("peak_mem_bytes", "max"),
+    )
+    summary["peak_mem_mib"] = summary["peak_mem_mib"] / 1024**2
+    order = {name: position for position, name in enumerate(STAGES)}
+    return summary.sort_index(key=lambda index: index.map(lambda name: order.get(name, len(order))))
+
+
+__all__ = [
+    "STAGES",
+    "StageEvent",
+    "StageRecorder",
+    "load_trace",
+    "stage",
+    "summarize_trace",
+    "task_profiler",
+    "write_trace",
+]
@@ -1,16 +1,32 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import warnings
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, field, replace
 from pathlib import Path
 from time import perf_counter
-from typing import Dict, List
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
-from .config import RunConfig
-from .data import load_price_history, make_windowed_dataset
+from .backtest import walk_forward_forecast
+from .cache import CacheEntry, ResultCache, hash_series, make_cache_key
+from .config import BacktestConfig, FeatureConfig, HorizonConfig, ModelConfig, ProfilingConfig, RunConfig
+from .data import load_long_panel, load_price_history, make_windowed_dataset
+from .features import build_feature_frame
+from .ledger import ExperimentLedger
 from .metrics import compute_regression_metrics
-from .models import ModelHandle, build_model
+from .model_store import ModelMetadata, save_model
+from .models import ModelHandle, build_model, fit_windows, model_mode
 from .models.classical import SeriesForecaster
+from .multi_horizon import run_direct
+from .panel import run_batched_smoothing, run_pooled, supports_batched_fit
+from .profiling import StageEvent, StageRecorder, stage, task_profiler, write_trace
+from .scheduler import TaskOutcome, run_tasks
+from .shared import SharedPanel, uses_worker_processes
 
 
 def _run_single_model(
@@ -21,18 +37,40 @@ def _run_single_model(
     test_features,
     test_targets,
     history_series,
-) -> Dict[str, float]:
+    *,
+    series: pd.Series | None = None,
+    test_indices: pd.DatetimeIndex | None = None,
+    steps_ahead: int = 1,
+    backtest: BacktestConfig | None = None,
+    channels: int = 1,
+) -> Tuple[Dict[str, float], np.ndarray]:
     start = perf_counter()
     if handle.mode == "features":
         model = handle.model
-        model.fit(train_features, train_targets)
-        predictions = model.predict(test_features)
+        with stage("fit"):
+            fit_windows(model, train_features, train_targets, channels=channels)
+        with stage("predict"):
+            predictions = model.predict(test_features)
     else:
         assert isinstance(handle.model, SeriesForecaster)
-        handle.model.fit_series(history_series)
-        predictions = handle.model.forecast(len(test_targets))
+        if backtest is not None and backtest.mode == "walk_forward":
+            with stage("backtest"):
+                predictions = walk_forward_forecast(
+                    handle.model,
+                    series,
+                    test_indices,
+                    steps_ahead,
+                    refit_every=backtest.refit_every,
+                )
+        else:
+            with stage("fit"):
+                handle.model.fit_series(history_series)
+            with stage("predict"):
+                predictions = handle.model.forecast(len(test_targets))
     duration = perf_counter() - start
-    metrics = compute_regression_metrics(test_targets, predictions)
+    with stage("metrics"):
+        # The last lookback value is the observation at each forecast origin.
+        metrics = compute_regression_metrics(test_targets, predictions, reference=test_features[:, -1])
     metrics.update(
         {
             "model": handle.name,
@@ -40,45 +78,471 @@ def _run_single_model(
             "runtime_sec": duration,
         }
     )
-    return metrics
+    return metrics, np.asarray(predictions)
 
 
-def run_experiments(config: RunConfig) -> pd.DataFrame:
-    """Execute the configured experiment suite and persist aggregated metrics."""
+@dataclass(slots=True)
+class ExperimentTask:
+    """One (horizon, model) cell of the experiment grid.
 
-    df = load_price_history(config.data_path, config.frequency)
-    if config.target_column not in df.columns:
-        raise ValueError(f"Column {config.target_column!r} not found in dataset")
-    series = df[config.target_column].dropna()
+    ``assets`` names the panel series the cell covers: ``(None,)`` for a
+    single-series run, one asset for per-asset fits, or every asset when a
+    feature-mode model is trained pooled across the panel (or a NumPy SES/Holt
+    model fits all assets in one batch). A non-empty ``horizons`` makes the
+    cell cover all of them: a direct multi-output fit for feature-mode models,
+    or one series model grown across the horizons' histories.
+    """
 
-    records: List[Dict[str, float]] = []
-    for horizon in config.horizons:
-        dataset = make_windowed_dataset(series, lookback=horizon.lookback, horizon=horizon.steps_ahead)
+    horizon: HorizonConfig
+    model: ModelConfig
+    feature_dtype: str = "float64"
+    backtest: BacktestConfig = field(default_factory=BacktestConfig)
+    assets: Tuple[str | None, ...] = (None,)
+    cache_dir: Path | None = None
+    cache_key: str | None = None
+    refresh_cache: bool = False
+    profiling: ProfilingConfig | None = None
+    profile_dir: Path | None = None
+    horizons: Tuple[HorizonConfig, ...] = ()
+    features: Tuple[FeatureConfig, ...] = ()
+    model_store_dir: Path | None = None
+
+    @property
+    def label(self) -> str:
+        horizons = self.horizons or (self.horizon,)
+        parts = [self.model.name, "+".join(f"{horizon.steps_ahead}d" for horizon in horizons)]
+        if self.assets != (None,):
+            parts.append("+".join(str(asset) for asset in self.assets))
+        return "-".join(parts)
+
+
+def _task_fingerprint(task: ExperimentTask) -> Dict[str, Any]:
+    return {
+        "horizon": asdict(task.horizon),
+        "model": asdict(task.model),
+        "feature_dtype": task.feature_dtype,
+        "backtest": asdict(task.backtest),
+        "assets": list(task.assets),
+        "horizons": [asdict(horizon) for horizon in task.horizons],
+    }
+
+
+def _target(data: pd.Series | pd.DataFrame) -> pd.Series:
+    # Feature blocks carry the target as their last column.
+    return data if isinstance(data, pd.Series) else data.iloc[:, -1]
+
+
+def _cell_key(task: ExperimentTask, data_hash: str) -> str:
+    # A resumed run only reuses cells computed from the same data and feature set.
+    document = {
+        "task": _task_fingerprint(task),
+        "data": data_hash,
+        "features": [asdict(feature) for feature in task.features],
+    }
+    encoded = json.dumps(document, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def _run_cell(task: ExperimentTask, data: pd.Series | pd.DataFrame) -> Tuple[Dict[str, Any], np.ndarray, Any]:
+    # Windows are strided views over ``data``, so rebuilding them per task is
+    # cheaper than shipping materialised feature matrices to each worker.
+    horizon = task.horizon
+    series = _target(data)
+    with stage("window"):
+        dataset = make_windowed_dataset(
+            data if model_mode(task.model) == "features" else series,
+            lookback=horizon.lookback,
+            horizon=horizon.steps_ahead,
+            dtype=task.feature_dtype,
+        )
+    with stage("split"):
         train_ds, test_ds = dataset.split(horizon.test_size)
-        horizon_name = f"{horizon.steps_ahead}d"
         history_series = series.loc[: train_ds.indices[-1]]
+    handle = build_model(task.model)
+    record, predictions = _run_single_model(
+        handle,
+        f"{horizon.steps_ahead}d",
+        train_ds.features,
+        train_ds.targets,
+        test_ds.features,
+        test_ds.targets,
+        history_series,
+        series=series,
+        test_indices=test_ds.indices,
+        steps_ahead=horizon.steps_ahead,
+        backtest=task.backtest,
+        channels=1 if isinstance(data, pd.Series) else data.shape[1],
+    )
+    return record, predictions, handle.model
+
+
+def _run_series_group(
+    task: ExperimentTask,
+    series: pd.Series,
+) -> Tuple[List[Dict[str, Any]], Dict[str, np.ndarray], Any]:
+    # Histories of different horizons share a prefix and differ only by their last
+    # ``test_size`` gap, so fit on the shortest one and grow it horizon by horizon.
+    plans = []
+    for horizon in task.horizons:
+        with stage("window"):
+            dataset = make_windowed_dataset(
+                series,
+                lookback=horizon.lookback,
+                horizon=horizon.steps_ahead,
+                dtype=task.feature_dtype,
+            )
+        with stage("split"):
+            train_ds, test_ds = dataset.split(horizon.test_size)
+        plans.append((series.index.get_loc(train_ds.indices[-1]), horizon, test_ds))
+    plans.sort(key=lambda plan: plan[0])
+
+    handle = build_model(task.model)
+    model = handle.model
+    assert isinstance(model, SeriesForecaster)
+    records, predictions = [], {}
+    fitted_end = None
+    for end, horizon, test_ds in plans:
+        name = f"{horizon.steps_ahead}d"
+        start = perf_counter()
+        with stage("fit"):
+            if fitted_end is None:
+                model.fit_series(series.iloc[: end + 1])
+            elif end > fitted_end and task.backtest.series_fits == "shared_prefix":
+                model.update(series.iloc[fitted_end + 1 : end + 1])
+            elif end > fitted_end:
+                model.refit(series.iloc[: end + 1])
+        fitted_end = end
+        with stage("predict"):
+            predictions[name] = np.asarray(model.forecast(len(test_ds.targets)))
+        duration = perf_counter() - start
+        with stage("metrics"):
+            record = compute_regression_metrics(test_ds.targets, predictions[name], reference=test_ds.features[:, -1])
+        record.update({"model": handle.name, "horizon": name, "runtime_sec": duration})
+        records.append(record)
+    return records, predictions, model
+
+
+def _training_end(task: ExperimentTask, index: pd.Index) -> pd.Timestamp:
+    # Every cell trains on data ending right before its test window: the shortest one
+    # for a shared series fit, the longest one for a direct multi-output fit.
+    if not task.horizons:
+        return index[-task.horizon.test_size - 1]
+    sizes = [horizon.test_size for horizon in task.horizons]
+    return index[-(min(sizes) if model_mode(task.model) == "series" else max(sizes)) - 1]
+
+
+def _persist_model(task: ExperimentTask, panel: Mapping[str | None, pd.Series | pd.DataFrame], model: Any) -> None:
+    # Pooled/batched models span several assets and walk-forward models end past their
+    # training window, so only single-asset single-origin fits are saved.
+    if task.model_store_dir is None or model is None or len(task.assets) != 1:
+        return
+    if task.backtest.mode != "single_origin":
+        return
+    data = panel[task.assets[0]]
+    training_end = _training_end(task, data.index)
+    metadata = ModelMetadata(
+        model=task.model,
+        mode=model_mode(task.model),
+        horizons=list(task.horizons or (task.horizon,)),
+        training_end=str(training_end),
+        data_hash=hash_series(data.loc[:training_end]),
+        asset=task.assets[0],
+        features=list(task.features),
+        feature_dtype=task.feature_dtype,
+    )
+    save_model(task.model_store_dir, model, metadata)
+
+
+def _evaluate_task(task: ExperimentTask, panel: Mapping[str | None, pd.Series | pd.DataFrame]) -> List[Dict[str, Any]]:
+    cache = None
+    if task.cache_dir is not None and task.cache_key is not None:
+        cache = ResultCache(task.cache_dir, refresh=task.refresh_cache)
+        entry = cache.get(task.cache_key)
+        if entry is not None:
+            _persist_model(task, panel, entry.model)
+            return [{**record, "cache_hit": True} for record in entry.records]
+
+    if task.horizons:
+        asset = task.assets[0]
+        if model_mode(task.model) == "series":
+            records, by_horizon, model = _run_series_group(task, _target(panel[asset]))
+        else:
+            records, by_horizon, model = run_direct(task.model, task.horizons, _target(panel[asset]), task.feature_dtype)
+        if asset is not None:
+            for record in records:
+                record["asset"] = asset
+        by_asset = {(asset, name): predictions for name, predictions in by_horizon.items()}
+    elif len(task.assets) == 1:
+        asset = task.assets[0]
+        record, predictions, model = _run_cell(task, panel[asset])
+        if asset is not None:
+            record["asset"] = asset
+        records, by_asset = [record], {asset: predictions}
+    else:
+        run_group = run_batched_smoothing if model_mode(task.model) == "series" else run_pooled
+        records, by_asset, model = run_group(
+            task.model,
+            task.horizon,
+            {asset: _target(panel[asset]) for asset in task.assets},
+            task.feature_dtype,
+        )
+
+    if cache is not None:
+        cache.put(
+            task.cache_key,
+            CacheEntry(records=[dict(record) for record in records], predictions=by_asset, model=model),
+        )
+    _persist_model(task, panel, model)
+    for record in records:
+        record["cache_hit"] = False
+    return records
+
+
+def _execute_task(
+    task: ExperimentTask,
+    panel: Mapping[str | None, pd.Series | pd.DataFrame],
+) -> Tuple[List[Dict[str, Any]], List[StageEvent]]:
+    profiling = task.profiling
+    if profiling is None or not profiling.enabled:
+        return _evaluate_task(task, panel), []
+    recorder = StageRecorder(memory=profiling.memory)
+    destination = None if task.profile_dir is None else task.profile_dir / task.label
+    with recorder.activate(task.label), task_profiler(profiling.profiler, destination):
+        records = _evaluate_task(task, panel)
+    return records, recorder.events
+
+
+def resolve_cache_dir(config: RunConfig) -> Path | None:
+    if not config.cache.enabled:
+        return None
+    return config.cache.directory or Path(config.output_dir) / "cache"
+
 
+def _select_target(df: pd.DataFrame, column: str, label: str) -> pd.Series:
+    if column not in df.columns:
+        raise ValueError(f"Column {column!r} not found in dataset {label}")
+    return df[column].dropna()
+
+
+def _model_inputs(
+    config: RunConfig,
+    df: pd.DataFrame,
+    column: str,
+    label: str,
+) -> pd.Series | pd.DataFrame:
+    target = _select_target(df, column, label)
+    if not config.features:
+        return target
+    cache_dir = resolve_cache_dir(config)
+    frame = df.loc[target.index]
+    return build_feature_frame(
+        frame,
+        column,
+        config.features,
+        cache_dir=None if cache_dir is None else cache_dir / "features",
+        data_hash=None if cache_dir is None else hash_series(frame.select_dtypes(include=["number"])),
+    )
+
+
+def load_target_series(config: RunConfig) -> pd.Series:
+    """Load the configured target column, going through the prepared-data cache when enabled."""
+
+    cache_dir = resolve_cache_dir(config)
+    prepared_dir = None if cache_dir is None else cache_dir / "prepared"
+    df = load_price_history(config.data_path, config.frequency, cache_dir=prepared_dir)
+    return _select_target(df, config.target_column, str(config.data_path))
+
+
+def load_panel_series(config: RunConfig) -> Dict[str | None, pd.Series | pd.DataFrame]:
+    """Model inputs keyed by asset name; a run without a panel maps ``None`` to its single series.
+
+    With ``features`` configured, each value is the feature block from
+    :func:`features.build_feature_frame` (target last) instead of the target series.
+    """
+
+    panel = config.panel
+    cache_dir = resolve_cache_dir(config)
+    prepared_dir = None if cache_dir is None else cache_dir / "prepared"
+    if panel is None:
+        df = load_price_history(config.data_path, config.frequency, cache_dir=prepared_dir)
+        return {None: _model_inputs(config, df, config.target_column, str(config.data_path))}
+    targets = {asset.name: asset.target_column or config.target_column for asset in panel.assets}
+    if panel.path is not None:
+        frames = load_long_panel(
+            panel.path,
+            panel.asset_column,
+            config.frequency,
+            assets=[asset.name for asset in panel.assets] or None,
+        )
+        return {
+            name: _model_inputs(config, frame, targets.get(name, config.target_column), name)
+            for name, frame in frames.items()
+        }
+    return {
+        asset.name: _model_inputs(
+            config,
+            load_price_history(asset.data_path, config.frequency, cache_dir=prepared_dir),
+            targets[asset.name],
+            asset.name,
+        )
+        for asset in panel.assets
+    }
+
+
+def _build_tasks(config: RunConfig, assets: Sequence[str | None]) -> List[ExperimentTask]:
+    pooled = config.panel is not None and config.panel.pooled and len(assets) > 1
+    # Pooled panel training takes precedence; direct fits are per asset.
+    direct = config.multi_horizon and not pooled
+    backtest = config.backtest
+    shared_series = backtest.mode == "single_origin" and backtest.series_fits != "independent"
+    tasks = []
+    grouped: List[Tuple[ModelConfig, Tuple[str | None, ...]]] = []
+    for horizon in config.horizons:
         for model_cfg in config.models:
-            try:
-                handle = build_model(model_cfg)
-            except ImportError as exc:
-                print(f"Skipping model {model_cfg.name} ({model_cfg.type}): {exc}")
+            features = model_mode(model_cfg) == "features"
+            batched = len(assets) > 1 and supports_batched_fit(model_cfg) and backtest.mode == "single_origin"
+            if (direct and features) or (shared_series and not features and not batched):
+                if horizon is config.horizons[0]:
+                    grouped.extend((model_cfg, (asset,)) for asset in assets)
                 continue
-            record = _run_single_model(
-                handle,
-                horizon_name,
-                train_ds.features,
-                train_ds.targets,
-                test_ds.features,
-                test_ds.targets,
-                history_series,
+            if (pooled and features) or batched:
+                groups = [tuple(assets)]
+            else:
+                groups = [(asset,) for asset in assets]
+            tasks.extend(
+                ExperimentTask(
+                    horizon=horizon,
+                    model=model_cfg,
+                    feature_dtype=config.feature_dtype,
+                    backtest=backtest,
+                    assets=group,
+                )
+                for group in groups
             )
-            records.append(record)
+    # One task per (model, asset) covers every horizon: a multi-output fit for
+    # feature models, one fit grown across the horizons' histories for series models.
+    tasks.extend(
+        ExperimentTask(
+            horizon=config.horizons[0],
+            model=model_cfg,
+            feature_dtype=config.feature_dtype,
+            backtest=backtest,
+            assets=group,
+            horizons=tuple(config.horizons),
+        )
+        for model_cfg, group in grouped
+    )
+    return tasks
+
+
+def run_experiments(config: RunConfig) -> pd.DataFrame:
+    """Execute the configured experiment suite and persist aggregated metrics."""
 
-    results = pd.DataFrame.from_records(records)
-    results.sort_values(["horizon", "model"], inplace=True)
     output_dir = Path(config.output_dir)
+    profiling = config.profiling
+    recorder = StageRecorder(memory=profiling.memory) if profiling.enabled else None
+    if recorder is None:
+        panel = load_panel_series(config)
+    else:
+        with recorder.activate("pipeline"):
+            panel = load_panel_series(config)
+    cache_dir = resolve_cache_dir(config)
+    tasks = _build_tasks(config, list(panel))
+    store_dir = None
+    if config.model_store.enabled:
+        store_dir = config.model_store.directory or output_dir / "models"
+    task_profiling = profiling
+    threaded = config.execution.backend == "thread" and config.execution.workers > 1
+    if profiling.enabled and profiling.memory is not None and threaded:
+        # tracemalloc and RSS both measure the whole process, so concurrent tasks would be
+        # charged for each other's allocations.
+        warnings.warn(
+            "Peak memory is process-wide under the thread backend; task stages record time only",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        task_profiling = replace(profiling, memory=None)
+    for task in tasks:
+        task.profiling = task_profiling
+        task.profile_dir = output_dir / "profiles"
+        task.features = tuple(config.features)
+        task.model_store_dir = store_dir
+
+    data_hashes = {}
+    if cache_dir is not None or config.ledger.enabled:
+        data_hashes = {asset: hash_series(series) for asset, series in panel.items()}
+    task_hashes = [",".join(data_hashes.get(asset, "") for asset in task.assets) for task in tasks]
+
+    cache = None
+    if cache_dir is not None:
+        max_bytes = None if config.cache.max_size_mb is None else int(config.cache.max_size_mb * 1024**2)
+        cache = ResultCache(cache_dir, max_bytes=max_bytes, refresh=config.cache.refresh)
+        for task, data_hash in zip(tasks, task_hashes):
+            task.cache_dir = cache_dir
+            task.cache_key = make_cache_key(data_hash, _task_fingerprint(task))
+            task.refresh_cache = config.cache.refresh
+
+    ledger = run_id = None
+    finished: Dict[int, List[Dict[str, Any]]] = {}
+    cell_keys = [_cell_key(task, data_hash) for task, data_hash in zip(tasks, task_hashes)]
+    if config.ledger.enabled:
+        ledger = ExperimentLedger(config.ledger.path or output_dir / "ledger.sqlite")
+        run_id = ledger.start_run(config.to_dict(), config.ledger.resume)
+        completed = ledger.completed_cells(run_id)
+        finished = {
+            position: ledger.cell_records(run_id, key) for position, key in enumerate(cell_keys) if key in completed
+        }
+    pending = [position for position in range(len(tasks)) if position not in finished]
+
+    def commit(outcome: TaskOutcome) -> None:
+        # Runs in this process as each task finishes, so a crash keeps every committed cell.
+        if outcome.error is not None:
+            return
+        position = pending[outcome.index]
+        task_records, _ = outcome.result
+        for record in task_records:
+            record.update({"schedule_sec": outcome.schedule_sec, "queue_wait_sec": outcome.queue_wait_sec})
+        if ledger is not None:
+            ledger.record_cell(run_id, cell_keys[position], tasks[position].label, task_records)
+
+    records: List[Dict[str, Any]] = []
+    events: List[StageEvent] = [] if recorder is None else list(recorder.events)
+    try:
+        # Worker processes attach to one shared copy of the series instead of each unpickling their own.
+        shared = SharedPanel.create(panel) if uses_worker_processes(config.execution) else nullcontext(panel)
+        with shared as context:
+            outcomes = run_tasks(_execute_task, [tasks[position] for position in pending], context, config.execution, commit)
+        for position in range(len(tasks)):
+            records.extend(finished.get(position, []))
+        for outcome in outcomes:
+            task = tasks[pending[outcome.index]]
+            if isinstance(outcome.error, ImportError):
+                print(f"Skipping model {task.model.name} ({task.model.type}): {outcome.error}")
+                continue
+            if outcome.error is not None:
+                raise outcome.error
+            task_records, task_events = outcome.result
+            events.extend(task_events)
+            records.extend(task_records)
+    except BaseException:
+        if ledger is not None:
+            ledger.finish_run(run_id, status="failed")
+            ledger.close()
+        raise
+    if ledger is not None:
+        ledger.finish_run(run_id)
+        ledger.close()
+        print(f"Recorded run {run_id} in {ledger.path}")
+
+    if cache is not None:
+        cache.evict()
+
+    results = pd.DataFrame.from_records(records)
+    sort_keys = ["horizon", "model"] + (["asset"] if "asset" in results.columns else [])
+    results.sort_values(sort_keys, inplace=True)
     output_dir.mkdir(parents=True, exist_ok=True)
     results_path = output_dir / "metrics.csv"
     results.to_csv(results_path, index=False)
+    if recorder is not None:
+        write_trace(events, output_dir / "trace.json")
     return results
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import get_context
+from time import perf_counter, time
+from typing import Any, Callable, Iterator, List, Sequence
+
+from .config import ExecutionConfig
+
+# Environment knobs read by BLAS/OpenMP runtimes and TensorFlow when they start.
+_THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "TF_NUM_INTRAOP_THREADS",
+    "TF_NUM_INTEROP_THREADS",
+)
+
+TaskFn = Callable[[Any, Any], Any]
+
+_WORKER_CONTEXT: Any = None
+
+
+@dataclass(slots=True)
+class TaskOutcome:
+    """Result of a scheduled task plus the time it spent being dispatched and queued."""
+
+    index: int
+    result: Any
+    error: BaseException | None
+    schedule_sec: float
+    queue_wait_sec: float
+
+
+def resolve_threads_per_worker(execution: ExecutionConfig) -> int:
+    if execution.threads_per_worker is not None:
+        return max(1, execution.threads_per_worker)
+    if execution.backend == "serial" or execution.workers <= 1:
+        return os.cpu_count() or 1
+    return max(1, (os.cpu_count() or 1) // execution.workers)
+
+
+@contextmanager
+def _thread_env(threads: int) -> Iterator[None]:
+    previous = {name: os.environ.get(name) for name in _THREAD_ENV_VARS}
+    os.environ.update({name: str(threads) for name in _THREAD_ENV_VARS})
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+@contextmanager
+def _blas_limits(threads: int) -> Iterator[None]:
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:  # pragma: no cover - shipped with scikit-learn
+        yield
+        return
+    with threadpool_limits(limits=threads):
+        yield
+
+
+def _init_worker(context: Any, threads: int) -> None:
+    global _WORKER_CONTEXT
+    _WORKER_CONTEXT = context
+    try:
+        from threadpoolctl import threadpool_limits
+
+        threadpool_limits(limits=threads)
+    except ImportError:  # pragma: no cover - shipped with scikit-learn
+        pass
+
+
+def _timed_call(fn: TaskFn, task: Any, context: Any) -> tuple[Any, float]:
+    started_at = time()
+    return fn(task, context), started_at
+
+
+def _timed_call_in_worker(fn: TaskFn, task: Any) -> tuple[Any, float]:
+    return _timed_call(fn, task, _WORKER_CONTEXT)
+
+
+def _make_executor(execution: ExecutionConfig, context: Any, threads: int) -> Executor:
+    if execution.backend == "thread":
+        return ThreadPoolExecutor(max_workers=execution.workers)
+    # spawn keeps workers free of locks/thread pools inherited from the parent.
+    return ProcessPoolExecutor(
+        max_workers=execution.workers,
+        mp_context=get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(context, threads),
+    )
+
+
+def run_tasks(
+    fn: TaskFn,
+    tasks: Sequence[Any],
+    context: Any,
+    execution: ExecutionConfig,
+    on_outcome: Callable[[TaskOutcome], None] | None = None,
+) -> List[TaskOutcome]:
+    """Run ``fn(task, context)`` for every task and return outcomes in submission order.
+
+    ``context`` is shared by all tasks; the process backend ships it once per
+    worker through the pool initializer instead of once per task.
+    ``on_outcome`` is called in the calling process as soon as each task
+    finishes, in completion order.
+    """
+
+    threads = resolve_threads_per_worker(execution)
+    if execution.backend == "serial" or execution.workers <= 1:
+        outcomes = []
+        with _blas_limits(threads):
+            for index, task in enumerate(tasks):
+                submitted_at = time()
+                try:
+                    result, started_at = _timed_call(fn, task, context)
+                    error = None
+                except Exception as exc:
+                    result, started_at, error = None, submitted_at, exc
+                outcomes.append(TaskOutcome(index, result, error, 0.0, started_at - submitted_at))
+                if on_outcome is not None:
+                    on_outcome(outcomes[-1])
+        return outcomes
+
+    pending: List[tuple[Future, float, float]] = []
+    with _thread_env(threads), _blas_limits(threads):
+        with _make_executor(execution, context, threads) as executor:
+            for task in tasks:
+                dispatch_start = perf_counter()
+                submitted_at = time()
+                if execution.backend == "thread":
+                    future = executor.submit(_timed_call, fn, task, context)
+                else:
+                    future = executor.submit(_timed_call_in_worker, fn, task)
+                pending.append((future, submitted_at, perf_counter() - dispatch_start))
+
+            outcomes: List[TaskOutcome | None] = [None] * len(pending)
+            positions = {future: index for index, (future, _, _) in enumerate(pending)}
+            for future in as_completed(positions):
+                index = positions[future]
+                _, submitted_at, schedule_sec = pending[index]
+                try:
+                    result, started_at = future.result()
+                    error = None
+                except Exception as exc:
+                    result, started_at, error = None, submitted_at, exc
+                outcomes[index] = TaskOutcome(index, result, error, schedule_sec, max(0.0, started_at - submitted_at))
+                if on_outcome is not None:
+                    on_outcome(outcomes[index])
+    return outcomes
+
+
+__all__ = ["TaskOutcome", "resolve_threads_per_worker", "run_tasks"]
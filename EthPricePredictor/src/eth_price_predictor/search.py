@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import itertools
+import json
+import math
+from contextlib import nullcontext
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .config import HorizonConfig, ModelConfig, RunConfig, SearchConfig
+from .data import WindowedDataset, make_windowed_dataset
+from .models import build_model
+from .runner import _run_single_model, load_target_series
+from .scheduler import run_tasks
+from .shared import SharedPanel, uses_worker_processes
+
+_HIGHER_IS_BETTER = {"r2"}
+
+
+@dataclass(slots=True)
+class CandidateTask:
+    """One candidate evaluated at one budget on the validation slice of the training data."""
+
+    candidate: int
+    bracket: int
+    rung: int
+    budget: int
+    params: Dict[str, Any]
+    model: ModelConfig
+    horizon: HorizonConfig
+    validation_size: int
+    budget_param: str | None
+    max_budget: int
+    feature_dtype: str = "float64"
+
+
+def _grid(space: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    names = list(space)
+    choices = []
+    for name in names:
+        values = space[name]
+        if isinstance(values, Mapping):
+            raise ValueError(f"Grid search needs explicit choices for {name!r}, got a range")
+        choices.append(list(values))
+    return [dict(zip(names, combo)) for combo in itertools.product(*choices)]
+
+
+def _sample_value(spec: Any, rng: np.random.Generator) -> Any:
+    if not isinstance(spec, Mapping):
+        return spec[int(rng.integers(len(spec)))]
+    low, high = spec["low"], spec["high"]
+    if spec.get("log"):
+        value = float(np.exp(rng.uniform(np.log(low), np.log(high))))
+    else:
+        value = float(rng.uniform(low, high))
+    if isinstance(low, int) and isinstance(high, int):
+        return int(round(value))
+    return value
+
+
+def _sample(space: Mapping[str, Any], count: int, rng: np.random.Generator) -> List[Dict[str, Any]]:
+    seen = set()
+    candidates = []
+    # Bounded retries so small discrete spaces do not loop forever on duplicates.
+    for _ in range(count * 20):
+        params = {name: _sample_value(spec, rng) for name, spec in space.items()}
+        key = json.dumps(params, sort_keys=True, default=str)
+        if key in seen:
+            continue
+        seen.add(key)
+        candidates.append(params)
+        if len(candidates) == count:
+            break
+    return candidates
+
+
+def _initial_candidates(search: SearchConfig, count: int, rng: np.random.Generator) -> List[Dict[str, Any]]:
+    discrete = all(not isinstance(spec, Mapping) for spec in search.space.values())
+    if discrete:
+        grid = _grid(search.space)
+        if len(grid) <= count:
+            return grid
+    return _sample(search.space, count, rng)
+
+
+def _evaluate_candidate(task: CandidateTask, context: Mapping[None, pd.Series]) -> Dict[str, Any]:
+    series = context[None]
+    horizon = task.horizon
+    dataset = make_windowed_dataset(
+        series,
+        lookback=horizon.lookback,
+        horizon=horizon.steps_ahead,
+        dtype=task.feature_dtype,
+    )
+    # The test window is never scored during search; validate on the tail of the training data.
+    train_ds, _ = dataset.split(horizon.test_size)
+    fit_ds, val_ds = train_ds.split(task.validation_size)
+    history = series.loc[: fit_ds.indices[-1]]
+    if task.budget_param is None:
+        # Train on the most recent share of the fit windows (and of the series behind them), so
+        # lower rungs save real fitting work while every rung is scored on the same validation slice.
+        keep = max(1, math.ceil(len(fit_ds.targets) * task.budget / task.max_budget))
+        fit_ds = WindowedDataset(
+            features=fit_ds.features[-keep:],
+            targets=fit_ds.targets[-keep:],
+            indices=fit_ds.indices[-keep:],
+        )
+        history = history.iloc[-(keep + horizon.lookback + horizon.steps_ahead - 1) :]
+    handle = build_model(task.model)
+    record, _ = _run_single_model(
+        handle,
+        f"{horizon.steps_ahead}d",
+        fit_ds.features,
+        fit_ds.targets,
+        val_ds.features,
+        val_ds.targets,
+        history,
+    )
+    record.update(
+        {
+            "candidate": task.candidate,
+            "bracket": task.bracket,
+            "rung": task.rung,
+            "budget": task.budget,
+            "params": json.dumps(task.params, sort_keys=True, default=str),
+            **{f"param_{name}": value for name, value in task.params.items()},
+        }
+    )
+    return record
+
+
+class _Evaluator:
+    def __init__(self, config: RunConfig, context: Mapping[None, pd.Series]) -> None:
+        search = config.search
+        assert search is not None
+        base = next((m for m in config.models if m.name == search.model), None)
+        if base is None:
+            raise ValueError(f"Search model {search.model!r} is not listed under models")
+        if search.horizon is None:
+            horizon = config.horizons[0]
+        else:
+            horizon = next((h for h in config.horizons if h.steps_ahead == search.horizon), None)
+            if horizon is None:
+                raise ValueError(f"Search horizon {search.horizon} is not listed under horizons")
+        self.config = config
+        self.search = search
+        self.context = context
+        self.base = base
+        self.horizon = horizon
+        self.validation_size = search.validation_size or horizon.test_size
+        self.records: List[Dict[str, Any]] = []
+
+    def __call__(
+        self,
+        candidates: Sequence[tuple[int, Dict[str, Any]]],
+        budget: int,
+        rung: int,
+        bracket: int,
+    ) -> List[Dict[str, Any]]:
+        search = self.search
+        tasks = []
+        for candidate_id, params in candidates:
+            merged = {**self.base.params, **params}
+            if search.budget_param is not None:
+                merged[search.budget_param] = budget
+            tasks.append(
+                CandidateTask(
+                    candidate=candidate_id,
+                    bracket=bracket,
+                    rung=rung,
+                    budget=budget,
+                    params=params,
+                    model=replace(self.base, params=merged),
+                    horizon=self.horizon,
+                    validation_size=self.validation_size,
+                    budget_param=search.budget_param,
+                    max_budget=search.max_budget,
+                    feature_dtype=self.config.feature_dtype,
+                )
+            )
+        records = []
+        for outcome in run_tasks(_evaluate_candidate, tasks, self.context, self.config.execution):
+            if outcome.error is not None:
+                raise outcome.error
+            records.append(outcome.result)
+        self.records.extend(records)
+        return records
+
+    def rank(self, records: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        metric = self.search.metric
+        sign = -1.0 if metric in _HIGHER_IS_BETTER else 1.0
+        return sorted(records, key=lambda record: sign * float(record[metric]))
+
+
+def _successive_halving(
+    evaluate: _Evaluator,
+    candidates: List[tuple[int, Dict[str, Any]]],
+    min_budget: int,
+    max_budget: int,
+    eta: int,
+    bracket: int = 0,
+) -> None:
+    budget, rung = min_budget, 0
+    survivors = candidates
+    while True:
+        ranked = evaluate.rank(evaluate(survivors, budget, rung, bracket))
+        if budget >= max_budget or len(survivors) <= 1:
+            return
+        keep = {record["candidate"] for record in ranked[: max(1, len(survivors) // eta)]}
+        survivors = [item for item in survivors if item[0] in keep]
+        budget = min(max_budget, budget * eta)
+        rung += 1
+
+
+def _run_strategy(evaluate: _Evaluator, search: SearchConfig) -> None:
+    rng = np.random.default_rng(search.seed)
+    if search.strategy == "grid":
+        candidates = list(enumerate(_grid(search.space)))
+        evaluate(candidates, search.max_budget, 0, 0)
+    elif search.strategy == "random":
+        candidates = list(enumerate(_sample(search.space, search.n_candidates, rng)))
+        evaluate(candidates, search.max_budget, 0, 0)
+    elif search.strategy == "halving":
+        candidates = list(enumerate(_initial_candidates(search, search.n_candidates, rng)))
+        _successive_halving(evaluate, candidates, search.min_budget, search.max_budget, search.eta)
+    else:
+        # Hyperband: run successive halving brackets that trade candidate count for starting budget.
+        s_max = int(math.floor(math.log(search.max_budget / search.min_budget, search.eta) + 1e-9))
+        next_id = 0
+        for bracket, s in enumerate(range(s_max, -1, -1)):
+            count = int(math.ceil((s_max + 1) / (s + 1) * search.eta**s))
+            start_budget = max(search.min_budget, int(search.max_budget / search.eta**s))
+            sampled = _sample(search.space, count, rng)
+            candidates = list(enumerate(sampled, start=next_id))
+            next_id += len(sampled)
+            _successive_halving(evaluate, candidates, start_budget, search.max_budget, search.eta, bracket)
+
+
+def run_search(config: RunConfig) -> pd.DataFrame:
+    """Run the configured hyperparameter search and persist every evaluation to ``search.csv``."""
+
+    if config.search is None:
+        raise ValueError("RunConfig has no search block")
+    search = config.search
+    if search.strategy in {"halving", "hyperband"} and search.max_budget <= search.min_budget:
+        raise ValueError("halving/hyperband need max_budget greater than min_budget")
+
+    series = {None: load_target_series(config)}
+    shared = SharedPanel.create(series) if uses_worker_processes(config.execution) else nullcontext(series)
+    with shared as context:
+        evaluate = _Evaluator(config, context)
+        _run_strategy(evaluate, search)
+
+    results = pd.DataFrame.from_records(evaluate.records)
+    ascending = search.metric not in _HIGHER_IS_BETTER
+    results.sort_values(["budget", search.metric], ascending=[False, ascending], inplace=True)
+    output_dir = Path(config.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    results.to_csv(output_dir / "search.csv", index=False)
+    return results
+
+
+__all__ = ["CandidateTask", "run_search"]
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, Iterator, List, Mapping
+
+import numpy as np
+import pandas as pd
+
+from .config import ExecutionConfig
+
+# Python 3.13+ lets attaching processes opt out of the resource tracker, so only
+# the creating process can unlink a block.
+_ATTACH_KWARGS: Dict[str, Any] = {"track": False} if sys.version_info >= (3, 13) else {}
+# Before 3.13 attaching always registers the block. Workers started by the
+# creator share its tracker, where that is a no-op; a process that attaches
+# without one starts its own, which would unlink the block (and warn about a
+# leak) when the process exits. Decided on the first attach in each process.
+_PRIVATE_TRACKER: bool | None = None
+
+
+def _attach_block(name: str) -> shared_memory.SharedMemory:
+    global _PRIVATE_TRACKER
+    if _ATTACH_KWARGS:
+        return shared_memory.SharedMemory(name=name, **_ATTACH_KWARGS)
+    if _PRIVATE_TRACKER is None:
+        _PRIVATE_TRACKER = getattr(resource_tracker._resource_tracker, "_fd", None) is None
+    block = shared_memory.SharedMemory(name=name)
+    if _PRIVATE_TRACKER:
+        # Unregistering from a shared tracker would drop the creator's entry as well.
+        resource_tracker.unregister(block._name, "shared_memory")
+    return block
+
+
+@dataclass(frozen=True, slots=True)
+class SharedArrayHandle:
+    """Picklable reference to an array stored in a named shared-memory block."""
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+    def view(self, block: shared_memory.SharedMemory) -> np.ndarray:
+        array = np.ndarray(self.shape, dtype=np.dtype(self.dtype), buffer=block.buf)
+        array.flags.writeable = False
+        return array
+
+
+@dataclass(frozen=True, slots=True)
+class SharedSeriesHandle:
+    values: SharedArrayHandle
+    index: SharedArrayHandle
+    name: Any
+    index_name: Any
+    freq: str | None
+    # Set for DataFrames, whose 2-D block is shared as one array.
+    columns: tuple | None = None
+
+
+def _to_shared(array: np.ndarray, blocks: List[shared_memory.SharedMemory]) -> SharedArrayHandle:
+    array = np.ascontiguousarray(array)
+    # Zero-size blocks are rejected, so empty arrays still get one byte.
+    block = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+    blocks.append(block)
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+    return SharedArrayHandle(name=block.name, shape=array.shape, dtype=array.dtype.str)
+
+
+class SharedPanel(Mapping):
+    """Read-only ``{asset: Series}`` mapping whose data lives in shared memory.
+
+    Values may also be DataFrames (e.g. a feature block); they come back as
+    frames over one shared 2-D array.
+
+    The creating process copies each series into shared memory once; pickling
+    a ``SharedPanel`` ships only the block names, and workers attach to the
+    same pages on first access instead of receiving their own copy. Use it as a
+    context manager in the creating process so blocks are unlinked even if a
+    task fails.
+    """
+
+    def __init__(self, handles: Mapping[Any, SharedSeriesHandle]) -> None:
+        self._handles = dict(handles)
+        self._blocks: List[shared_memory.SharedMemory] = []
+        self._series: Dict[Any, pd.Series | pd.DataFrame] = {}
+        self._owner = False
+
+    @classmethod
+    def create(cls, panel: Mapping[Any, pd.Series]) -> "SharedPanel":
+        blocks: List[shared_memory.SharedMemory] = []
+        handles = {}
+        try:
+            for key, series in panel.items():
+                index = series.index
+                if not isinstance(index, pd.DatetimeIndex):
+                    raise TypeError("SharedPanel needs series with a DatetimeIndex")
+                frame = isinstance(series, pd.DataFrame)
+                handles[key] = SharedSeriesHandle(
+                    values=_to_shared(series.to_numpy(dtype=float), blocks),
+                    index=_to_shared(index.to_numpy(), blocks),
+                    name=None if frame else series.name,
+                    index_name=index.name,
+                    freq=index.freqstr,
+                    columns=tuple(series.columns) if frame else None,
+                )
+        except BaseException:
+            for block in blocks:
+                block.close()
+                block.unlink()
+            raise
+        shared = cls(handles)
+        shared._blocks = blocks
+        shared._owner = True
+        return shared
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"handles": self._handles}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["handles"])
+
+    def _attach(self, handle: SharedArrayHandle) -> np.ndarray:
+        for block in self._blocks:
+            if block.name == handle.name:
+                return handle.view(block)
+        block = _attach_block(handle.name)
+        self._blocks.append(block)
+        return handle.view(block)
+
+    def __getitem__(self, key: Any) -> pd.Series | pd.DataFrame:
+        series = self._series.get(key)
+        if series is None:
+            handle = self._handles[key]
+            index = pd.DatetimeIndex(self._attach(handle.index), freq=handle.freq, name=handle.index_name, copy=False)
+            values = self._attach(handle.values)
+            if handle.columns is None:
+                series = pd.Series(values, index=index, name=handle.name, copy=False)
+            else:
+                series = pd.DataFrame(values, index=index, columns=list(handle.columns), copy=False)
+            self._series[key] = series
+        return series
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._handles)
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def close(self) -> None:
+        """Detach from every block; the creating process also unlinks them."""
+
+        # Series hold views into the buffers, which must go before the blocks can close.
+        self._series.clear()
+        for block in self._blocks:
+            try:
+                block.close()
+            except BufferError:
+                # A caller still references a view; the mapping is released at exit.
+                pass
+            if self._owner:
+                try:
+                    block.unlink()
+                except FileNotFoundError:
+                    pass
+        self._blocks = []
+
+    def __enter__(self) -> "SharedPanel":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def uses_worker_processes(execution: ExecutionConfig) -> bool:
+    return execution.backend == "process" and execution.workers > 1
+
+
+__all__ = ["SharedArrayHandle", "SharedPanel", "SharedSeriesHandle", "uses_worker_processes"]
@@ -0,0 +1,430 @@
+from __future__ import annotations
+
+import json
+import sys
+import time
+import warnings
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Lock
+from time import perf_counter
+from typing import Any, Dict, Iterable, Iterator, List, TextIO, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import RunConfig
+from .data import make_windowed_dataset
+from .models import ModelHandle, build_model, fit_windows
+from .models.classical import ARIMAForecaster, SeriesForecaster
+from .runner import load_target_series
+
+# Upper bucket edges in microseconds; the last bucket is open-ended.
+_LATENCY_BUCKETS_US = (10, 25, 50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000, 50_000)
+
+
+class RingBuffer:
+    """Fixed-capacity buffer whose most recent ``capacity`` values are always a contiguous view.
+
+    Every value is written twice, ``capacity`` slots apart, so ``latest`` can
+    slice without wrapping or copying.
+    """
+
+    def __init__(self, capacity: int, dtype: np.dtype | str = np.float64) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._data = np.zeros(2 * capacity, dtype=dtype)
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def extend(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.append(value)
+
+    def append(self, value: float) -> None:
+        self._data[self._head] = value
+        self._data[self._head + self.capacity] = value
+        self._head = (self._head + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def latest(self, count: int) -> np.ndarray:
+        if count > self._size:
+            raise ValueError(f"Only {self._size} values buffered, {count} requested")
+        end = self._head + self.capacity
+        return self._data[end - count : end]
+
+
+@dataclass(slots=True)
+class LatencyHistogram:
+    """Log-spaced histogram of per-tick latencies."""
+
+    bounds_us: Tuple[int, ...] = _LATENCY_BUCKETS_US
+    counts: List[int] = field(default_factory=lambda: [0] * (len(_LATENCY_BUCKETS_US) + 1))
+    total: int = 0
+    sum_us: float = 0.0
+    max_us: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        micros = seconds * 1e6
+        self.counts[int(np.searchsorted(self.bounds_us, micros))] += 1
+        self.total += 1
+        self.sum_us += micros
+        self.max_us = max(self.max_us, micros)
+
+    def quantile(self, q: float) -> float:
+        """Upper bucket edge below which a fraction ``q`` of ticks completed."""
+
+        if self.total == 0:
+            return 0.0
+        threshold = q * self.total
+        running = 0
+        for bound, count in zip(self.bounds_us + (self.max_us,), self.counts):
+            running += count
+            if running >= threshold:
+                return float(bound)
+        return self.max_us
+
+    def summary(self) -> Dict[str, Any]:
+        labels = [f"<={bound}us" for bound in self.bounds_us] + [f">{self.bounds_us[-1]}us"]
+        return {
+            "ticks": self.total,
+            "mean_us": self.sum_us / self.total if self.total else 0.0,
+            "p50_us": self.quantile(0.5),
+            "p99_us": self.quantile(0.99),
+            "max_us": self.max_us,
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class _StateSpaceStepper:
+    """Kalman filter step over a fitted time-invariant state-space model (ARIMA).
+
+    Equivalent to ``results.extend([y])`` followed by ``forecast`` but works on
+    the stored system matrices directly, which keeps each update in the tens of
+    microseconds instead of rebuilding a statsmodels model per observation.
+    """
+
+    @staticmethod
+    def supports(results: Any) -> bool:
+        """Only constant system matrices without trend or exog terms can be stepped this way."""
+
+        model = results.model
+        return (
+            getattr(model, "k_trend", 0) == 0
+            and getattr(model, "k_exog", 0) == 0
+            and bool(getattr(model.ssm, "time_invariant", False))
+        )
+
+    def __init__(self, results: Any, max_steps: int) -> None:
+        filtered = results.filter_results
+        self.Z = filtered.design[0, :, 0]
+        self.d = float(filtered.obs_intercept[0, 0])
+        self.H = float(filtered.obs_cov[0, 0, 0])
+        self.T = filtered.transition[:, :, 0]
+        self.c = filtered.state_intercept[:, 0]
+        selection = filtered.selection[:, :, 0]
+        self.RQR = selection @ filtered.state_cov[:, :, 0] @ selection.T
+        self.a = filtered.predicted_state[:, -1].copy()
+        self.P = filtered.predicted_state_cov[:, :, -1].copy()
+        # y_{t+h} = Z T^h a + Z (T^{h-1} + ... + I) c + d, stacked for h < max_steps.
+        rows = np.empty((max_steps, len(self.a)))
+        offsets = np.empty(max_steps)
+        power = np.eye(len(self.a))
+        drift = np.zeros(len(self.a))
+        for step in range(max_steps):
+            rows[step] = self.Z @ power
+            offsets[step] = self.Z @ drift + self.d
+            drift = self.T @ drift + self.c
+            power = self.T @ power
+        self._forecast_rows = rows
+        self._forecast_offsets = offsets
+
+    def update(self, value: float) -> None:
+        T, P = self.T, self.P
+        if np.isnan(value):
+            self.a = T @ self.a + self.c
+            self.P = T @ P @ T.T + self.RQR
+            return
+        PZ = P @ self.Z
+        F = self.Z @ PZ + self.H
+        K = (T @ PZ) / F
+        self.a = T @ self.a + self.c + K * (value - self.Z @ self.a - self.d)
+        self.P = T @ P @ T.T + self.RQR - F * np.outer(K, K)
+
+    def forecast(self, steps: int) -> np.ndarray:
+        return self._forecast_rows[:steps] @ self.a + self._forecast_offsets[:steps]
+
+
+def _dense_forward(estimator: Any) -> Any | None:
+    """Return a plain NumPy forward pass for a fitted ``MLPRegressor``, skipping sklearn's input checks."""
+
+    activations = {
+        "identity": lambda x: x,
+        "relu": lambda x: np.maximum(x, 0.0, out=x),
+        "tanh": np.tanh,
+        "logistic": lambda x: 1.0 / (1.0 + np.exp(-x)),
+    }
+    coefs = getattr(estimator, "coefs_", None)
+    hidden = activations.get(getattr(estimator, "activation", ""))
+    if coefs is None or hidden is None or getattr(estimator, "out_activation_", None) != "identity":
+        return None
+    layers = list(zip(estimator.coefs_, estimator.intercepts_))
+
+    def forward(window: np.ndarray) -> np.ndarray:
+        out = window
+        for weights, bias in layers[:-1]:
+            out = hidden(out @ weights + bias)
+        weights, bias = layers[-1]
+        return out @ weights + bias
+
+    return forward
+
+
+@dataclass(slots=True)
+class _SeriesSlot:
+    name: str
+    model: SeriesForecaster
+    stepper: _StateSpaceStepper | None = None
+
+    def update(self, value: float) -> None:
+        if self.stepper is not None:
+            self.stepper.update(value)
+        else:
+            self.model.update(np.array([value]))
+
+    def forecast(self, steps: int) -> np.ndarray:
+        if self.stepper is not None:
+            return self.stepper.forecast(steps)
+        return self.model.forecast(steps)
+
+
+@dataclass(slots=True)
+class _FeatureSlot:
+    name: str
+    steps_ahead: int
+    lookback: int
+    model: Any
+    forward: Any = None
+
+    def predict(self, window: np.ndarray) -> float:
+        if self.forward is not None:
+            return float(self.forward(window)[0, 0])
+        return float(np.ravel(self.model.predict(window))[0])
+
+
+class StreamingForecaster:
+    """Keeps fitted models warm and turns each new bar into forecasts for every horizon.
+
+    Series models (SES/ARIMA) are fit once on the history and then updated in
+    O(1) per observation; ARIMA specs that cannot be Kalman-stepped fall back to
+    ``ARIMAForecaster.update`` with a warning. Feature models are fit once per
+    horizon and read their input window from a ring buffer of the last
+    ``max(lookback)`` values. Only the target series is streamed, so configs
+    with ``features`` or a ``panel`` are rejected.
+    """
+
+    def __init__(self, config: RunConfig, history: pd.Series | None = None) -> None:
+        if config.features:
+            raise ValueError("Streaming forecasts read the target only; remove the features block")
+        if config.panel is not None:
+            raise ValueError("Streaming forecasts follow a single series; remove the panel block")
+        self.config = config
+        history = load_target_series(config) if history is None else history
+        self.horizons = sorted({h.steps_ahead for h in config.horizons})
+        self.max_steps = max(self.horizons)
+        capacity = max(h.lookback for h in config.horizons)
+        self.buffer = RingBuffer(capacity)
+        self.buffer.extend(history.to_numpy(dtype=float)[-capacity:])
+        self.latency = LatencyHistogram()
+        self.last_timestamp: Any = history.index[-1] if len(history) else None
+        self._freq = getattr(history.index, "freq", None)
+        self.series_slots: List[_SeriesSlot] = []
+        self.feature_slots: List[_FeatureSlot] = []
+        self._lock = Lock()
+
+        for model_cfg in config.models:
+            try:
+                handle = build_model(model_cfg)
+            except ImportError as exc:
+                print(f"Skipping model {model_cfg.name} ({model_cfg.type}): {exc}", file=sys.stderr)
+                continue
+            if handle.mode == "series":
+                self.series_slots.append(self._fit_series(handle, history))
+            else:
+                self.feature_slots.extend(self._fit_features(model_cfg, handle, history))
+
+    def _fit_series(self, handle: ModelHandle, history: pd.Series) -> _SeriesSlot:
+        model = handle.model
+        model.fit_series(history)
+        stepper = None
+        if isinstance(model, ARIMAForecaster):
+            if _StateSpaceStepper.supports(model.fitted_):
+                stepper = _StateSpaceStepper(model.fitted_, self.max_steps)
+            else:
+                warnings.warn(
+                    f"{handle.name} has a trend or time-varying system, so every bar is filtered by "
+                    "statsmodels (milliseconds per tick rather than microseconds)",
+                    RuntimeWarning,
+                    stacklevel=3,
+                )
+        return _SeriesSlot(name=handle.name, model=model, stepper=stepper)
+
+    def _fit_features(self, model_cfg: Any, handle: ModelHandle, history: pd.Series) -> List[_FeatureSlot]:
+        slots = []
+        for index, horizon in enumerate(self.config.horizons):
+            model = handle.model if index == 0 else build_model(model_cfg).model
+            dataset = make_windowed_dataset(
+                history,
+                lookback=horizon.lookback,
+                horizon=horizon.steps_ahead,
+                dtype=self.config.feature_dtype,
+            )
+            fit_windows(model, dataset.features, dataset.targets)
+            slots.append(
+                _FeatureSlot(
+                    name=handle.name,
+                    steps_ahead=horizon.steps_ahead,
+                    lookback=horizon.lookback,
+                    model=model,
+                    forward=_dense_forward(getattr(model, "estimator", None)),
+                )
+            )
+        return slots
+
+    def step(self, value: float, timestamp: Any = None) -> List[Dict[str, Any]]:
+        """Absorb one observation and return a forecast record per (model, horizon)."""
+
+        with self._lock:
+            start = perf_counter()
+            self.buffer.append(value)
+            if timestamp is not None:
+                self.last_timestamp = timestamp
+            elif self._freq is not None and isinstance(self.last_timestamp, pd.Timestamp):
+                # Untimestamped bars are assumed to arrive at the history's frequency.
+                self.last_timestamp = self.last_timestamp + self._freq
+            forecasts: List[Tuple[str, int, float]] = []
+            for slot in self.series_slots:
+                slot.update(value)
+                path = slot.forecast(self.max_steps)
+                forecasts.extend((slot.name, steps, float(path[steps - 1])) for steps in self.horizons)
+            for slot in self.feature_slots:
+                window = self.buffer.latest(slot.lookback)[np.newaxis, :]
+                forecasts.append((slot.name, slot.steps_ahead, slot.predict(window)))
+            self.latency.record(perf_counter() - start)
+            origin = None if self.last_timestamp is None else str(self.last_timestamp)
+
+        return [
+            {"origin": origin, "model": name, "horizon": f"{steps}d", "forecast": forecast}
+            for name, steps, forecast in forecasts
+        ]
+
+
+def parse_bar(line: str) -> Tuple[Any, float] | None:
+    """Parse ``value``, ``timestamp,value`` or a JSON object with ``value`` (and optional ``timestamp``)."""
+
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    if line.startswith("{"):
+        payload = json.loads(line)
+        return payload.get("timestamp"), float(payload["value"])
+    parts = line.split(",")
+    if len(parts) == 1:
+        return None, float(parts[0])
+    return parts[0], float(parts[-1])
+
+
+def iter_file_tail(path: Path, poll_interval: float = 0.1, from_start: bool = False) -> Iterator[str]:
+    """Yield lines appended to ``path``, like ``tail -f``."""
+
+    with Path(path).open("r", encoding="utf-8") as handle:
+        if not from_start:
+            handle.seek(0, 2)
+        pending = ""
+        while True:
+            chunk = handle.readline()
+            if not chunk:
+                time.sleep(poll_interval)
+                continue
+            pending += chunk
+            if pending.endswith("\n"):
+                yield pending
+                pending = ""
+
+
+def run_stream(forecaster: StreamingForecaster, lines: Iterable[str], out: TextIO = sys.stdout) -> None:
+    """Feed parsed bars into ``forecaster`` and publish forecasts as JSON lines."""
+
+    for line in lines:
+        try:
+            bar = parse_bar(line)
+        except (ValueError, KeyError) as exc:
+            print(f"Skipping malformed bar {line.strip()!r}: {exc}", file=sys.stderr)
+            continue
+        if bar is None:
+            continue
+        timestamp, value = bar
+        for record in forecaster.step(value, timestamp):
+            out.write(json.dumps(record) + "\n")
+        out.flush()
+
+
+def serve_http(forecaster: StreamingForecaster, host: str = "127.0.0.1", port: int = 8765) -> ThreadingHTTPServer:
+    """Build a local HTTP server: ``POST /bar`` ingests a bar, ``GET /stats`` reports latency."""
+
+    latest: List[Dict[str, Any]] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, status: int, payload: Any) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self) -> None:  # noqa: N802 - http.server naming
+            if self.path != "/bar":
+                self._reply(404, {"error": "unknown path"})
+                return
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                bar = parse_bar(self.rfile.read(length).decode("utf-8"))
+            except (ValueError, KeyError) as exc:
+                self._reply(400, {"error": str(exc)})
+                return
+            if bar is None:
+                self._reply(400, {"error": "empty bar"})
+                return
+            records = forecaster.step(bar[1], bar[0])
+            latest[:] = records
+            self._reply(200, records)
+
+        def do_GET(self) -> None:  # noqa: N802 - http.server naming
+            if self.path == "/stats":
+                self._reply(200, forecaster.latency.summary())
+            elif self.path == "/forecast":
+                self._reply(200, latest)
+            else:
+                self._reply(404, {"error": "unknown path"})
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - stdlib signature
+            return
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+__all__ = [
+    "LatencyHistogram",
+    "RingBuffer",
+    "StreamingForecaster",
+    "iter_file_tail",
+    "parse_bar",
+    "run_stream",
+    "serve_http",
+]
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eth_price_predictor.backtest import walk_forward_forecast
+from eth_price_predictor.models.classical import ARIMAForecaster, HoltForecaster, SESForecaster
+
+holtwinters = pytest.importorskip("statsmodels.tsa.holtwinters")
+
+STEPS_AHEAD = 3
+
+
+@pytest.fixture
+def series() -> pd.Series:
+    rng = np.random.default_rng(11)
+    values = 100 * np.exp(np.cumsum(rng.normal(0.001, 0.02, 160)))
+    return pd.Series(values, index=pd.date_range("2022-01-01", periods=len(values), freq="D"))
+
+
+def _origins(series: pd.Series, targets: pd.DatetimeIndex) -> np.ndarray:
+    return series.index.get_indexer(targets) - STEPS_AHEAD
+
+
+def _initial_state(model: SESForecaster | HoltForecaster) -> tuple[float, float | None]:
+    fitted = model.fitted_
+    if hasattr(fitted, "initial_level"):
+        trend = None if fitted.initial_trend is None else float(fitted.initial_trend[0])
+        return float(fitted.initial_level[0]), trend
+    return float(fitted.params["initial_level"]), fitted.params.get("initial_trend")
+
+
+@pytest.mark.parametrize("cls", [SESForecaster, HoltForecaster])
+@pytest.mark.parametrize("backend", ["statsmodels", "numpy"])
+def test_smoothing_updates_match_refiltering_each_prefix(series: pd.Series, cls: type, backend: str) -> None:
+    targets = series.index[-30:]
+    model = cls({"backend": backend})
+    predictions = walk_forward_forecast(model, series, targets, STEPS_AHEAD)
+
+    # The incremental path must equal re-running the recursion over each whole prefix
+    # with the parameters and initial state of the first fit.
+    first = cls({"backend": backend}).fit_series(series.iloc[: _origins(series, targets)[0] + 1])
+    level, trend = _initial_state(first)
+    expected = []
+    for origin in _origins(series, targets):
+        prefix = series.iloc[: origin + 1].to_numpy()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            if cls is SESForecaster:
+                reference = holtwinters.SimpleExpSmoothing(
+                    prefix, initialization_method="known", initial_level=level
+                ).fit(smoothing_level=first._alpha, optimized=False)
+            else:
+                reference = holtwinters.Holt(
+                    prefix, initialization_method="known", initial_level=level, initial_trend=trend
+                ).fit(smoothing_level=first._alpha, smoothing_trend=first._beta, optimized=False)
+        expected.append(reference.forecast(STEPS_AHEAD)[-1])
+    np.testing.assert_allclose(predictions, expected, rtol=1e-9)
+
+
+@pytest.mark.parametrize("cls", [SESForecaster, HoltForecaster])
+def test_refit_every_origin_matches_fitting_each_prefix(series: pd.Series, cls: type) -> None:
+    targets = series.index[-12:]
+    predictions = walk_forward_forecast(cls({"backend": "numpy"}), series, targets, STEPS_AHEAD, refit_every=1)
+    expected = [
+        cls({"backend": "numpy"}).fit_series(series.iloc[: origin + 1]).forecast(STEPS_AHEAD)[-1]
+        for origin in _origins(series, targets)
+    ]
+    np.testing.assert_allclose(predictions, expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "params", [{"order": (1, 1, 1)}, {"order": (1, 1, 1), "trend": "t"}, {"order": (1, 0, 0), "trend": "ct"}]
+)
+def test_arima_updates_match_applying_the_first_fit_to_each_prefix(series: pd.Series, params: dict) -> None:
+    targets = series.index[-20:]
+    predictions = walk_forward_forecast(ARIMAForecaster(params), series, targets, STEPS_AHEAD)
+
+    first = ARIMAForecaster(params).fit_series(series.iloc[: _origins(series, targets)[0] + 1]).fitted_
+    expected = [
+        np.asarray(first.apply(series.iloc[: origin + 1]).forecast(STEPS_AHEAD))[-1]
+        for origin in _origins(series, targets)
+    ]
+    np.testing.assert_allclose(predictions, expected, rtol=1e-8)
+
+
+def test_arima_warm_started_refits_are_no_worse_than_cold_fits(series: pd.Series) -> None:
+    params = {"order": (1, 1, 1)}
+    origins = _origins(series, series.index[-6:])
+    warm = ARIMAForecaster(params).fit_series(series.iloc[: origins[0]])
+    for origin in origins:
+        warm.refit(series.iloc[: origin + 1])
+        cold = ARIMAForecaster(params).fit_series(series.iloc[: origin + 1])
+        # The likelihood is flat enough that a cold start can stop at a worse optimum.
+        assert warm.fitted_.llf >= cold.fitted_.llf - 1e-6
+        if warm.fitted_.llf - cold.fitted_.llf < 1e-6:
+            np.testing.assert_allclose(warm.forecast(STEPS_AHEAD), cold.forecast(STEPS_AHEAD), rtol=1e-4)
+
+
+HORIZONS = [
+    {"steps_ahead": 1, "lookback": 10, "test_size": 20},
+    {"steps_ahead": 3, "lookback": 10, "test_size": 30},
+    {"steps_ahead": 7, "lookback": 10, "test_size": 40},
+]
+
+
+def _grid_config(tmp_path, series: pd.Series, model: dict, horizons: list, series_fits: str) -> "RunConfig":
+    from eth_price_predictor import RunConfig
+
+    tmp_path.mkdir(parents=True, exist_ok=True)
+    csv_path = tmp_path / "prices.csv"
+    series.rename("Close").rename_axis("Date").reset_index().to_csv(csv_path, index=False)
+    return RunConfig.from_mapping(
+        {
+            "data_path": str(csv_path),
+            "output_dir": str(tmp_path / "out"),
+            "cache": {"enabled": False},
+            "ledger": {"enabled": False},
+            "horizons": horizons,
+            "models": [model],
+            "backtest": {"series_fits": series_fits},
+        }
+    )
+
+
+def _metrics(results: pd.DataFrame) -> pd.DataFrame:
+    return results.set_index("horizon")[["mae", "rmse", "mape", "r2", "directional_accuracy"]].sort_index()
+
+
+def _separate_runs(tmp_path, series: pd.Series, model: dict) -> pd.DataFrame:
+    from eth_price_predictor import run_experiments
+
+    runs = [
+        run_experiments(_grid_config(tmp_path / str(position), series, model, [horizon], "independent"))
+        for position, horizon in enumerate(HORIZONS)
+    ]
+    return _metrics(pd.concat(runs))
+
+
+@pytest.mark.parametrize("series_fits", ["independent", "warm_start", "shared_prefix"])
+def test_series_group_matches_separate_runs_when_histories_coincide(
+    tmp_path, series: pd.Series, series_fits: str
+) -> None:
+    from eth_price_predictor import run_experiments
+
+    # Equal test sizes give every horizon the same history, so one fit must serve all of them.
+    horizons = [dict(horizon, test_size=30) for horizon in HORIZONS]
+    model = {"name": "ses", "type": "ses"}
+    grouped = _metrics(run_experiments(_grid_config(tmp_path, series, model, horizons, series_fits)))
+    separate = [
+        run_experiments(_grid_config(tmp_path / str(position), series, model, [horizon], "independent"))
+        for position, horizon in enumerate(horizons)
+    ]
+    pd.testing.assert_frame_equal(grouped, _metrics(pd.concat(separate)), rtol=1e-12)
+
+
+@pytest.mark.parametrize("model", [{"name": "ses", "type": "ses"}, {"name": "holt", "type": "holt"}])
+def test_shared_prefix_matches_fitting_the_shortest_history_and_filtering_on(
+    tmp_path, series: pd.Series, model: dict
+) -> None:
+    from eth_price_predictor import run_experiments
+    from eth_price_predictor.config import ModelConfig
+    from eth_price_predictor.metrics import compute_regression_metrics
+    from eth_price_predictor.models import build_model
+    from eth_price_predictor.runner import load_target_series
+
+    config = _grid_config(tmp_path, series, model, HORIZONS, "shared_prefix")
+    grouped = _metrics(run_experiments(config))
+    separate = _separate_runs(tmp_path / "separate", series, model)
+    # The cell with the shortest history is fit exactly as a separate run would fit it.
+    pd.testing.assert_frame_equal(grouped.loc[["7d"]], separate.loc[["7d"]], rtol=1e-12)
+
+    # Longer histories keep that fit's parameters and only filter the extra observations.
+    series = load_target_series(config)
+    shortest = len(series) - HORIZONS[-1]["test_size"] - 1
+    for horizon in HORIZONS[:-1]:
+        end, steps = len(series) - horizon["test_size"] - 1, horizon["steps_ahead"]
+        forecaster = build_model(ModelConfig.from_mapping(model)).model.fit_series(series.iloc[: shortest + 1])
+        forecaster.update(series.iloc[shortest + 1 : end + 1])
+        targets = series.iloc[end + 1 :].to_numpy()
+        origins = series.iloc[end + 1 - steps : len(series) - steps].to_numpy()
+        expected = compute_regression_metrics(targets, forecaster.forecast(len(targets)), reference=origins)
+        assert grouped.loc[f"{steps}d"].to_dict() == pytest.approx(expected, rel=1e-12)
+
+
+def test_warm_started_arima_group_matches_separate_runs(tmp_path, series: pd.Series) -> None:
+    from eth_price_predictor import run_experiments
+
+    model = {"name": "arima", "type": "arima", "params": {"order": [1, 1, 0]}}
+    grouped = _metrics(run_experiments(_grid_config(tmp_path, series, model, HORIZONS, "warm_start")))
+    pd.testing.assert_frame_equal(grouped, _separate_runs(tmp_path / "separate", series, model), rtol=1e-5)
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from eth_price_predictor import RunConfig, run_experiments
+from eth_price_predictor import cache
+
+
+def _config(tmp_path, smoothing_level: float) -> RunConfig:
+    csv_path = tmp_path / "prices.csv"
+    prices = 100 + np.cumsum(np.random.default_rng(2).normal(0, 1, 120))
+    pd.DataFrame({"Date": pd.date_range("2021-01-01", periods=120, freq="D"), "Close": prices}).to_csv(
+        csv_path, index=False
+    )
+    return RunConfig.from_mapping(
+        {
+            "data_path": str(csv_path),
+            "output_dir": str(tmp_path / "out"),
+            "ledger": {"enabled": False},
+            "horizons": [{"steps_ahead": 1, "lookback": 10, "test_size": 20}],
+            "models": [{"name": "ses", "type": "ses", "params": {"smoothing_level": smoothing_level}}],
+        }
+    )
+
+
+def test_config_and_code_changes_miss_the_cache(tmp_path, monkeypatch) -> None:
+    assert not run_experiments(_config(tmp_path, 0.5))["cache_hit"].any()
+    assert run_experiments(_config(tmp_path, 0.5))["cache_hit"].all()
+    assert not run_experiments(_config(tmp_path, 0.3))["cache_hit"].any()
+
+    monkeypatch.setattr(cache, "source_digest", lambda: "edited")
+    assert not run_experiments(_config(tmp_path, 0.5))["cache_hit"].any()
+    assert run_experiments(_config(tmp_path, 0.5))["cache_hit"].all()
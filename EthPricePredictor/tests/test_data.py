@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eth_price_predictor.data import load_long_panel, make_windowed_dataset
+
+
+def test_long_panel_drops_text_columns_when_resampling(tmp_path: Path) -> None:
+    dates = pd.to_datetime(["2024-01-01", "2024-01-03", "2024-01-04"])
+    frame = pd.DataFrame(
+        {
+            "Date": list(dates) * 2,
+            "asset": ["BTC"] * 3 + ["ETH"] * 3,
+            "exchange": ["binance", "kraken", "binance"] * 2,
+            "Close": [100.0, 120.0, 130.0, 10.0, 14.0, 15.0],
+        }
+    )
+    path = tmp_path / "panel.csv"
+    frame.to_csv(path, index=False)
+
+    panel = load_long_panel(path)
+    assert sorted(panel) == ["BTC", "ETH"]
+    assert list(panel["BTC"].columns) == ["Close"]
+    np.testing.assert_allclose(panel["BTC"]["Close"], [100.0, 110.0, 120.0, 130.0])
+    np.testing.assert_allclose(panel["ETH"]["Close"], [10.0, 12.0, 14.0, 15.0])
+
+    unresampled = load_long_panel(path, frequency=None)
+    assert list(unresampled["ETH"]["exchange"]) == ["binance", "kraken", "binance"]
+
+
+def _naive_windows(values: np.ndarray, lookback: int, horizon: int) -> tuple[np.ndarray, np.ndarray]:
+    features, targets = [], []
+    for end in range(lookback, len(values) - horizon + 1):
+        features.append(values[end - lookback : end])
+        targets.append(values[end + horizon - 1])
+    return np.array(features), np.array(targets)
+
+
+@pytest.mark.parametrize("lookback, horizon", [(1, 1), (5, 1), (7, 3), (30, 10)])
+@pytest.mark.parametrize("dtype", ["float64", "float32"])
+def test_windows_match_a_naive_loop(lookback: int, horizon: int, dtype: str) -> None:
+    values = np.random.default_rng(5).normal(100, 10, 120)
+    series = pd.Series(values, index=pd.date_range("2023-01-01", periods=len(values), freq="h"))
+    dataset = make_windowed_dataset(series, lookback, horizon, dtype=dtype)
+
+    features, targets = _naive_windows(values.astype(dtype), lookback, horizon)
+    assert dataset.features.dtype == np.dtype(dtype)
+    np.testing.assert_array_equal(dataset.features, features)
+    np.testing.assert_array_equal(dataset.targets, targets)
+    pd.testing.assert_index_equal(dataset.indices, series.index[lookback + horizon - 1 :])
+
+
+def test_windows_and_splits_are_read_only_views() -> None:
+    series = pd.Series(np.arange(50.0), index=pd.date_range("2023-01-01", periods=50, freq="D"))
+    dataset = make_windowed_dataset(series, 8, 2)
+    train, test = dataset.split(10)
+    for part in (dataset, train, test):
+        assert not part.features.flags.writeable and not part.targets.flags.writeable
+        assert np.shares_memory(part.features, dataset.features)
+    assert len(test.features) == 10 and test.indices[0] == dataset.indices[-10]
+    with pytest.raises(ValueError):
+        make_windowed_dataset(series, 45, 6)
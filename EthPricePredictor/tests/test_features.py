@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eth_price_predictor.config import FeatureConfig
+from eth_price_predictor.data import make_windowed_dataset
+from eth_price_predictor.features import build_feature_frame
+
+
+@pytest.fixture
+def ohlcv() -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    close = 1000 * np.exp(np.cumsum(rng.normal(0, 0.02, 400)))
+    index = pd.date_range("2020-01-01", periods=len(close), freq="D")
+    return pd.DataFrame(
+        {
+            "Close": close,
+            "High": close * (1 + rng.uniform(0, 0.03, len(close))),
+            "Low": close * (1 - rng.uniform(0, 0.03, len(close))),
+            "Volume": rng.uniform(1e6, 5e6, len(close)),
+        },
+        index=index,
+    )
+
+
+def test_features_match_pandas(ohlcv: pd.DataFrame) -> None:
+    features = [
+        FeatureConfig.from_mapping({"kind": "returns", "window": 3}),
+        FeatureConfig.from_mapping({"kind": "log_returns", "window": 1}),
+        FeatureConfig.from_mapping({"kind": "volatility", "window": 10}),
+        FeatureConfig.from_mapping({"kind": "volume_zscore", "window": 20}),
+        FeatureConfig.from_mapping({"kind": "range", "window": 5}),
+    ]
+    frame = build_feature_frame(ohlcv, "Close", features)
+
+    close = ohlcv["Close"]
+    log_returns = np.log(close / close.shift(1))
+    volume = ohlcv["Volume"].rolling(20)
+    expected = pd.DataFrame(
+        {
+            "returns_3": close / close.shift(3) - 1,
+            "log_returns_1": log_returns,
+            "volatility_10": log_returns.rolling(10).std(ddof=0),
+            "volume_zscore_20": (ohlcv["Volume"] - volume.mean()) / volume.std(ddof=0),
+            "range_5": ((ohlcv["High"] - ohlcv["Low"]) / close).rolling(5).mean(),
+            "Close": close,
+        }
+    )
+    pd.testing.assert_frame_equal(frame, expected, check_freq=False, rtol=1e-9, atol=1e-12)
+
+
+def test_feature_cache_round_trip(ohlcv: pd.DataFrame, tmp_path) -> None:
+    features = [FeatureConfig.from_mapping({"kind": "volatility", "window": 5})]
+    first = build_feature_frame(ohlcv, "Close", features, cache_dir=tmp_path, data_hash="abc")
+    assert len(list(tmp_path.glob("*.npy"))) == 1
+    second = build_feature_frame(ohlcv, "Close", features, cache_dir=tmp_path, data_hash="abc")
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_feature_windows_are_bar_major_views(ohlcv: pd.DataFrame) -> None:
+    features = [FeatureConfig.from_mapping({"kind": "returns", "window": 2})]
+    frame = build_feature_frame(ohlcv, "Close", features)
+    dataset = make_windowed_dataset(frame, lookback=4, horizon=2)
+
+    values = frame.to_numpy()[2:]  # warm-up rows dropped
+    assert np.shares_memory(dataset.features, dataset.features[1])
+    np.testing.assert_array_equal(dataset.features[0], values[:4].ravel())
+    np.testing.assert_array_equal(dataset.features[5], values[5:9].ravel())
+    assert dataset.targets[0] == values[5, -1]
+    assert dataset.indices[0] == frame.index[2 + 5]
+
+
+def test_lstm_reads_feature_windows_as_bar_sequences(ohlcv: pd.DataFrame) -> None:
+    pytest.importorskip("tensorflow")
+    from eth_price_predictor.models.neural import LSTMForecaster
+
+    features = [FeatureConfig.from_mapping({"kind": "returns", "window": 1})]
+    frame = build_feature_frame(ohlcv, "Close", features)
+    dataset = make_windowed_dataset(frame, lookback=6, horizon=1, dtype="float32")
+    model = LSTMForecaster({"units": 4, "epochs": 1}).fit(dataset.features, dataset.targets, channels=2)
+
+    assert model._inference.channels == 2
+    assert model._inference.recurrent[0][0].shape == (2, 16)
+    assert model.predict(dataset.features[:3]).shape == (3,)
+
+
+@pytest.mark.parametrize("window", [2, 24, 500])
+def test_cumulative_kernels_stay_accurate_on_long_series(window: int) -> None:
+    rng = np.random.default_rng(9)
+    close = 3000 * np.exp(np.cumsum(rng.normal(0, 0.002, 50_000)))
+    frame = pd.DataFrame(
+        {"Close": close, "Volume": rng.uniform(1e8, 5e8, len(close))},
+        index=pd.date_range("2020-01-01", periods=len(close), freq="min"),
+    )
+    features = [
+        FeatureConfig.from_mapping({"kind": "volatility", "window": window}),
+        FeatureConfig.from_mapping({"kind": "volume_zscore", "window": window}),
+    ]
+    result = build_feature_frame(frame, "Close", features)
+
+    log_returns = np.log(frame["Close"] / frame["Close"].shift(1))
+    volume = frame["Volume"].rolling(window)
+    np.testing.assert_allclose(
+        result[f"volatility_{window}"], log_returns.rolling(window).std(ddof=0), rtol=1e-6, atol=1e-12
+    )
+    np.testing.assert_allclose(
+        result[f"volume_zscore_{window}"],
+        (frame["Volume"] - volume.mean()) / volume.std(ddof=0),
+        rtol=1e-6,
+        atol=1e-9,
+    )
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eth_price_predictor.ingest import BAR_COLUMNS, aggregate_bars
+
+
+@pytest.fixture
+def ticks(tmp_path: Path) -> tuple[Path, pd.DataFrame]:
+    rng = np.random.default_rng(8)
+    # Irregular ticks over about nine hours, starting off any bar boundary.
+    offsets = np.cumsum(rng.exponential(20, 1500)).astype("int64")
+    frame = pd.DataFrame(
+        {
+            "Date": pd.Timestamp("2024-03-05 06:13:27") + pd.to_timedelta(offsets, unit="s"),
+            "Price": 3000 + np.cumsum(rng.normal(0, 2, len(offsets))),
+            "Volume": rng.uniform(0.1, 5, len(offsets)),
+        }
+    )
+    path = tmp_path / "ticks.csv"
+    frame.to_csv(path, index=False)
+    return path, frame
+
+
+def _expected(frame: pd.DataFrame, frequency: str) -> pd.DataFrame:
+    ticks = frame.set_index("Date")
+    bars = ticks["Price"].resample(frequency, origin="epoch").ohlc()
+    bars.columns = list(BAR_COLUMNS[:4])
+    bars["Volume"] = ticks["Volume"].resample(frequency, origin="epoch").sum()
+    bars.index.name = "Date"
+    return bars.dropna(subset=["Open"])
+
+
+def _read(path: Path) -> pd.DataFrame:
+    return pd.read_csv(path, parse_dates=["Date"], index_col="Date")
+
+
+@pytest.mark.parametrize("chunksize", [37, 500, 10_000])
+def test_chunked_bars_match_one_shot_resample(ticks, tmp_path: Path, chunksize: int) -> None:
+    source, frame = ticks
+    # 2min and 3min do not nest, so 3min bars are built from raw ticks rather than 2min bars.
+    frequencies = ("1min", "2min", "3min", "7min", "1h")
+    outputs = aggregate_bars(source, tmp_path / "bars", frequencies, chunksize=chunksize)
+    for frequency in frequencies:
+        pd.testing.assert_frame_equal(
+            _read(outputs[frequency]), _expected(frame, frequency), check_freq=False, rtol=1e-12
+        )
+
+
+def test_bar_split_across_a_chunk_boundary(tmp_path: Path) -> None:
+    source = tmp_path / "ticks.csv"
+    pd.DataFrame(
+        {
+            "Date": ["2024-01-01 00:00:10", "2024-01-01 00:00:50", "2024-01-01 00:01:05", "2024-01-01 00:01:30"],
+            "Price": [10.0, 12.0, 9.0, 11.0],
+            "Volume": [1.0, 2.0, 3.0, 4.0],
+        }
+    ).to_csv(source, index=False)
+    # Each chunk holds one tick, so every minute bar straddles a boundary.
+    bars = _read(aggregate_bars(source, tmp_path, ("1min",), chunksize=1)["1min"])
+    assert bars.to_dict("list") == {
+        "Open": [10.0, 9.0],
+        "High": [12.0, 11.0],
+        "Low": [10.0, 9.0],
+        "Close": [12.0, 11.0],
+        "Volume": [3.0, 7.0],
+    }
+
+
+def test_bars_are_anchored_to_the_epoch(ticks, tmp_path: Path) -> None:
+    source, frame = ticks
+    bars = _read(aggregate_bars(source, tmp_path, ("7min",))["7min"])
+    epoch = pd.Timestamp(0)
+    assert ((bars.index - epoch) % pd.Timedelta("7min") == pd.Timedelta(0)).all()
+    # pandas' default origin (midnight of the first day) puts 7min buckets elsewhere.
+    start_day = frame.set_index("Date")["Price"].resample("7min").first().dropna()
+    assert not bars.index.equals(start_day.index)
+
+
+def test_unsorted_source_is_rejected(ticks, tmp_path: Path) -> None:
+    source, frame = ticks
+    frame.iloc[::-1].to_csv(source, index=False)
+    with pytest.raises(ValueError, match="sorted"):
+        aggregate_bars(source, tmp_path / "bars", ("1min",), chunksize=100)
+    assert not list((tmp_path / "bars").glob("*"))
+
+
+def test_calendar_frequencies_are_rejected(ticks, tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="fixed length"):
+        aggregate_bars(ticks[0], tmp_path / "bars", ("1min", "ME"))
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eth_price_predictor import RunConfig, run_experiments
+from eth_price_predictor.ledger import ExperimentLedger, ResumeError
+
+
+def _config(tmp_path, prices: np.ndarray) -> RunConfig:
+    csv_path = tmp_path / "prices.csv"
+    dates = pd.date_range("2021-01-01", periods=len(prices), freq="D")
+    pd.DataFrame({"Date": dates, "Close": prices}).to_csv(csv_path, index=False)
+    return RunConfig.from_mapping(
+        {
+            "data_path": str(csv_path),
+            "target_column": "Close",
+            "frequency": "D",
+            "output_dir": str(tmp_path / "out"),
+            "cache": {"enabled": False},
+            "horizons": [{"steps_ahead": 1, "lookback": 10, "test_size": 20}],
+            "models": [{"name": "ses", "type": "ses"}],
+        }
+    )
+
+
+def _reopen_last_run(config: RunConfig) -> None:
+    with ExperimentLedger(config.output_dir / "ledger.sqlite") as ledger:
+        run_id = ledger.runs()["run_id"].iloc[-1]
+        ledger.finish_run(run_id, status="failed")
+
+
+def test_resume_skips_cells_of_unchanged_data(tmp_path) -> None:
+    prices = 100 + np.cumsum(np.random.default_rng(1).normal(0, 1, 120))
+    config = _config(tmp_path, prices)
+    first = run_experiments(config)
+    _reopen_last_run(config)
+
+    config.ledger.resume = "latest"
+    resumed = run_experiments(config)
+    assert resumed["runtime_sec"].tolist() == first["runtime_sec"].tolist()
+
+
+def test_resume_recomputes_cells_when_data_changes(tmp_path) -> None:
+    prices = 100 + np.cumsum(np.random.default_rng(1).normal(0, 1, 120))
+    config = _config(tmp_path, prices)
+    first = run_experiments(config)
+    _reopen_last_run(config)
+
+    config = _config(tmp_path, prices * 2)
+    config.ledger.resume = "latest"
+    resumed = run_experiments(config)
+    assert resumed["mae"].iloc[0] == pytest.approx(2 * first["mae"].iloc[0], rel=1e-3)
+    with ExperimentLedger(config.output_dir / "ledger.sqlite") as ledger:
+        assert len(ledger.results()) == 2
+
+
+def test_resume_without_unfinished_run(tmp_path) -> None:
+    with ExperimentLedger(tmp_path / "ledger.sqlite") as ledger:
+        with pytest.raises(ResumeError):
+            ledger.start_run({}, "latest")
+
+
+def test_resume_of_unknown_run_id_does_not_start_a_fresh_run(tmp_path) -> None:
+    with ExperimentLedger(tmp_path / "ledger.sqlite") as ledger:
+        run_id = ledger.start_run({})
+        with pytest.raises(ResumeError, match="no-such-run"):
+            ledger.start_run({}, "no-such-run")
+        assert ledger.runs()["run_id"].tolist() == [run_id]
+        assert ledger.start_run({}, run_id) == run_id
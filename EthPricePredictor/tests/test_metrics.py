@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from eth_price_predictor.metrics import batch_regression_metrics, compute_regression_metrics
+
+
+@pytest.fixture
+def stack() -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(3)
+    y_true = 100 + np.cumsum(rng.normal(0, 1, (4, 3, 5)), axis=-1)
+    y_pred = y_true + rng.normal(0, 1, y_true.shape)
+    return y_true, y_pred
+
+
+def _assert_matches(batch: dict, expected: list) -> None:
+    for name, values in batch.items():
+        np.testing.assert_allclose(np.ravel(values), [entry[name] for entry in expected], err_msg=name)
+
+
+@pytest.mark.parametrize("axis", [0, 1, -1])
+def test_3d_stack_matches_per_series_metrics(stack: tuple[np.ndarray, np.ndarray], axis: int) -> None:
+    y_true, y_pred = stack
+    batch = batch_regression_metrics(y_true, y_pred, axis=axis)
+
+    moved_true, moved_pred = np.moveaxis(y_true, axis, -1), np.moveaxis(y_pred, axis, -1)
+    expected = [
+        compute_regression_metrics(series_true, series_pred)
+        for series_true, series_pred in zip(
+            moved_true.reshape(-1, moved_true.shape[-1]), moved_pred.reshape(-1, moved_pred.shape[-1])
+        )
+    ]
+    _assert_matches(batch, expected)
+
+
+def test_2d_stack_reduced_over_rows(stack: tuple[np.ndarray, np.ndarray]) -> None:
+    y_true, y_pred = stack[0][0], stack[1][0]
+    batch = batch_regression_metrics(y_true, y_pred, axis=0)
+    assert batch["directional_accuracy"].shape == (5,)
+    _assert_matches(batch, [compute_regression_metrics(y_true[:, col], y_pred[:, col]) for col in range(5)])
+
+
+def test_2d_stack_with_reference(stack: tuple[np.ndarray, np.ndarray]) -> None:
+    y_true, y_pred = stack[0][0], stack[1][0]
+    reference = y_true - 0.5
+    batch = batch_regression_metrics(y_true, y_pred, reference, axis=0)
+    expected = [
+        compute_regression_metrics(y_true[:, col], y_pred[:, col], reference[:, col]) for col in range(5)
+    ]
+    _assert_matches(batch, expected)
+
+
+def test_directional_accuracy_needs_a_single_axis_without_reference(stack: tuple[np.ndarray, np.ndarray]) -> None:
+    with pytest.raises(ValueError, match="single reduction axis"):
+        batch_regression_metrics(*stack, axis=(1, 2))
+    reference = stack[0] - 0.5
+    assert batch_regression_metrics(*stack, reference, axis=(1, 2))["mae"].shape == (4,)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import copy
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eth_price_predictor import RunConfig, run_experiments
+from eth_price_predictor.data import make_windowed_dataset
+from eth_price_predictor.metrics import compute_regression_metrics
+from eth_price_predictor.model_store import ModelStore, Predictor
+from eth_price_predictor.runner import load_panel_series
+
+pytest.importorskip("sklearn")
+
+LOOKBACK, TEST_SIZE = 10, 20
+
+
+def _config(tmp_path, prices: np.ndarray) -> RunConfig:
+    csv_path = tmp_path / "prices.csv"
+    dates = pd.date_range("2021-01-01", periods=len(prices), freq="D")
+    pd.DataFrame({"Date": dates, "Close": prices}).to_csv(csv_path, index=False)
+    return RunConfig.from_mapping(
+        {
+            "data_path": str(csv_path),
+            "output_dir": str(tmp_path / "out"),
+            "cache": {"enabled": False},
+            "ledger": {"enabled": False},
+            "model_store": {"enabled": True},
+            "horizons": [{"steps_ahead": 1, "lookback": LOOKBACK, "test_size": TEST_SIZE}],
+            "models": [
+                {"name": "ses", "type": "ses"},
+                {"name": "mlp", "type": "mlp", "params": {"hidden_layer_sizes": [8], "max_iter": 50}},
+            ],
+        }
+    )
+
+
+@pytest.fixture
+def stored(tmp_path):
+    prices = 100 + np.cumsum(np.random.default_rng(3).normal(0, 1, 150))
+    config = _config(tmp_path, prices)
+    with warnings.catch_warnings():
+        # The small MLP stops before converging.
+        warnings.simplefilter("ignore")
+        results = run_experiments(config)
+    return config, results.set_index("model"), ModelStore(config.output_dir / "models")
+
+
+def test_saved_models_reproduce_the_run_metrics(stored) -> None:
+    config, results, store = stored
+    assert sorted(store.metadata) == ["mlp-1d", "ses-1d"]
+    series = load_panel_series(config)[None]
+    _, test = make_windowed_dataset(series, lookback=LOOKBACK, horizon=1).split(TEST_SIZE)
+    for key, predictions in (
+        ("mlp-1d", store.load("mlp-1d").predict(test.features)),
+        ("ses-1d", store.load("ses-1d").forecast(TEST_SIZE)),
+    ):
+        entry = store.metadata[key]
+        assert pd.Timestamp(entry.training_end) == series.index[-TEST_SIZE - 1]
+        metrics = compute_regression_metrics(test.targets, predictions, reference=test.features[:, -1])
+        for name in ("mae", "rmse", "r2"):
+            assert metrics[name] == pytest.approx(results.loc[entry.model.name, name], rel=1e-12)
+
+
+def test_predictor_forecasts_equal_the_saved_models(stored) -> None:
+    config, _, store = stored
+    series = load_panel_series(config)[None]
+    ses = copy.deepcopy(store.load("ses-1d"))
+    mlp = store.load("mlp-1d")
+    predictor = Predictor(ModelStore(store.directory))
+
+    def forecasts(data: pd.Series) -> dict:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            return {record["model"]: record["forecast"] for record in predictor.forecast({None: data})}
+
+    # The SES model absorbs the test window it never saw; the MLP reads the last window.
+    ses.update(series.iloc[-TEST_SIZE:])
+    expected = {"ses": ses.forecast(1)[0], "mlp": mlp.predict(series.to_numpy()[-LOOKBACK:].reshape(1, -1))[0]}
+    assert forecasts(series) == expected
+    assert forecasts(series) == expected
+
+    # Only bars that arrive between calls are absorbed.
+    later = pd.concat([series, pd.Series([120.0, 121.5], index=pd.date_range(series.index[-1], periods=3)[1:])])
+    ses.update(later.iloc[-2:])
+    assert forecasts(later) == {
+        "ses": ses.forecast(1)[0],
+        "mlp": mlp.predict(later.to_numpy()[-LOOKBACK:].reshape(1, -1))[0],
+    }
+
+
+def test_predictor_warns_when_the_training_data_changed(stored) -> None:
+    config, _, store = stored
+    series = load_panel_series(config)[None].copy()
+    series.iloc[5] += 1.0
+    with pytest.warns(RuntimeWarning, match="differs from what"):
+        Predictor(store, names=["ses"]).forecast({None: series})
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eth_price_predictor import RunConfig, models, run_experiments
+from eth_price_predictor.config import HorizonConfig, ModelConfig
+from eth_price_predictor.metrics import compute_regression_metrics
+from eth_price_predictor.models import register_model
+from eth_price_predictor.models.base import SklearnRegressorWrapper
+from eth_price_predictor.multi_horizon import run_direct
+from eth_price_predictor.runner import load_target_series
+
+linear_model = pytest.importorskip("sklearn.linear_model")
+
+METRICS = ["mae", "rmse", "mape", "r2", "directional_accuracy"]
+HORIZONS = [
+    HorizonConfig(steps_ahead=1, lookback=12, test_size=25),
+    HorizonConfig(steps_ahead=3, lookback=8, test_size=20),
+    HorizonConfig(steps_ahead=7, lookback=12, test_size=30),
+]
+
+
+@pytest.fixture(autouse=True)
+def ols(monkeypatch) -> ModelConfig:
+    # Least squares fits every output column independently, so a multi-output fit must
+    # reproduce single-output fits exactly.
+    monkeypatch.setattr(models, "_REGISTRY", dict(models._REGISTRY))
+    register_model("ols", "features", lambda params: SklearnRegressorWrapper(linear_model.LinearRegression(**params)))
+    return ModelConfig.from_mapping({"name": "ols", "type": "ols"})
+
+
+@pytest.fixture
+def series() -> pd.Series:
+    rng = np.random.default_rng(4)
+    values = 100 * np.exp(np.cumsum(rng.normal(0.001, 0.02, 220)))
+    return pd.Series(values, index=pd.date_range("2022-01-01", periods=len(values), freq="D"), name="Close")
+
+
+def test_each_horizon_matches_a_single_output_fit_on_the_shared_windows(ols: ModelConfig, series: pd.Series) -> None:
+    records, predictions, _ = run_direct(ols, HORIZONS, series)
+
+    values, lookback = series.to_numpy(), 12
+    # Training origins stop before the earliest test target of the widest test window,
+    # minus the longest horizon.
+    origins = np.arange(lookback - 1, len(values) - 30 - 1 - 7 + 1)
+    windows = np.stack([values[origin - lookback + 1 : origin + 1] for origin in origins])
+    for record, horizon in zip(records, HORIZONS):
+        single = linear_model.LinearRegression().fit(windows, values[origins + horizon.steps_ahead])
+        test_origins = np.arange(len(values) - horizon.test_size, len(values)) - horizon.steps_ahead
+        expected = single.predict(np.stack([values[origin - lookback + 1 : origin + 1] for origin in test_origins]))
+        np.testing.assert_allclose(predictions[f"{horizon.steps_ahead}d"], expected, rtol=1e-9)
+        metrics = compute_regression_metrics(values[-horizon.test_size :], expected, reference=values[test_origins])
+        assert {name: record[name] for name in METRICS} == pytest.approx(
+            {name: metrics[name] for name in METRICS}, rel=1e-9
+        )
+        assert record["horizon"] == f"{horizon.steps_ahead}d" and record["multi_horizon"]
+
+
+@pytest.mark.parametrize("horizon", HORIZONS, ids=lambda horizon: f"{horizon.steps_ahead}d")
+def test_a_single_horizon_matches_the_per_horizon_pipeline(
+    tmp_path, ols: ModelConfig, series: pd.Series, horizon: HorizonConfig
+) -> None:
+    csv_path = tmp_path / "prices.csv"
+    series.rename_axis("Date").reset_index().to_csv(csv_path, index=False)
+    config = RunConfig.from_mapping(
+        {
+            "data_path": str(csv_path),
+            "output_dir": str(tmp_path / "out"),
+            "cache": {"enabled": False},
+            "ledger": {"enabled": False},
+            "horizons": [
+                {"steps_ahead": horizon.steps_ahead, "lookback": horizon.lookback, "test_size": horizon.test_size}
+            ],
+            "models": [{"name": "ols", "type": "ols"}],
+        }
+    )
+    separate = run_experiments(config).iloc[0]
+    (record,), _, _ = run_direct(ols, [horizon], load_target_series(config))
+    assert {name: record[name] for name in METRICS} == pytest.approx(separate[METRICS].to_dict(), rel=1e-9)
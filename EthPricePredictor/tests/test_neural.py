@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("tensorflow")
+
+from eth_price_predictor.models import neural  # noqa: E402
+from eth_price_predictor.models.neural import LSTMForecaster, LSTMInference  # noqa: E402
+
+
+@pytest.mark.parametrize("channels", [1, 3])
+def test_numpy_inference_matches_keras_predict(channels: int) -> None:
+    lookback = 12
+    keras_model = LSTMForecaster({"units": 8})._build_model(lookback, outputs=2, channels=channels)
+    X = np.random.default_rng(0).normal(size=(50, lookback * channels)).astype(np.float32)
+
+    expected = keras_model.predict(X.reshape(len(X), lookback, channels), verbose=0)
+    np.testing.assert_allclose(LSTMInference.from_keras(keras_model)(X), expected, rtol=1e-5, atol=1e-6)
+
+
+def test_fitted_forecaster_predicts_like_its_keras_model() -> None:
+    series = np.sin(np.arange(200) / 8).astype(np.float32)
+    X = np.lib.stride_tricks.sliding_window_view(series[:-1], 10)
+    y = series[10:]
+    model = LSTMForecaster({"units": 4, "epochs": 2}).fit(X, y, overlapping=True)
+
+    keras_model = next(reversed(neural._GRAPHS.models.values()))[0]
+    expected = keras_model.predict(X.reshape(len(X), 10, 1), verbose=0).ravel()
+    np.testing.assert_allclose(model.predict(X), expected, rtol=1e-5, atol=1e-6)
+
+
+def test_overlapping_dataset_yields_the_same_batches() -> None:
+    series = np.arange(60, dtype=np.float32)
+    X = np.lib.stride_tricks.sliding_window_view(series[:-1], 7).copy()
+    y = series[7:]
+    model = LSTMForecaster({"batch_size": 16})
+
+    shared = list(model._dataset(X, y, overlapping=True).as_numpy_iterator())
+    copied = list(model._dataset(X, y, overlapping=False).as_numpy_iterator())
+    assert len(shared) == len(copied)
+    for (shared_x, shared_y), (copied_x, copied_y) in zip(shared, copied):
+        np.testing.assert_array_equal(shared_x, copied_x)
+        np.testing.assert_array_equal(shared_y, copied_y)
+
+
+def test_compiled_graph_cache_is_bounded() -> None:
+    X = np.random.default_rng(1).normal(size=(20, 5)).astype(np.float32)
+    y = X.sum(axis=1)
+    for step in range(neural._GRAPH_CACHE_SIZE + 2):
+        LSTMForecaster({"units": 2, "epochs": 1, "learning_rate": 1e-3 * (step + 1)}).fit(X, y)
+    assert len(neural._GRAPHS.models) == neural._GRAPH_CACHE_SIZE
+    assert next(reversed(neural._GRAPHS.models))[-1] == pytest.approx(1e-3 * (neural._GRAPH_CACHE_SIZE + 2))
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eth_price_predictor import RunConfig, run_experiments
+from eth_price_predictor.profiling import StageRecorder, load_trace, stage, summarize_trace, write_trace
+
+
+def _config(tmp_path, **profiling) -> RunConfig:
+    csv_path = tmp_path / "prices.csv"
+    prices = 100 + np.cumsum(np.random.default_rng(2).normal(0, 1, 120))
+    dates = pd.date_range("2021-01-01", periods=len(prices), freq="D")
+    pd.DataFrame({"Date": dates, "Close": prices}).to_csv(csv_path, index=False)
+    return RunConfig.from_mapping(
+        {
+            "data_path": str(csv_path),
+            "output_dir": str(tmp_path / "out"),
+            "cache": {"enabled": False},
+            "ledger": {"enabled": False},
+            "horizons": [
+                {"steps_ahead": 1, "lookback": 10, "test_size": 20},
+                {"steps_ahead": 3, "lookback": 10, "test_size": 20},
+            ],
+            "models": [{"name": "ses", "type": "ses"}, {"name": "holt", "type": "holt"}],
+            "execution": {"backend": "thread", "workers": 2},
+            "profiling": {"enabled": True, **profiling},
+        }
+    )
+
+
+def test_stages_outside_an_active_recorder_are_not_recorded() -> None:
+    recorder = StageRecorder(memory=None)
+    with stage("fit"):
+        pass
+    with recorder.activate("task"):
+        with stage("fit"):
+            pass
+    with stage("predict"):
+        pass
+    assert [(event.stage, event.label) for event in recorder.events] == [("fit", "task")]
+
+
+def test_tracemalloc_peaks_fold_into_the_enclosing_stage() -> None:
+    recorder = StageRecorder(memory="tracemalloc")
+    with recorder.activate("task"):
+        with stage("backtest"):
+            with stage("fit"):
+                block = np.ones(2_000_000)
+                del block
+            with stage("predict"):
+                pass
+    inner, small, outer = recorder.events
+    assert [inner.stage, small.stage, outer.stage] == ["fit", "predict", "backtest"]
+    assert inner.peak_mem_bytes >= 16_000_000 > small.peak_mem_bytes
+    assert outer.peak_mem_bytes >= inner.peak_mem_bytes
+    assert outer.wall_sec >= inner.wall_sec + small.wall_sec
+
+
+def test_trace_round_trips_through_the_chrome_format(tmp_path) -> None:
+    recorder = StageRecorder(memory="rss")
+    with recorder.activate("ses-1d"):
+        for name in ("metrics", "fit", "fit", "load"):
+            with stage(name):
+                pass
+    path = write_trace(recorder.events, tmp_path / "nested" / "trace.json")
+
+    payload = json.loads(path.read_text())
+    first = payload["traceEvents"][0]
+    assert first["ph"] == "X" and first["name"] == "metrics" and first["cat"] == "ses-1d"
+    assert first["ts"] == pytest.approx(recorder.events[0].start * 1e6)
+    assert first["dur"] == pytest.approx(recorder.events[0].wall_sec * 1e6)
+    assert load_trace(path) == recorder.events
+
+    summary = summarize_trace(load_trace(path))
+    # Rows follow pipeline order rather than the order stages were recorded.
+    assert summary.index.tolist() == ["load", "fit", "metrics"]
+    assert summary["calls"].tolist() == [1, 2, 1]
+    assert summarize_trace([]).empty
+
+
+def test_thread_backend_records_time_but_not_memory(tmp_path) -> None:
+    config = _config(tmp_path, memory="tracemalloc")
+    with pytest.warns(RuntimeWarning, match="process-wide"):
+        run_experiments(config)
+    events = load_trace(config.output_dir / "trace.json")
+    tasks = [event for event in events if event.label != "pipeline"]
+    assert {event.label for event in tasks} == {"ses-1d+3d", "holt-1d+3d"}
+    assert all(event.peak_mem_bytes is None for event in tasks)
+    # The data is loaded before tasks start, so its stage still has a peak of its own.
+    assert all(event.peak_mem_bytes is not None for event in events if event.label == "pipeline")
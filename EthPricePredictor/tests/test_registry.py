@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from importlib import metadata
+from pathlib import Path
+
+import pytest
+
+from eth_price_predictor import models
+from eth_price_predictor.config import ModelConfig
+from eth_price_predictor.models import ModelSpec, available_models, build_model, model_mode, register_model
+from eth_price_predictor.models.classical import SESForecaster
+
+SRC = str(Path(__file__).resolve().parents[1] / "src")
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    # Registrations and discovered plugins must not leak into other tests.
+    monkeypatch.setattr(models, "_REGISTRY", dict(models._REGISTRY))
+    models._plugin_entry_points.cache_clear()
+    yield
+    models._plugin_entry_points.cache_clear()
+
+
+class Naive:
+    mode = "series"
+
+    def __init__(self, params):
+        self.params = params
+
+
+def test_importing_the_registry_loads_no_model_backend() -> None:
+    # A fresh interpreter, since this one has imported the backends for other tests.
+    code = (
+        "import sys, eth_price_predictor.models as m; m.available_models(); "
+        "print(sorted(name for name in ('sklearn', 'statsmodels', 'tensorflow') if name in sys.modules))"
+    )
+    env = {**os.environ, "PYTHONPATH": SRC}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+    assert result.stdout.strip() == "[]"
+
+
+def test_register_model_adds_and_replaces_types() -> None:
+    register_model("Naive", "series", Naive)
+    handle = build_model(ModelConfig.from_mapping({"name": "n", "type": "naive", "params": {"window": 3}}))
+    assert isinstance(handle.model, Naive) and handle.model.params == {"window": 3} and handle.mode == "series"
+
+    register_model("naive", "features", "eth_price_predictor.models.base:SklearnRegressorWrapper")
+    assert model_mode(ModelConfig.from_mapping({"name": "n", "type": "naive"})) == "features"
+    with pytest.raises(ValueError, match="mode"):
+        register_model("naive", "panel", Naive)
+
+
+def test_entry_points_are_listed_without_loading_and_built_on_demand(monkeypatch, tmp_path) -> None:
+    (tmp_path / "registry_plugin.py").write_text(
+        "from eth_price_predictor.models import ModelSpec\n"
+        "LOADED = []\n"
+        "def drift(params):\n"
+        "    LOADED.append(params)\n"
+        "    return params\n"
+        "SPEC = ModelSpec('series', drift)\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    plugins = [
+        metadata.EntryPoint(name="Drift", value="registry_plugin:SPEC", group=models.ENTRY_POINT_GROUP),
+        metadata.EntryPoint(name="ses", value="registry_plugin:missing", group=models.ENTRY_POINT_GROUP),
+    ]
+    monkeypatch.setattr(models.metadata, "entry_points", lambda group: plugins)
+
+    assert "drift" in available_models() and "registry_plugin" not in sys.modules
+    handle = build_model(ModelConfig.from_mapping({"name": "d", "type": "drift", "params": {"k": 1}}))
+    assert handle.mode == "series" and handle.model == {"k": 1}
+    assert isinstance(models._REGISTRY["drift"], ModelSpec)
+    # Built-in names win over a plugin of the same name, which is never loaded.
+    assert isinstance(build_model(ModelConfig.from_mapping({"name": "s", "type": "ses"})).model, SESForecaster)
+    with pytest.raises(ValueError, match="Unsupported model type"):
+        build_model(ModelConfig.from_mapping({"name": "x", "type": "prophet"}))
+    assert sys.modules["registry_plugin"].LOADED == [{"k": 1}]
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from eth_price_predictor import RunConfig
+from eth_price_predictor.search import run_search
+
+LEVELS = [0.02, 0.1, 0.3, 0.6, 0.9, 1.0]
+
+
+def _config(tmp_path, strategy: str) -> RunConfig:
+    csv_path = tmp_path / "prices.csv"
+    prices = 100 + np.cumsum(np.random.default_rng(4).normal(0, 1, 400))
+    pd.DataFrame({"Date": pd.date_range("2021-01-01", periods=len(prices), freq="D"), "Close": prices}).to_csv(
+        csv_path, index=False
+    )
+    return RunConfig.from_mapping(
+        {
+            "data_path": str(csv_path),
+            "output_dir": str(tmp_path / strategy),
+            "cache": {"enabled": False},
+            "ledger": {"enabled": False},
+            "horizons": [{"steps_ahead": 1, "lookback": 10, "test_size": 30}],
+            "models": [{"name": "ses", "type": "ses"}],
+            "search": {
+                "model": "ses",
+                "strategy": strategy,
+                "space": {"smoothing_level": LEVELS},
+                "metric": "mae",
+                "min_budget": 1,
+                "max_budget": 9,
+                "eta": 3,
+                "n_candidates": len(LEVELS),
+                "validation_size": 30,
+            },
+        }
+    )
+
+
+def test_halving_keeps_the_best_grid_candidate_with_fewer_full_fits(tmp_path) -> None:
+    grid = run_search(_config(tmp_path, "grid"))
+    halving = run_search(_config(tmp_path, "halving"))
+
+    full_grid = grid[grid["budget"] == 9]
+    full_halving = halving[halving["budget"] == 9]
+    assert len(full_grid) == len(LEVELS)
+    assert 0 < len(full_halving) < len(full_grid)
+    best = full_grid.sort_values("mae").iloc[0]
+    assert best["params"] in set(full_halving["params"])
+    assert full_halving["mae"].min() == best["mae"]
+
+
+def test_lower_rungs_fit_less_data(tmp_path) -> None:
+    halving = run_search(_config(tmp_path, "halving"))
+    # Same candidate, growing training share: the scores differ because the fits do.
+    first = halving[halving["param_smoothing_level"] == halving.iloc[0]["param_smoothing_level"]]
+    assert first["budget"].nunique() > 1
+    assert first["mae"].nunique() == first["budget"].nunique()
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import os
+import pickle
+import subprocess
+import sys
+import textwrap
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eth_price_predictor.shared import SharedPanel
+
+SRC = str(Path(__file__).resolve().parents[1] / "src")
+
+
+def _panel() -> dict:
+    index = pd.date_range("2022-01-01", periods=50, freq="D", name="Date")
+    values = np.arange(50, dtype=float)
+    return {
+        "BTC": pd.Series(values, index=index, name="Close"),
+        "ETH": pd.DataFrame({"a": values, "b": 2 * values}, index=index),
+    }
+
+
+def _block_names(panel: SharedPanel) -> list:
+    return [array.name for handle in panel._handles.values() for array in (handle.values, handle.index)]
+
+
+def _assert_unlinked(names: list) -> None:
+    for name in names:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+
+def _run(script: str, cwd: Path) -> subprocess.CompletedProcess:
+    path = cwd / "script.py"
+    path.write_text(textwrap.dedent(script))
+    env = {**os.environ, "PYTHONPATH": SRC}
+    return subprocess.run([sys.executable, str(path)], cwd=cwd, capture_output=True, text=True, timeout=120, env=env)
+
+
+def test_spawned_workers_attach_and_the_creator_unlinks(tmp_path) -> None:
+    # Run in a child interpreter so the resource tracker's own warnings land in a captured stderr.
+    result = _run(
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import get_context, shared_memory
+
+        import numpy as np
+        import pandas as pd
+
+        from eth_price_predictor.shared import SharedPanel
+
+
+        def total(panel, key):
+            return float(np.asarray(panel[key]).sum())
+
+
+        if __name__ == "__main__":
+            index = pd.date_range("2022-01-01", periods=50, freq="D")
+            panel = {"BTC": pd.Series(np.arange(50.0), index=index), "ETH": pd.Series(np.ones(50), index=index)}
+            with SharedPanel.create(panel) as shared:
+                names = [a.name for h in shared._handles.values() for a in (h.values, h.index)]
+                with ProcessPoolExecutor(2, mp_context=get_context("spawn")) as pool:
+                    totals = list(pool.map(total, [shared] * 4, ["BTC", "ETH", "BTC", "ETH"]))
+            assert totals == [1225.0, 50.0, 1225.0, 50.0], totals
+            for name in names:
+                try:
+                    shared_memory.SharedMemory(name=name)
+                except FileNotFoundError:
+                    continue
+                raise AssertionError(f"{name} was left behind")
+            print("ok")
+        """,
+        tmp_path,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "ok"
+    assert "leaked" not in result.stderr and "Traceback" not in result.stderr
+
+
+def test_unrelated_process_attach_does_not_unlink_the_block(tmp_path) -> None:
+    panel = _panel()
+    with SharedPanel.create(panel) as shared:
+        names = _block_names(shared)
+        (tmp_path / "panel.pkl").write_bytes(pickle.dumps(shared))
+        # A process that was not started by the creator has no resource tracker of its own yet.
+        result = _run(
+            """
+            import pickle
+
+            with open("panel.pkl", "rb") as handle:
+                panel = pickle.load(handle)
+            print(float(panel["BTC"].sum()), float(panel["ETH"]["b"].sum()))
+            panel.close()
+            """,
+            tmp_path,
+        )
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split() == ["1225.0", "2450.0"]
+        assert "leaked" not in result.stderr
+
+        for name in names:
+            shared_memory.SharedMemory(name=name).close()
+        pd.testing.assert_series_equal(shared["BTC"], panel["BTC"], check_freq=False)
+        pd.testing.assert_frame_equal(shared["ETH"], panel["ETH"], check_freq=False)
+    _assert_unlinked(names)
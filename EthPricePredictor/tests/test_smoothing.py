@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+import pytest
+
+from eth_price_predictor.models.smoothing import fit_exponential_smoothing
+
+holtwinters = pytest.importorskip("statsmodels.tsa.holtwinters")
+
+
+def _price_path(seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 100 * np.exp(np.cumsum(rng.normal(0.001, 0.02, 300)))
+
+
+def _trending(seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 50 + np.cumsum(np.cumsum(rng.normal(0, 0.05, 200))) + rng.normal(0, 2, 200)
+
+
+def _statsmodels(y: np.ndarray, trend: bool):
+    model = holtwinters.Holt if trend else holtwinters.SimpleExpSmoothing
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return model(y, initialization_method="estimated").fit()
+
+
+@pytest.mark.parametrize("trend", [False, True])
+@pytest.mark.parametrize(
+    "y",
+    [_price_path(seed) for seed in range(4)] + [_trending(seed) for seed in (0, 3, 5)],
+)
+def test_matches_statsmodels(y: np.ndarray, trend: bool) -> None:
+    reference = _statsmodels(y, trend)
+    fit = fit_exponential_smoothing(y, trend=trend)
+
+    assert fit.sse[0] == pytest.approx(reference.sse, rel=1e-6)
+    assert fit.alpha[0] == pytest.approx(reference.params["smoothing_level"], abs=1e-3)
+    if trend:
+        assert fit.beta[0] == pytest.approx(reference.params["smoothing_trend"], abs=1e-3)
+    np.testing.assert_allclose(fit.forecast(10)[0], reference.forecast(10), rtol=1e-4)
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_holt_sse_is_never_materially_worse_than_statsmodels(seed: int) -> None:
+    # On some series statsmodels stops at a worse optimum, so only an upper bound is shared.
+    y = _trending(seed)
+    assert fit_exponential_smoothing(y, trend=True).sse[0] <= _statsmodels(y, True).sse * (1 + 1e-6)
+
+
+def test_batch_matches_one_series_at_a_time() -> None:
+    batch = np.stack([_price_path(seed) for seed in range(4)])
+    fit = fit_exponential_smoothing(batch, trend=True)
+    for row, y in enumerate(batch):
+        single = fit_exponential_smoothing(y, trend=True)
+        assert fit.sse[row] == pytest.approx(single.sse[0], rel=1e-12)
+        np.testing.assert_allclose(fit.forecast(5)[row], single.forecast(5)[0], rtol=1e-12)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eth_price_predictor import RunConfig
+from eth_price_predictor.models.classical import ARIMAForecaster
+from eth_price_predictor.streaming import RingBuffer, StreamingForecaster, _StateSpaceStepper
+
+
+def _series(seed: int, length: int = 320) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    values = 100 + 0.05 * np.arange(length) + np.cumsum(rng.normal(0, 1, length))
+    return pd.Series(values, index=pd.date_range("2020-01-01", periods=length, freq="D"))
+
+
+def _fit(params: dict, series: pd.Series) -> ARIMAForecaster:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return ARIMAForecaster(params).fit_series(series)
+
+
+@pytest.mark.parametrize("order", [(1, 1, 1), (2, 1, 2), (2, 1, 0)])
+def test_stepper_matches_extend(order) -> None:
+    series = _series(3)
+    history, fresh = series.iloc[:300], series.iloc[300:]
+    model = _fit({"order": order}, history)
+    assert _StateSpaceStepper.supports(model.fitted_)
+
+    stepper = _StateSpaceStepper(model.fitted_, max_steps=5)
+    for value in fresh:
+        stepper.update(float(value))
+    expected = np.asarray(model.fitted_.extend(fresh.to_numpy()).forecast(5))
+    np.testing.assert_allclose(stepper.forecast(5), expected, rtol=1e-8, atol=1e-6)
+
+
+@pytest.mark.parametrize("order, trend", [((1, 1, 1), "t"), ((1, 0, 1), "ct"), ((1, 0, 1), "c")])
+def test_trend_models_are_not_stepped(order, trend) -> None:
+    model = _fit({"order": order, "trend": trend}, _series(4).iloc[:300])
+    assert not _StateSpaceStepper.supports(model.fitted_)
+
+
+def test_ring_buffer_keeps_latest_window_contiguous() -> None:
+    buffer = RingBuffer(4)
+    buffer.extend(range(10))
+    window = buffer.latest(4)
+    np.testing.assert_array_equal(window, [6, 7, 8, 9])
+    assert window.flags.c_contiguous
+    with pytest.raises(ValueError):
+        RingBuffer(2).latest(1)
+
+
+def _streaming_config(params: dict, **extra) -> RunConfig:
+    return RunConfig.from_mapping(
+        {
+            "horizons": [
+                {"steps_ahead": 1, "lookback": 10, "test_size": 20},
+                {"steps_ahead": 3, "lookback": 10, "test_size": 20},
+            ],
+            "models": [{"name": "arima", "type": "arima", "params": params}],
+            **extra,
+        }
+    )
+
+
+def _stream(forecaster: StreamingForecaster, fresh: pd.Series) -> list:
+    with warnings.catch_warnings():
+        # statsmodels warns about the appended index on the fallback path.
+        warnings.simplefilter("ignore")
+        return [forecaster.step(float(value), timestamp) for timestamp, value in fresh.items()]
+
+
+def test_trend_fallback_is_exact_but_slower_and_announced() -> None:
+    series = _series(5)
+    history, fresh = series.iloc[:300], series.iloc[300:]
+    with pytest.warns(RuntimeWarning, match="trend"):
+        fallback = StreamingForecaster(_streaming_config({"order": [1, 1, 1], "trend": "t"}), history)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        stepped = StreamingForecaster(_streaming_config({"order": [1, 1, 1]}), history)
+
+    records = _stream(fallback, fresh)
+    _stream(stepped, fresh)
+    expected = _fit({"order": (1, 1, 1), "trend": "t"}, history).fitted_.apply(series).forecast(3)
+    assert [record["forecast"] for record in records[-1]] == pytest.approx(np.asarray(expected)[[0, 2]], rel=1e-8)
+
+    slow, fast = fallback.latency.summary(), stepped.latency.summary()
+    assert slow["ticks"] == fast["ticks"] == len(fresh)
+    # The Kalman step is orders of magnitude cheaper than rebuilding the statsmodels results.
+    assert fast["mean_us"] * 5 < slow["mean_us"]
+
+
+@pytest.mark.parametrize(
+    "extra, message",
+    [
+        ({"features": [{"kind": "returns", "window": 1}]}, "features"),
+        ({"panel": {"assets": {"BTC": "btc.csv", "ETH": "eth.csv"}}}, "panel"),
+    ],
+)
+def test_configs_that_cannot_stream_are_rejected(extra: dict, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        StreamingForecaster(_streaming_config({"order": [1, 1, 1]}, **extra), _series(6))